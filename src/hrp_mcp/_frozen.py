@@ -0,0 +1,40 @@
+"""Read-only storage for cached tool results handed out as copies.
+
+freeze() stores a value with every mapping wrapped in a MappingProxyType
+and every list turned into a tuple, so no caller can change what the next
+caller receives. thaw() hands each caller its own plain dicts and lists:
+the MCP layer serializes those, but cannot serialize a MappingProxyType.
+thaw() deep-copies, so it suits results that are cheap next to the work
+the cache saves, such as regulation searches; responses built once from
+static reference data are handed out as shallow copies instead.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, overload
+
+
+@overload
+def freeze(value: Mapping[str, Any]) -> Mapping[str, Any]: ...
+@overload
+def freeze(value: list[Any] | tuple[Any, ...]) -> tuple[Any, ...]: ...
+def freeze(value: Any) -> Any:
+    """Return a deeply read-only copy of a response value; scalars pass through."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+@overload
+def thaw(value: Mapping[str, Any]) -> dict[str, Any]: ...
+@overload
+def thaw(value: tuple[Any, ...]) -> list[Any]: ...
+def thaw(value: Any) -> Any:
+    """Return a fresh, serializable copy of a value from freeze()."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
@@ -0,0 +1,74 @@
+"""Keyword scanning shared by the certification and medical tools.
+
+Both tools map a free-text description onto reference data by keyword.
+A KeywordMatcher compiles its whole vocabulary into one regular
+expression, so a description is scanned once however many keywords
+there are. The pattern is compiled on the first scan, so importing a tool
+module does not pay for it.
+"""
+
+import re
+from collections.abc import Iterable
+
+
+def normalize_description(text: str) -> str:
+    """Lower-case text and collapse whitespace runs to single spaces.
+
+    Multi-word keywords then match across line breaks or doubled spaces, and
+    spelling variants of one description share an evaluation cache entry.
+    """
+    return " ".join(text.lower().split())
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile keywords into one pattern that reports every occurrence.
+
+    The lookahead lets matches overlap, and longer keywords are tried first,
+    so each position yields the longest keyword starting there. Shorter
+    keywords starting at the same position are its prefixes and are added
+    back through the keyword closure.
+    """
+    alternation = "|".join(map(re.escape, sorted(set(keywords), key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))")
+
+
+class KeywordMatcher:
+    """Finds every keyword of a fixed vocabulary occurring in a text."""
+
+    __slots__ = ("_closure", "_pattern", "keywords")
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Validate the vocabulary; compilation is deferred to the first scan.
+
+        Args:
+            keywords: Keywords already in normalize_description form;
+                      duplicates are ignored.
+
+        Raises:
+            ValueError: If a keyword is empty or not normalized, since it
+                        could never match a normalized text.
+        """
+        self.keywords = frozenset(keywords)
+        for keyword in self.keywords:
+            if not keyword or keyword != normalize_description(keyword):
+                raise ValueError(f"Keyword must be non-empty and normalized: {keyword!r}")
+        self._pattern: re.Pattern[str] | None = None
+        # keyword -> every keyword it contains, itself included
+        self._closure: dict[str, frozenset[str]] = {}
+
+    def _compile(self) -> re.Pattern[str]:
+        """Build the pattern and keyword closure once."""
+        self._closure = {kw: frozenset(k for k in self.keywords if k in kw) for kw in self.keywords}
+        self._pattern = _keyword_pattern(self.keywords)
+        return self._pattern
+
+    def scan(self, text: str) -> frozenset[str]:
+        """Return every keyword occurring in text, in one scan."""
+        if not self.keywords:
+            return frozenset()
+        pattern = self._pattern or self._compile()
+        hits: set[str] = set()
+        for match in pattern.finditer(text):
+            hits |= self._closure[match.group(1)]
+        return frozenset(hits)
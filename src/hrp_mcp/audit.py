@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 # Type variable for decorated functions
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Parameter-name fragments whose values are redacted from the audit log
+_SENSITIVE_KEYS = frozenset({"password", "token", "key", "secret", "credential", "ssn", "dob"})
+
 
 def _sanitize_params(params: dict[str, Any]) -> dict[str, Any]:
     """
@@ -28,11 +31,9 @@ def _sanitize_params(params: dict[str, Any]) -> dict[str, Any]:
     Removes or masks potentially sensitive information.
     """
     sanitized = {}
-    sensitive_keys = {"password", "token", "key", "secret", "credential", "ssn", "dob"}
-
     for key, value in params.items():
         key_lower = key.lower()
-        if any(sensitive in key_lower for sensitive in sensitive_keys):
+        if any(map(key_lower.__contains__, _SENSITIVE_KEYS)):
             sanitized[key] = "[REDACTED]"
         elif isinstance(value, str) and len(value) > 1000:
             sanitized[key] = value[:1000] + "...[truncated]"
@@ -61,17 +62,25 @@ def _summarize_result(result: Any) -> str:
     return str(type(result).__name__)
 
 
+def _append_line(log_path: Path, line: str) -> None:
+    """Append one line to the audit log file."""
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
 def _write_audit_log(entry: dict[str, Any]) -> None:
     """Write an entry to the audit log file."""
     log_path = Path(settings.audit_log_path)
+    line = json.dumps(entry, default=str) + "\n"
 
     try:
-        # Ensure directory exists
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Append to JSONL file
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+        try:
+            _append_line(log_path, line)
+        except FileNotFoundError:
+            # Create the directory only when it is missing, not on every call
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            _append_line(log_path, line)
 
     except Exception as e:
         # Log error but don't crash the tool
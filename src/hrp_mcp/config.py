@@ -27,10 +27,20 @@ class Settings(BaseSettings):
     # Embedding Model Configuration
     # Options: all-MiniLM-L6-v2 (fast, 384d), BAAI/bge-small-en-v1.5 (better quality)
     embedding_model: str = "all-MiniLM-L6-v2"
+    # Torch device for embeddings (cpu, cuda, mps); unset auto-selects a GPU if present
+    embedding_device: str | None = None
 
     # Storage Paths
     chroma_persist_dir: str = "./data/chroma"
 
+    # Vector Search Configuration
+    # Serve searches from an in-memory copy of the store loaded at startup
+    vector_index_in_memory: bool = False
+    # Hold the in-memory copy as int8 codes: a quarter of the memory, approximate scores
+    vector_index_int8: bool = False
+    # Load the model, query the store and cache sections at startup so the first request is warm
+    warm_up: bool = False
+
     # Logging Configuration
     log_level: str = "INFO"
     audit_log_path: str = "./logs/audit.jsonl"
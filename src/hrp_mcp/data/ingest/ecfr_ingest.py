@@ -40,6 +40,9 @@ CFR_PARTS = {
     },
 }
 
+# eCFR XML elements that hold a single section
+_SECTION_TAGS = frozenset({"SECTION", "DIV8", "DIV9"})
+
 
 class CFRPartIngestor(BaseIngestor):
     """Ingestor for 10 CFR Parts 707, 710, 712 from eCFR using structure API."""
@@ -187,16 +190,18 @@ class CFRPartIngestor(BaseIngestor):
                 return result
 
             # Chunk and embed
-            all_chunks: list[RegulationChunk] = []
-            for section_num, (title, content) in sections.items():
-                metadata = ChunkMetadata(
-                    section=section_num,
-                    title=title,
-                    citation=f"10 CFR {section_num}",
-                    source=self.source_type,
+            all_chunks: list[RegulationChunk] = self._chunker.chunk_many(
+                (
+                    content,
+                    ChunkMetadata(
+                        section=section_num,
+                        title=title,
+                        citation=f"10 CFR {section_num}",
+                        source=self.source_type,
+                    ),
                 )
-                chunks = self._chunker.chunk_text(content, metadata)
-                all_chunks.extend(chunks)
+                for section_num, (title, content) in sections.items()
+            )
 
             result.chunks_created = len(all_chunks)
 
@@ -318,7 +323,7 @@ class CFRPartIngestor(BaseIngestor):
         # Try finding SECTION elements
         for elem in root.iter():
             tag = self._get_tag_name(elem)
-            if tag == "SECTION" or tag in ("DIV8", "DIV9"):
+            if tag in _SECTION_TAGS:
                 sections.append(elem)
 
         return sections
@@ -432,9 +437,9 @@ class CFRPartIngestor(BaseIngestor):
 
             # Generate embeddings
             texts = [chunk.to_embedding_text() for chunk in batch]
-            embeddings = embedding_service.embed_batch(texts)
+            embeddings = embedding_service.embed_batch_np(texts)
 
-            # Store in vector store
+            # Store in vector store; the float32 array is handed to Chroma as-is
             vector_store.add_chunks_batch(batch, embeddings)
 
             logger.debug(f"Stored batch of {len(batch)} chunks")
@@ -34,6 +34,8 @@ HANDBOOK_SECTIONS = {
     "glossary": "Glossary",
 }
 
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4"})
+
 
 class HandbookIngestor(BaseIngestor):
     """Ingestor for DOE HRP Handbook from website or local PDF."""
@@ -91,16 +93,18 @@ class HandbookIngestor(BaseIngestor):
                 return result
 
             # Chunk and embed
-            all_chunks: list[RegulationChunk] = []
-            for section_id, (title, section_content) in sections.items():
-                metadata = ChunkMetadata(
-                    section=section_id,
-                    title=title,
-                    citation=f"DOE HRP Handbook - {title}",
-                    source=SourceType.HRP_HANDBOOK,
+            all_chunks: list[RegulationChunk] = self._chunker.chunk_many(
+                (
+                    section_content,
+                    ChunkMetadata(
+                        section=section_id,
+                        title=title,
+                        citation=f"DOE HRP Handbook - {title}",
+                        source=SourceType.HRP_HANDBOOK,
+                    ),
                 )
-                chunks = self._chunker.chunk_text(section_content, metadata)
-                all_chunks.extend(chunks)
+                for section_id, (title, section_content) in sections.items()
+            )
 
             result.chunks_created = len(all_chunks)
 
@@ -192,7 +196,7 @@ class HandbookIngestor(BaseIngestor):
     def _format_element(self, element: BeautifulSoup) -> str | None:
         """Format an HTML element as markdown text."""
         tag = element.name
-        if tag in ("h1", "h2", "h3", "h4"):
+        if tag in _HEADING_TAGS:
             return self._format_heading(element)
         if tag == "p":
             return self._format_paragraph(element)
@@ -295,9 +299,9 @@ class HandbookIngestor(BaseIngestor):
 
             # Generate embeddings
             texts = [chunk.to_embedding_text() for chunk in batch]
-            embeddings = embedding_service.embed_batch(texts)
+            embeddings = embedding_service.embed_batch_np(texts)
 
-            # Store in vector store
+            # Store in vector store; the float32 array is handed to Chroma as-is
             vector_store.add_chunks_batch(batch, embeddings)
 
             logger.debug(f"Stored batch of {len(batch)} chunks")
@@ -15,6 +15,7 @@ from hrp_mcp.models.hrp import (
     CertificationComponent,
     CertificationRequirement,
     CertificationStatus,
+    ControlledSubstance,
     DisqualifyingCategory,
     DisqualifyingFactor,
     HRPPositionType,
@@ -42,6 +43,7 @@ __all__ = [
     "CertificationComponent",
     "CertificationRequirement",
     "CertificationStatus",
+    "ControlledSubstance",
     "DataNotFoundError",
     "DisqualifyingCategory",
     "DisqualifyingFactor",
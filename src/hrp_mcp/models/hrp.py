@@ -1,9 +1,9 @@
 """HRP-specific Pydantic models for Human Reliability Program data."""
 
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HRPPositionType(str, Enum):
@@ -63,13 +63,15 @@ class HRPRole(str, Enum):
 class PositionTypeInfo(BaseModel):
     """Information about an HRP position type."""
 
+    model_config = ConfigDict(frozen=True)
+
     position_type: HRPPositionType = Field(..., description="Position type enum")
     title: str = Field(..., description="Position type title")
     description: str = Field(..., description="Description of the position type")
     section: str = Field(..., description="CFR section reference")
     access_type: str = Field(..., description="Type of access this position provides")
-    requirements: list[str] = Field(
-        default_factory=list,
+    requirements: tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Specific requirements for this position type",
     )
 
@@ -81,7 +83,7 @@ class PositionTypeInfo(BaseModel):
             "description": self.description,
             "section": self.section,
             "access_type": self.access_type,
-            "requirements": self.requirements,
+            "requirements": list(self.requirements),
         }
 
 
@@ -108,13 +110,15 @@ class CertificationRequirement(BaseModel):
 class CertificationComponent(BaseModel):
     """One of the four annual certification components."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Component name")
     description: str = Field(..., description="Component description")
     section: str = Field(..., description="CFR section reference")
     frequency: str = Field(..., description="Required frequency")
     responsible_official: str = Field(..., description="Official responsible for component")
-    key_elements: list[str] = Field(
-        default_factory=list,
+    key_elements: tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Key elements of this component",
     )
 
@@ -126,13 +130,15 @@ class CertificationComponent(BaseModel):
             "section": self.section,
             "frequency": self.frequency,
             "responsible_official": self.responsible_official,
-            "key_elements": self.key_elements,
+            "key_elements": list(self.key_elements),
         }
 
 
 class DisqualifyingFactor(BaseModel):
     """A factor that may disqualify an individual from HRP."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Factor name")
     description: str = Field(..., description="Description of the disqualifying condition")
     category: DisqualifyingCategory = Field(..., description="Category of factor")
@@ -161,16 +167,18 @@ class DisqualifyingFactor(BaseModel):
 class MedicalStandard(BaseModel):
     """A medical standard from Subpart B."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Standard name")
     description: str = Field(..., description="Description of the standard")
     section: str = Field(..., description="CFR section reference")
     category: str = Field(default="", description="Category (physical, psychological, etc.)")
-    conditions: list[str] = Field(
-        default_factory=list,
+    conditions: tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Conditions addressed by this standard",
     )
-    evaluation_criteria: list[str] = Field(
-        default_factory=list,
+    evaluation_criteria: tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Criteria for evaluation",
     )
 
@@ -181,8 +189,8 @@ class MedicalStandard(BaseModel):
             "description": self.description,
             "section": self.section,
             "category": self.category,
-            "conditions": self.conditions,
-            "evaluation_criteria": self.evaluation_criteria,
+            "conditions": list(self.conditions),
+            "evaluation_criteria": list(self.evaluation_criteria),
         }
 
 
@@ -213,6 +221,24 @@ class TestingRequirement(BaseModel):
         }
 
 
+class ControlledSubstance(NamedTuple):
+    """Substance on the HRP drug testing panel with its cutoff levels."""
+
+    substance: str
+    category: str
+    initial_cutoff: str
+    confirmatory_cutoff: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for MCP tool response."""
+        return {
+            "substance": self.substance,
+            "category": self.category,
+            "initial_cutoff": self.initial_cutoff,
+            "confirmatory_cutoff": self.confirmatory_cutoff,
+        }
+
+
 class RemovalProcess(BaseModel):
     """Process for temporary or permanent removal from HRP."""
 
@@ -319,15 +345,17 @@ class AppealProcess(BaseModel):
 class HRPRoleInfo(BaseModel):
     """Information about an HRP official role."""
 
+    model_config = ConfigDict(frozen=True)
+
     role: HRPRole = Field(..., description="Role enum")
     title: str = Field(..., description="Official title")
     description: str = Field(..., description="Description of the role")
-    responsibilities: list[str] = Field(
-        default_factory=list,
+    responsibilities: tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Key responsibilities",
     )
-    qualifications: list[str] = Field(
-        default_factory=list,
+    qualifications: tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Qualifications for the role",
     )
     section: str = Field(default="", description="CFR section reference")
@@ -338,7 +366,7 @@ class HRPRoleInfo(BaseModel):
             "role": self.role.value,
             "title": self.title,
             "description": self.description,
-            "responsibilities": self.responsibilities,
-            "qualifications": self.qualifications,
+            "responsibilities": list(self.responsibilities),
+            "qualifications": list(self.qualifications),
             "section": self.section,
         }
@@ -1,9 +1,10 @@
 """Pydantic models for HRP regulations (10 CFR Parts 707, 710, 712)."""
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SourceType(str, Enum):
@@ -59,8 +60,15 @@ SECTION_SUBPARTS = {
 
 def get_subpart_for_section(section: str) -> HRPSubpart:
     """Determine which subpart a section belongs to."""
-    if section in SECTION_SUBPARTS:
-        return SECTION_SUBPARTS[section]
+    subpart = SECTION_SUBPARTS.get(section)
+    if subpart is not None:
+        return subpart
+    return _infer_subpart(section)
+
+
+@lru_cache(maxsize=256)
+def _infer_subpart(section: str) -> HRPSubpart:
+    """Infer the subpart of a section missing from SECTION_SUBPARTS."""
     # Default logic based on section number
     section_num = section.replace("712.", "")
     try:
@@ -101,6 +109,9 @@ class RegulationChunk(BaseModel):
 class SearchResult(BaseModel):
     """Search result containing a regulation chunk with relevance score."""
 
+    # Results are built once per hit and never modified
+    model_config = ConfigDict(frozen=True)
+
     chunk: RegulationChunk = Field(..., description="The matched regulation chunk")
     score: float = Field(..., description="Relevance score (0-1, higher is better)")
 
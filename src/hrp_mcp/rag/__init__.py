@@ -1,8 +1,12 @@
 """RAG utilities for HRP MCP server."""
 
 from hrp_mcp.rag.chunking import ChunkMetadata, RegulationChunker
+from hrp_mcp.rag.tokenization import HFBackend, TiktokenBackend, Tokenizer
 
 __all__ = [
     "ChunkMetadata",
+    "HFBackend",
     "RegulationChunker",
+    "TiktokenBackend",
+    "Tokenizer",
 ]
@@ -1,9 +1,11 @@
 """Document chunking strategies for HRP regulation text."""
 
+import os
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-
-import tiktoken
+from itertools import chain
 
 from hrp_mcp.models.regulations import (
     HRPSubpart,
@@ -11,9 +13,10 @@ from hrp_mcp.models.regulations import (
     SourceType,
     get_subpart_for_section,
 )
+from hrp_mcp.rag.tokenization import TiktokenBackend, Tokenizer
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChunkMetadata:
     """Metadata for a text chunk during processing."""
 
@@ -35,6 +38,7 @@ class RegulationChunker:
         max_tokens: int = 512,
         overlap_tokens: int = 50,
         tokenizer: str = "cl100k_base",
+        backend: Tokenizer | None = None,
     ):
         """
         Initialize the chunker.
@@ -43,13 +47,15 @@ class RegulationChunker:
             max_tokens: Maximum tokens per chunk (default 512).
             overlap_tokens: Token overlap between chunks (default 50).
             tokenizer: tiktoken tokenizer to use (default cl100k_base for OpenAI).
+                Ignored when ``backend`` is given.
+            backend: Tokenizer backend to use (default TiktokenBackend).
         """
         self.max_tokens = max_tokens
         self.overlap_tokens = overlap_tokens
-        self._tokenizer = tiktoken.get_encoding(tokenizer)
+        self._tokenizer: Tokenizer = backend if backend is not None else TiktokenBackend(tokenizer)
 
     def count_tokens(self, text: str) -> int:
-        """Count tokens in text using tiktoken."""
+        """Count tokens in text using the configured backend."""
         return len(self._tokenizer.encode(text))
 
     def chunk_text(
@@ -72,25 +78,48 @@ class RegulationChunker:
         if metadata.source == SourceType.CFR_712:
             subpart = get_subpart_for_section(metadata.section)
 
-        # If text fits in one chunk, return it
-        if self.count_tokens(text) <= self.max_tokens:
-            chunk_id = self._make_chunk_id(metadata.section, metadata.source, 0)
-            return [
-                RegulationChunk(
-                    id=chunk_id,
-                    source=metadata.source,
-                    subpart=subpart,
-                    section=metadata.section,
-                    title=metadata.title,
-                    content=text.strip(),
-                    citation=metadata.citation,
-                    chunk_index=0,
-                )
-            ]
+        # Strip once here; paragraphs, overlaps and windows are stripped where built
+        text = text.strip()
+
+        # Fast path: every token spans at least one byte, so ASCII text no
+        # longer than max_tokens characters always fits without encoding it.
+        # Anything else falls through to an exact token count.
+        if (text.isascii() and len(text) <= self.max_tokens) or (
+            self.count_tokens(text) <= self.max_tokens
+        ):
+            return [self._make_chunk(text, metadata, subpart, 0)]
 
         # Otherwise, split into chunks with overlap
         return self._split_with_overlap(text, metadata, subpart)
 
+    def chunk_many(
+        self,
+        items: Iterable[tuple[str, ChunkMetadata]],
+        max_workers: int | None = None,
+    ) -> list[RegulationChunk]:
+        """
+        Chunk many sections in parallel, preserving input order.
+
+        tiktoken releases the GIL while encoding, so sections are chunked
+        concurrently on a thread pool.
+
+        Args:
+            items: (text, metadata) pairs, one per section.
+            max_workers: Thread pool size (default: CPU count).
+
+        Returns:
+            Chunks for all sections, in input order.
+        """
+        pairs = list(items)
+        if len(pairs) <= 1:
+            return [chunk for text, metadata in pairs for chunk in self.chunk_text(text, metadata)]
+
+        workers = max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=min(workers, len(pairs))) as executor:
+            # map() yields results in submission order
+            per_section = executor.map(lambda pair: self.chunk_text(*pair), pairs)
+            return list(chain.from_iterable(per_section))
+
     def _split_with_overlap(
         self,
         text: str,
@@ -103,58 +132,38 @@ class RegulationChunker:
         # Split by paragraphs first to maintain coherence
         paragraphs = self._split_paragraphs(text)
 
+        # Tokenize all paragraphs in one batch call
+        paragraph_ids = self._tokenizer.encode_batch(paragraphs)
+
         current_chunk_text = ""
         current_tokens = 0
         chunk_index = 0
 
-        for paragraph in paragraphs:
-            para_tokens = self.count_tokens(paragraph)
+        for paragraph, ids in zip(paragraphs, paragraph_ids, strict=True):
+            para_tokens = len(ids)
 
-            # If single paragraph exceeds max, split by sentences
+            # If single paragraph exceeds max, split its token IDs into windows
             if para_tokens > self.max_tokens:
                 if current_chunk_text:
                     # Save current chunk first
-                    chunk_id = self._make_chunk_id(metadata.section, metadata.source, chunk_index)
                     chunks.append(
-                        RegulationChunk(
-                            id=chunk_id,
-                            source=metadata.source,
-                            subpart=subpart,
-                            section=metadata.section,
-                            title=metadata.title,
-                            content=current_chunk_text.strip(),
-                            citation=metadata.citation,
-                            chunk_index=chunk_index,
-                        )
+                        self._make_chunk(current_chunk_text, metadata, subpart, chunk_index)
                     )
                     chunk_index += 1
                     current_chunk_text = ""
                     current_tokens = 0
 
-                # Split long paragraph by sentences
-                sentence_chunks = self._split_long_paragraph(
-                    paragraph, metadata, subpart, chunk_index
-                )
-                chunks.extend(sentence_chunks)
-                chunk_index += len(sentence_chunks)
+                window_chunks = self._split_long_paragraph(ids, metadata, subpart, chunk_index)
+                chunks.extend(window_chunks)
+                chunk_index += len(window_chunks)
                 continue
 
             # Check if adding paragraph would exceed limit
             if current_tokens + para_tokens > self.max_tokens:
                 # Save current chunk
                 if current_chunk_text:
-                    chunk_id = self._make_chunk_id(metadata.section, metadata.source, chunk_index)
                     chunks.append(
-                        RegulationChunk(
-                            id=chunk_id,
-                            source=metadata.source,
-                            subpart=subpart,
-                            section=metadata.section,
-                            title=metadata.title,
-                            content=current_chunk_text.strip(),
-                            citation=metadata.citation,
-                            chunk_index=chunk_index,
-                        )
+                        self._make_chunk(current_chunk_text, metadata, subpart, chunk_index)
                     )
                     chunk_index += 1
 
@@ -175,19 +184,7 @@ class RegulationChunker:
 
         # Don't forget the last chunk
         if current_chunk_text:
-            chunk_id = self._make_chunk_id(metadata.section, metadata.source, chunk_index)
-            chunks.append(
-                RegulationChunk(
-                    id=chunk_id,
-                    source=metadata.source,
-                    subpart=subpart,
-                    section=metadata.section,
-                    title=metadata.title,
-                    content=current_chunk_text.strip(),
-                    citation=metadata.citation,
-                    chunk_index=chunk_index,
-                )
-            )
+            chunks.append(self._make_chunk(current_chunk_text, metadata, subpart, chunk_index))
 
         return chunks
 
@@ -199,66 +196,25 @@ class RegulationChunker:
 
     def _split_long_paragraph(
         self,
-        paragraph: str,
+        token_ids: list[int],
         metadata: ChunkMetadata,
         subpart: HRPSubpart | None,
         start_index: int,
     ) -> list[RegulationChunk]:
-        """Split a very long paragraph by sentences."""
-        chunks: list[RegulationChunk] = []
-
-        # Simple sentence splitting (handles common cases)
-        sentences = re.split(r"(?<=[.!?])\s+", paragraph)
-
-        current_chunk_text = ""
-        current_tokens = 0
-        chunk_index = start_index
+        """Split a very long paragraph into overlapping token windows.
 
-        for sentence in sentences:
-            sentence_tokens = self.count_tokens(sentence)
-
-            if current_tokens + sentence_tokens > self.max_tokens:
-                if current_chunk_text:
-                    chunk_id = self._make_chunk_id(metadata.section, metadata.source, chunk_index)
-                    chunks.append(
-                        RegulationChunk(
-                            id=chunk_id,
-                            source=metadata.source,
-                            subpart=subpart,
-                            section=metadata.section,
-                            title=metadata.title,
-                            content=current_chunk_text.strip(),
-                            citation=metadata.citation,
-                            chunk_index=chunk_index,
-                        )
-                    )
-                    chunk_index += 1
-
-                current_chunk_text = sentence
-                current_tokens = sentence_tokens
-            else:
-                if current_chunk_text:
-                    current_chunk_text += " " + sentence
-                else:
-                    current_chunk_text = sentence
-                current_tokens += sentence_tokens
+        Works directly on the paragraph's token IDs, so every window is
+        exactly bounded by max_tokens without re-tokenizing any text.
+        """
+        step = max(1, self.max_tokens - self.overlap_tokens)
+        # Stop once the remaining tokens are already covered by the previous window
+        end = max(1, len(token_ids) - self.overlap_tokens)
+        windows = [token_ids[i : i + self.max_tokens] for i in range(0, end, step)]
 
-        if current_chunk_text:
-            chunk_id = self._make_chunk_id(metadata.section, metadata.source, chunk_index)
-            chunks.append(
-                RegulationChunk(
-                    id=chunk_id,
-                    source=metadata.source,
-                    subpart=subpart,
-                    section=metadata.section,
-                    title=metadata.title,
-                    content=current_chunk_text.strip(),
-                    citation=metadata.citation,
-                    chunk_index=chunk_index,
-                )
-            )
-
-        return chunks
+        return [
+            self._make_chunk(window_text.strip(), metadata, subpart, start_index + offset)
+            for offset, window_text in enumerate(self._tokenizer.decode_batch(windows))
+        ]
 
     def _get_overlap_text(self, text: str) -> str:
         """Get the last N tokens of text for overlap."""
@@ -266,7 +222,26 @@ class RegulationChunker:
         if len(tokens) <= self.overlap_tokens:
             return text
         overlap_tokens = tokens[-self.overlap_tokens :]
-        return self._tokenizer.decode(overlap_tokens)
+        return self._tokenizer.decode(overlap_tokens).strip()
+
+    def _make_chunk(
+        self,
+        content: str,
+        metadata: ChunkMetadata,
+        subpart: HRPSubpart | None,
+        chunk_index: int,
+    ) -> RegulationChunk:
+        """Build a RegulationChunk for the given section metadata."""
+        return RegulationChunk(
+            id=self._make_chunk_id(metadata.section, metadata.source, chunk_index),
+            source=metadata.source,
+            subpart=subpart,
+            section=metadata.section,
+            title=metadata.title,
+            content=content,
+            citation=metadata.citation,
+            chunk_index=chunk_index,
+        )
 
     def _make_chunk_id(
         self,
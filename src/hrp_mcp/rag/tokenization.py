@@ -0,0 +1,124 @@
+"""Pluggable tokenizer backends for regulation chunking.
+
+The chunker only needs to encode text to token IDs and decode them back,
+so any tokenizer implementing the ``Tokenizer`` protocol can be used.
+tiktoken is the default; HuggingFace ``tokenizers`` is supported as an
+optional backend for high-batch workloads.
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Protocol, runtime_checkable
+
+import tiktoken
+
+DEFAULT_HF_TOKENIZER = "Xenova/gpt-4"
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once and share it (Encoding is thread-safe)."""
+    return tiktoken.get_encoding(name)
+
+
+@runtime_checkable
+class Tokenizer(Protocol):
+    """Minimal tokenizer interface used by RegulationChunker."""
+
+    def encode(self, text: str) -> list[int]:
+        """Encode text to token IDs."""
+        ...
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode multiple texts to token IDs."""
+        ...
+
+    def decode(self, tokens: list[int]) -> str:
+        """Decode token IDs to text."""
+        ...
+
+    def decode_batch(self, batch: list[list[int]]) -> list[str]:
+        """Decode multiple token ID sequences to text."""
+        ...
+
+
+class TiktokenBackend:
+    """Tokenizer backend using tiktoken (default)."""
+
+    def __init__(self, encoding: str = "cl100k_base"):
+        """
+        Initialize the backend.
+
+        Args:
+            encoding: tiktoken encoding name (default cl100k_base).
+        """
+        self.name = encoding
+        self._encoding = _get_encoding(encoding)
+
+    def encode(self, text: str) -> list[int]:
+        """Encode text to token IDs."""
+        return self._encoding.encode(text)
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode multiple texts to token IDs using tiktoken's thread pool."""
+        return self._encoding.encode_batch(texts)
+
+    def decode(self, tokens: list[int]) -> str:
+        """Decode token IDs to text."""
+        return self._encoding.decode(tokens)
+
+    def decode_batch(self, batch: list[list[int]]) -> list[str]:
+        """Decode multiple token ID sequences to text."""
+        return self._encoding.decode_batch(batch)
+
+
+class HFBackend:
+    """Tokenizer backend using HuggingFace ``tokenizers``.
+
+    The ``tokenizers`` package is installed alongside sentence-transformers.
+    Batch calls run in parallel in the Rust core.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_HF_TOKENIZER):
+        """
+        Initialize the backend.
+
+        Args:
+            model_name: HuggingFace Hub tokenizer to load (default Xenova/gpt-4,
+                a cl100k_base-compatible tokenizer).
+
+        Raises:
+            ImportError: If the tokenizers package is not installed.
+        """
+        try:
+            from tokenizers import Tokenizer as HFTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "HFBackend requires the 'tokenizers' package: pip install tokenizers"
+            ) from e
+
+        # Batch encoding is parallel unless explicitly disabled by the user
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+        self.name = model_name
+        self._tokenizer: Any = HFTokenizer.from_pretrained(model_name)
+
+    def encode(self, text: str) -> list[int]:
+        """Encode text to token IDs."""
+        ids: list[int] = self._tokenizer.encode(text, add_special_tokens=False).ids
+        return ids
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode multiple texts to token IDs."""
+        encodings = self._tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [encoding.ids for encoding in encodings]
+
+    def decode(self, tokens: list[int]) -> str:
+        """Decode token IDs to text."""
+        text: str = self._tokenizer.decode(tokens)
+        return text
+
+    def decode_batch(self, batch: list[list[int]]) -> list[str]:
+        """Decode multiple token ID sequences to text."""
+        texts: list[str] = self._tokenizer.decode_batch(batch)
+        return texts
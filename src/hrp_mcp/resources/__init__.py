@@ -1,37 +1,6 @@
 """Reference data for HRP MCP server."""
 
-from hrp_mcp.resources.reference_data import (
-    CERTIFICATION_COMPONENTS,
-    CONTROLLED_SUBSTANCES,
-    DISQUALIFYING_FACTORS,
-    HRP_DEFINITIONS,
-    HRP_POSITION_TYPES,
-    HRP_ROLES,
-    HRP_SECTIONS,
-    MEDICAL_STANDARDS,
-    get_certification_component,
-    get_definition,
-    get_disqualifying_factor,
-    get_hrp_role,
-    get_medical_standard,
-    get_position_type,
-    get_section_info,
-)
+from hrp_mcp.resources import reference_data
+from hrp_mcp.resources.reference_data import *  # noqa: F403
 
-__all__ = [
-    "CERTIFICATION_COMPONENTS",
-    "CONTROLLED_SUBSTANCES",
-    "DISQUALIFYING_FACTORS",
-    "HRP_DEFINITIONS",
-    "HRP_POSITION_TYPES",
-    "HRP_ROLES",
-    "HRP_SECTIONS",
-    "MEDICAL_STANDARDS",
-    "get_certification_component",
-    "get_definition",
-    "get_disqualifying_factor",
-    "get_hrp_role",
-    "get_medical_standard",
-    "get_position_type",
-    "get_section_info",
-]
+__all__ = reference_data.__all__
@@ -11,10 +11,17 @@ Contains static reference data from 10 CFR Part 712 including:
 - Medical standards
 """
 
-from typing import Any
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Final, TypeVar
+
+from pydantic import BaseModel
 
 from hrp_mcp.models.hrp import (
     CertificationComponent,
+    ControlledSubstance,
     DisqualifyingCategory,
     DisqualifyingFactor,
     HRPPositionType,
@@ -24,11 +31,30 @@ from hrp_mcp.models.hrp import (
     PositionTypeInfo,
 )
 
+__all__ = [
+    "CERTIFICATION_COMPONENTS",
+    "CONTROLLED_SUBSTANCES",
+    "DISQUALIFYING_FACTORS",
+    "HRP_DEFINITIONS",
+    "HRP_POSITION_TYPES",
+    "HRP_ROLES",
+    "HRP_SECTIONS",
+    "MEDICAL_STANDARDS",
+    "get_all_by_section",
+    "get_certification_component",
+    "get_definition",
+    "get_disqualifying_factor",
+    "get_hrp_role",
+    "get_medical_standard",
+    "get_position_type",
+    "get_section_info",
+]
+
 # =============================================================================
 # HRP DEFINITIONS (10 CFR 712.3)
 # =============================================================================
 
-HRP_DEFINITIONS: dict[str, dict[str, Any]] = {
+_HRP_DEFINITIONS: dict[str, dict[str, Any]] = {
     "access": {
         "term": "Access",
         "definition": "(1) A situation that may provide an individual proximity to or control over Category I special nuclear material (SNM); or (2) The proximity to a nuclear explosive and/or Category I SNM that allows the opportunity to divert, steal, tamper with, and/or damage the nuclear explosive or material in spite of any controls that have been established to prevent such unauthorized actions.",
@@ -161,23 +187,28 @@ HRP_DEFINITIONS: dict[str, dict[str, Any]] = {
     },
 }
 
+# Read-only views; entries are frozen too so callers cannot mutate shared data
+HRP_DEFINITIONS: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType(
+    {key: MappingProxyType(value) for key, value in _HRP_DEFINITIONS.items()}
+)
+
 # =============================================================================
 # HRP POSITION TYPES (10 CFR 712.10)
 # =============================================================================
 
-HRP_POSITION_TYPES: dict[str, PositionTypeInfo] = {
+_HRP_POSITION_TYPES: dict[str, PositionTypeInfo] = {
     "category_i_snm": PositionTypeInfo(
         position_type=HRPPositionType.CATEGORY_I_SNM,
         title="Category I Special Nuclear Material Access",
         description="Positions requiring access to Category I quantities of special nuclear material.",
         section="712.10(a)(1)",
         access_type="Category I SNM",
-        requirements=[
+        requirements=(
             "DOE Q or L clearance",
             "Successful completion of HRP certification",
             "Annual recertification",
             "Random drug and alcohol testing",
-        ],
+        ),
     ),
     "nuclear_explosive": PositionTypeInfo(
         position_type=HRPPositionType.NUCLEAR_EXPLOSIVE,
@@ -185,13 +216,13 @@ HRP_POSITION_TYPES: dict[str, PositionTypeInfo] = {
         description="Positions requiring access to nuclear explosive devices.",
         section="712.10(a)(2)",
         access_type="Nuclear explosive devices",
-        requirements=[
+        requirements=(
             "DOE Q clearance",
             "Successful completion of HRP certification",
             "Annual recertification",
             "Random drug and alcohol testing",
             "Additional nuclear explosive safety training",
-        ],
+        ),
     ),
     "nuclear_explosive_duty": PositionTypeInfo(
         position_type=HRPPositionType.NUCLEAR_EXPLOSIVE_DUTY,
@@ -199,14 +230,14 @@ HRP_POSITION_TYPES: dict[str, PositionTypeInfo] = {
         description="Positions involving work assignments that afford access to nuclear explosives or require performance of nuclear explosive operations.",
         section="712.10(a)(3)",
         access_type="Nuclear explosive operations",
-        requirements=[
+        requirements=(
             "DOE Q clearance",
             "Successful completion of HRP certification",
             "Annual recertification",
             "Random drug and alcohol testing",
             "Nuclear explosive duty-specific training",
             "Job task analysis completion",
-        ],
+        ),
     ),
     "hrp_designated": PositionTypeInfo(
         position_type=HRPPositionType.HRP_DESIGNATED,
@@ -214,20 +245,22 @@ HRP_POSITION_TYPES: dict[str, PositionTypeInfo] = {
         description="Other positions determined by DOE/NNSA to have significant impact on national security that warrant HRP requirements.",
         section="712.10(a)(4)",
         access_type="Varies by position designation",
-        requirements=[
+        requirements=(
             "Appropriate DOE clearance",
             "Successful completion of HRP certification",
             "Annual recertification",
             "Random drug and alcohol testing",
-        ],
+        ),
     ),
 }
 
+HRP_POSITION_TYPES: Final[Mapping[str, PositionTypeInfo]] = MappingProxyType(_HRP_POSITION_TYPES)
+
 # =============================================================================
 # HRP SECTIONS (10 CFR 712)
 # =============================================================================
 
-HRP_SECTIONS: dict[str, dict[str, Any]] = {
+_HRP_SECTIONS: dict[str, dict[str, Any]] = {
     # Subpart A - Procedures
     "712.1": {
         "section": "712.1",
@@ -400,24 +433,28 @@ HRP_SECTIONS: dict[str, dict[str, Any]] = {
     },
 }
 
+HRP_SECTIONS: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType(
+    {key: MappingProxyType(value) for key, value in _HRP_SECTIONS.items()}
+)
+
 # =============================================================================
 # CERTIFICATION COMPONENTS (Four Annual Components)
 # =============================================================================
 
-CERTIFICATION_COMPONENTS: dict[str, CertificationComponent] = {
+_CERTIFICATION_COMPONENTS: dict[str, CertificationComponent] = {
     "supervisory_review": CertificationComponent(
         name="Supervisory Review",
         description="Ongoing behavioral observation and reporting by immediate supervisors to identify reliability concerns.",
         section="712.14",
         frequency="Continuous (documented at least annually)",
         responsible_official="Immediate Supervisor",
-        key_elements=[
+        key_elements=(
             "Observation of job performance",
             "Observation of behavior and demeanor",
             "Reporting of safety or security concerns",
             "Documentation of unusual incidents",
             "Assessment of reliability indicators",
-        ],
+        ),
     ),
     "medical_assessment": CertificationComponent(
         name="Medical Assessment",
@@ -425,14 +462,14 @@ CERTIFICATION_COMPONENTS: dict[str, CertificationComponent] = {
         section="712.13",
         frequency="Annual",
         responsible_official="Designated Physician",
-        key_elements=[
+        key_elements=(
             "Physical examination",
             "Medical history review",
             "Psychological evaluation (if indicated)",
             "Review of current medications",
             "Assessment of fitness for duty",
             "Job task analysis review",
-        ],
+        ),
     ),
     "management_evaluation": CertificationComponent(
         name="Management Evaluation",
@@ -440,14 +477,14 @@ CERTIFICATION_COMPONENTS: dict[str, CertificationComponent] = {
         section="712.16",
         frequency="Annual",
         responsible_official="HRP Management Official",
-        key_elements=[
+        key_elements=(
             "Review of supervisory review findings",
             "Review of medical assessment results",
             "Review of drug and alcohol testing results",
             "Review of security review findings",
             "Overall reliability determination",
             "Certification or recertification decision",
-        ],
+        ),
     ),
     "security_review": CertificationComponent(
         name="DOE Security Review",
@@ -455,21 +492,25 @@ CERTIFICATION_COMPONENTS: dict[str, CertificationComponent] = {
         section="712.17",
         frequency="Annual",
         responsible_official="DOE Security Personnel",
-        key_elements=[
+        key_elements=(
             "Review of security clearance status",
             "Evaluation of security incidents",
             "Assessment of foreign contacts",
             "Review of criminal history updates",
             "Counterintelligence evaluation (if required)",
-        ],
+        ),
     ),
 }
 
+CERTIFICATION_COMPONENTS: Final[Mapping[str, CertificationComponent]] = MappingProxyType(
+    _CERTIFICATION_COMPONENTS
+)
+
 # =============================================================================
 # DISQUALIFYING FACTORS
 # =============================================================================
 
-DISQUALIFYING_FACTORS: dict[str, DisqualifyingFactor] = {
+_DISQUALIFYING_FACTORS: dict[str, DisqualifyingFactor] = {
     "hallucinogen_use": DisqualifyingFactor(
         name="Hallucinogen Use",
         description="Use of any hallucinogen within the preceding 5 years.",
@@ -552,279 +593,349 @@ DISQUALIFYING_FACTORS: dict[str, DisqualifyingFactor] = {
     ),
 }
 
+DISQUALIFYING_FACTORS: Final[Mapping[str, DisqualifyingFactor]] = MappingProxyType(
+    _DISQUALIFYING_FACTORS
+)
+
 # =============================================================================
 # CONTROLLED SUBSTANCES (Drug Testing Panel)
 # =============================================================================
 
-CONTROLLED_SUBSTANCES: list[dict[str, Any]] = [
-    {
-        "substance": "Marijuana (THC)",
-        "category": "Cannabinoid",
-        "initial_cutoff": "50 ng/mL",
-        "confirmatory_cutoff": "15 ng/mL",
-    },
-    {
-        "substance": "Cocaine",
-        "category": "Stimulant",
-        "initial_cutoff": "150 ng/mL",
-        "confirmatory_cutoff": "100 ng/mL",
-    },
-    {
-        "substance": "Amphetamines",
-        "category": "Stimulant",
-        "initial_cutoff": "500 ng/mL",
-        "confirmatory_cutoff": "250 ng/mL",
-    },
-    {
-        "substance": "Opiates (Codeine/Morphine)",
-        "category": "Narcotic",
-        "initial_cutoff": "2000 ng/mL",
-        "confirmatory_cutoff": "2000 ng/mL",
-    },
-    {
-        "substance": "6-Acetylmorphine (Heroin)",
-        "category": "Narcotic",
-        "initial_cutoff": "10 ng/mL",
-        "confirmatory_cutoff": "10 ng/mL",
-    },
-    {
-        "substance": "Phencyclidine (PCP)",
-        "category": "Hallucinogen",
-        "initial_cutoff": "25 ng/mL",
-        "confirmatory_cutoff": "25 ng/mL",
-    },
-    {
-        "substance": "MDMA/MDA",
-        "category": "Stimulant/Hallucinogen",
-        "initial_cutoff": "500 ng/mL",
-        "confirmatory_cutoff": "250 ng/mL",
-    },
-    {
-        "substance": "Oxycodone",
-        "category": "Narcotic",
-        "initial_cutoff": "100 ng/mL",
-        "confirmatory_cutoff": "100 ng/mL",
-    },
-]
+CONTROLLED_SUBSTANCES: tuple[ControlledSubstance, ...] = (
+    ControlledSubstance("Marijuana (THC)", "Cannabinoid", "50 ng/mL", "15 ng/mL"),
+    ControlledSubstance("Cocaine", "Stimulant", "150 ng/mL", "100 ng/mL"),
+    ControlledSubstance("Amphetamines", "Stimulant", "500 ng/mL", "250 ng/mL"),
+    ControlledSubstance("Opiates (Codeine/Morphine)", "Narcotic", "2000 ng/mL", "2000 ng/mL"),
+    ControlledSubstance("6-Acetylmorphine (Heroin)", "Narcotic", "10 ng/mL", "10 ng/mL"),
+    ControlledSubstance("Phencyclidine (PCP)", "Hallucinogen", "25 ng/mL", "25 ng/mL"),
+    ControlledSubstance("MDMA/MDA", "Stimulant/Hallucinogen", "500 ng/mL", "250 ng/mL"),
+    ControlledSubstance("Oxycodone", "Narcotic", "100 ng/mL", "100 ng/mL"),
+)
 
 # =============================================================================
 # HRP ROLES
 # =============================================================================
 
-HRP_ROLES: dict[str, HRPRoleInfo] = {
+_HRP_ROLES: dict[str, HRPRoleInfo] = {
     "certifying_official": HRPRoleInfo(
         role=HRPRole.HRP_CERTIFYING_OFFICIAL,
         title="HRP Certifying Official",
         description="The individual with final authority to approve or deny HRP certification or recertification.",
-        responsibilities=[
+        responsibilities=(
             "Make final certification and recertification decisions",
             "Review all HRP evaluation components",
             "Ensure compliance with HRP requirements",
             "Approve or deny HRP candidate applications",
             "Document certification decisions",
-        ],
-        qualifications=[
+        ),
+        qualifications=(
             "Appointed by HRP Management Official",
             "Knowledge of HRP requirements",
             "Security clearance appropriate for position",
-        ],
+        ),
         section="712.3",
     ),
     "management_official": HRPRoleInfo(
         role=HRPRole.HRP_MANAGEMENT_OFFICIAL,
         title="HRP Management Official",
         description="The individual designated to manage the HRP at a DOE/NNSA site.",
-        responsibilities=[
+        responsibilities=(
             "Oversee site HRP implementation",
             "Designate HRP officials",
             "Ensure HRP compliance",
             "Coordinate with DOE headquarters",
             "Approve temporary removals",
             "Review removal and reinstatement decisions",
-        ],
-        qualifications=[
+        ),
+        qualifications=(
             "Designated by DOE or NNSA",
             "Senior management position",
             "Knowledge of site operations",
             "Appropriate security clearance",
-        ],
+        ),
         section="712.3",
     ),
     "designated_physician": HRPRoleInfo(
         role=HRPRole.DESIGNATED_PHYSICIAN,
         title="Designated Physician",
         description="A licensed physician designated to provide medical evaluations of HRP candidates and certified individuals.",
-        responsibilities=[
+        responsibilities=(
             "Conduct medical assessments",
             "Review medical history",
             "Perform physical examinations",
             "Determine medical fitness for duty",
             "Recommend accommodations if appropriate",
             "Report medical concerns to HRP management",
-        ],
-        qualifications=[
+        ),
+        qualifications=(
             "Licensed physician (MD or DO)",
             "Designated by HRP Management Official",
             "Training in occupational medicine preferred",
             "Knowledge of HRP medical requirements",
-        ],
+        ),
         section="712.33",
     ),
     "designated_psychologist": HRPRoleInfo(
         role=HRPRole.DESIGNATED_PSYCHOLOGIST,
         title="Designated Psychologist",
         description="A psychologist designated to provide psychological evaluations of HRP candidates and certified individuals.",
-        responsibilities=[
+        responsibilities=(
             "Conduct psychological evaluations",
             "Administer psychological tests",
             "Assess mental health status",
             "Evaluate fitness for duty",
             "Report psychological concerns",
             "Recommend treatment when appropriate",
-        ],
-        qualifications=[
+        ),
+        qualifications=(
             "Licensed psychologist",
             "Designated by HRP Management Official",
             "Experience in personnel assessment",
             "Knowledge of HRP requirements",
-        ],
+        ),
         section="712.34",
     ),
     "supervisor": HRPRoleInfo(
         role=HRPRole.SUPERVISOR,
         title="Immediate Supervisor",
         description="The first-line supervisor who assigns, reviews, and approves the day-to-day work of HRP individuals.",
-        responsibilities=[
+        responsibilities=(
             "Observe job performance daily",
             "Monitor behavior and demeanor",
             "Report safety or security concerns",
             "Document unusual incidents",
             "Conduct supervisory review assessments",
             "Communicate concerns to HRP management",
-        ],
-        qualifications=[
+        ),
+        qualifications=(
             "First-line supervisory position",
             "Training in HRP supervisory responsibilities",
             "Knowledge of subordinate's job duties",
-        ],
+        ),
         section="712.14",
     ),
     "medical_review_officer": HRPRoleInfo(
         role=HRPRole.MEDICAL_REVIEW_OFFICER,
         title="Medical Review Officer (MRO)",
         description="A licensed physician responsible for reviewing and interpreting drug test results.",
-        responsibilities=[
+        responsibilities=(
             "Review laboratory drug test results",
             "Contact individuals with positive results",
             "Verify legitimate medical explanations",
             "Make final determination on test results",
             "Report verified results to HRP management",
-        ],
-        qualifications=[
+        ),
+        qualifications=(
             "Licensed physician",
             "MRO certification",
             "Training in drug testing procedures",
             "Knowledge of DOT/HHS guidelines",
-        ],
+        ),
         section="712.15",
     ),
 }
 
+HRP_ROLES: Final[Mapping[str, HRPRoleInfo]] = MappingProxyType(_HRP_ROLES)
+
 # =============================================================================
 # MEDICAL STANDARDS (Subpart B)
 # =============================================================================
 
-MEDICAL_STANDARDS: dict[str, MedicalStandard] = {
+_MEDICAL_STANDARDS: dict[str, MedicalStandard] = {
     "general_medical": MedicalStandard(
         name="General Medical Standards",
         description="Overall medical requirements for HRP certification.",
         section="712.30",
         category="general",
-        conditions=[
+        conditions=(
             "Physical conditions that could affect reliability",
             "Mental conditions that could affect reliability",
             "Use of medications that could affect performance",
-        ],
-        evaluation_criteria=[
+        ),
+        evaluation_criteria=(
             "Ability to perform job duties safely",
             "No condition that could impair judgment",
             "No condition that could affect alertness",
             "No condition that increases risk to self or others",
-        ],
+        ),
     ),
     "physical_examination": MedicalStandard(
         name="Physical Examination Requirements",
         description="Requirements for physical examination of HRP candidates and certified individuals.",
         section="712.32",
         category="physical",
-        conditions=[
+        conditions=(
             "Cardiovascular conditions",
             "Neurological conditions",
             "Musculoskeletal conditions",
             "Sensory impairments",
             "Chronic diseases",
-        ],
-        evaluation_criteria=[
+        ),
+        evaluation_criteria=(
             "Based on job task analysis",
             "Ability to perform essential functions",
             "Risk of sudden incapacitation",
             "Need for accommodations",
-        ],
+        ),
     ),
     "psychological_evaluation": MedicalStandard(
         name="Psychological Evaluation Requirements",
         description="Requirements for psychological evaluation of HRP candidates and certified individuals.",
         section="712.34",
         category="psychological",
-        conditions=[
+        conditions=(
             "Mood disorders",
             "Anxiety disorders",
             "Personality disorders",
             "Psychotic disorders",
             "Cognitive impairments",
-        ],
-        evaluation_criteria=[
+        ),
+        evaluation_criteria=(
             "Emotional stability",
             "Judgment and decision-making",
             "Impulse control",
             "Stress tolerance",
             "Interpersonal functioning",
             "Honesty and integrity",
-        ],
+        ),
     ),
     "substance_use": MedicalStandard(
         name="Substance Use Standards",
         description="Standards related to alcohol and drug use.",
         section="712.13",
         category="substance",
-        conditions=[
+        conditions=(
             "Alcohol use disorder",
             "Substance use disorder",
             "Current illegal drug use",
             "Prescription drug misuse",
-        ],
-        evaluation_criteria=[
+        ),
+        evaluation_criteria=(
             "History of substance use",
             "Current substance use",
             "Treatment history",
             "Recovery status",
             "Risk of relapse",
-        ],
+        ),
     ),
 }
 
+MEDICAL_STANDARDS: Final[Mapping[str, MedicalStandard]] = MappingProxyType(_MEDICAL_STANDARDS)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+_V = TypeVar("_V")
+_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+_KEY_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
+
+
+def _normalize_key(value: str) -> str:
+    """Normalize a lookup string to registry key form."""
+    return value.lower().translate(_KEY_SEPARATORS)
+
+
+def _tokenize(value: str) -> set[str]:
+    """Split a key or term into lowercase word tokens."""
+    return {token for token in _TOKEN_SPLIT.split(value.lower()) if token}
+
+
+def _build_index(registry: Mapping[str, _V]) -> dict[str, _V]:
+    """Map each key and its space/hyphen spellings directly to the entry."""
+    index: dict[str, _V] = {}
+    for key, value in registry.items():
+        for alias in (key, key.replace("_", " "), key.replace("_", "-")):
+            index.setdefault(alias, value)
+    return index
+
+
+def _build_token_index(definitions: Mapping[str, Mapping[str, Any]]) -> dict[str, list[str]]:
+    """Map each word in a definition's key or term to the keys containing it."""
+    index: dict[str, list[str]] = {}
+    for key, value in definitions.items():
+        for token in _tokenize(key) | _tokenize(value["term"]):
+            index.setdefault(token, []).append(key)
+    return index
+
+
+def _build_section_index(
+    registries: Mapping[str, Mapping[str, BaseModel]],
+) -> dict[str, Mapping[str, tuple[BaseModel, ...]]]:
+    """Group every registry entry by its section and by the base section number."""
+    grouped: dict[str, dict[str, list[BaseModel]]] = {}
+    for registry_name, registry in registries.items():
+        for entry in registry.values():
+            section: str = getattr(entry, "section", "")
+            if not section:
+                continue
+            # "712.13(c)" is listed under itself and under "712.13"
+            for key in dict.fromkeys((section, section.partition("(")[0])):
+                grouped.setdefault(key, {}).setdefault(registry_name, []).append(entry)
+    return {
+        section: MappingProxyType({name: tuple(entries) for name, entries in by_registry.items()})
+        for section, by_registry in grouped.items()
+    }
+
+
+def _lookup(index: Mapping[str, _V], name: str) -> _V | None:
+    """Look up a name, normalizing only when the raw spelling misses."""
+    lowered = name.strip().lower()
+    found = index.get(lowered)
+    if found is None:
+        found = index.get(_normalize_key(lowered))
+    return found
+
+
+# Registries are static, so every accepted spelling is indexed once at import
+_DEFINITION_INDEX = {
+    **{value["term"].lower(): value for value in HRP_DEFINITIONS.values()},
+    **_build_index(HRP_DEFINITIONS),
+}
+_POSITION_TYPE_INDEX = _build_index(HRP_POSITION_TYPES)
+_CERTIFICATION_COMPONENT_INDEX = _build_index(CERTIFICATION_COMPONENTS)
+_DISQUALIFYING_FACTOR_INDEX = _build_index(DISQUALIFYING_FACTORS)
+_HRP_ROLE_INDEX = _build_index(HRP_ROLES)
+_MEDICAL_STANDARD_INDEX = _build_index(MEDICAL_STANDARDS)
+_DEFINITION_TOKENS = _build_token_index(HRP_DEFINITIONS)
+_DEFINITION_ORDER = {key: position for position, key in enumerate(HRP_DEFINITIONS)}
+_BY_SECTION = _build_section_index(
+    {
+        "position_types": HRP_POSITION_TYPES,
+        "certification_components": CERTIFICATION_COMPONENTS,
+        "disqualifying_factors": DISQUALIFYING_FACTORS,
+        "hrp_roles": HRP_ROLES,
+        "medical_standards": MEDICAL_STANDARDS,
+    }
+)
+_EMPTY_SECTION: Mapping[str, tuple[BaseModel, ...]] = MappingProxyType({})
+# Sections are also reachable by bare number ("11" -> "712.11")
+_SECTION_INDEX = {
+    **{section.removeprefix("712."): info for section, info in HRP_SECTIONS.items()},
+    **HRP_SECTIONS,
+}
+
 
-def get_definition(term: str) -> dict[str, Any] | None:
+def get_definition(term: str) -> Mapping[str, Any] | None:
     """Look up an HRP definition by term."""
-    term_lower = term.lower().replace(" ", "_").replace("-", "_")
-    if term_lower in HRP_DEFINITIONS:
-        return HRP_DEFINITIONS[term_lower]
-    # Try fuzzy match
+    found = _lookup(_DEFINITION_INDEX, term)
+    if found is not None:
+        return found
+    return _fuzzy_definition(term)
+
+
+@lru_cache(maxsize=256)
+def _fuzzy_definition(term: str) -> Mapping[str, Any] | None:
+    """Find a definition by shared words, then substring (fallback for get_definition)."""
+    tokens = _tokenize(term)
+    if tokens:
+        postings = [_DEFINITION_TOKENS.get(token, ()) for token in tokens]
+        matches = set(postings[0]).intersection(*postings[1:])
+        if matches:
+            return HRP_DEFINITIONS[min(matches, key=_DEFINITION_ORDER.__getitem__)]
+
+    term_lower = _normalize_key(term)
     for key, value in HRP_DEFINITIONS.items():
         if term_lower in key or key in term_lower:
             return value
@@ -835,37 +946,49 @@ def get_definition(term: str) -> dict[str, Any] | None:
 
 def get_position_type(position_type: str) -> PositionTypeInfo | None:
     """Look up an HRP position type."""
-    key = position_type.lower().replace(" ", "_").replace("-", "_")
-    return HRP_POSITION_TYPES.get(key)
+    return _lookup(_POSITION_TYPE_INDEX, position_type)
+
+
+def get_section_info(section: str) -> Mapping[str, Any] | None:
+    """Look up information about a specific section (e.g. '712.11' or '11')."""
+    found = _SECTION_INDEX.get(section)
+    if found is None:
+        found = _SECTION_INDEX.get(section.strip())
+    return found
+
+
+def get_all_by_section(section: str) -> Mapping[str, tuple[BaseModel, ...]]:
+    """
+    Collect entries from every registry that cite a section.
 
+    Args:
+        section: Section number, e.g. "712.13", "13" or "712.13(c)".
 
-def get_section_info(section: str) -> dict[str, Any] | None:
-    """Look up information about a specific section."""
-    # Normalize section number
+    Returns:
+        Read-only mapping of registry name (e.g. "medical_standards") to the
+        matching entries. Empty if nothing cites the section.
+    """
+    section = section.strip()
     if not section.startswith("712."):
         section = f"712.{section}"
-    return HRP_SECTIONS.get(section)
+    return _BY_SECTION.get(section, _EMPTY_SECTION)
 
 
 def get_certification_component(component: str) -> CertificationComponent | None:
     """Look up a certification component."""
-    key = component.lower().replace(" ", "_").replace("-", "_")
-    return CERTIFICATION_COMPONENTS.get(key)
+    return _lookup(_CERTIFICATION_COMPONENT_INDEX, component)
 
 
 def get_disqualifying_factor(factor: str) -> DisqualifyingFactor | None:
     """Look up a disqualifying factor."""
-    key = factor.lower().replace(" ", "_").replace("-", "_")
-    return DISQUALIFYING_FACTORS.get(key)
+    return _lookup(_DISQUALIFYING_FACTOR_INDEX, factor)
 
 
 def get_hrp_role(role: str) -> HRPRoleInfo | None:
     """Look up an HRP role."""
-    key = role.lower().replace(" ", "_").replace("-", "_")
-    return HRP_ROLES.get(key)
+    return _lookup(_HRP_ROLE_INDEX, role)
 
 
 def get_medical_standard(standard: str) -> MedicalStandard | None:
     """Look up a medical standard."""
-    key = standard.lower().replace(" ", "_").replace("-", "_")
-    return MEDICAL_STANDARDS.get(key)
+    return _lookup(_MEDICAL_STANDARD_INDEX, standard)
@@ -1,20 +1,35 @@
 """Human Reliability Program MCP Server - 10 CFR Part 712 access."""
 
 import logging
+import sys
+import threading
 
 from fastmcp import FastMCP
 
 from hrp_mcp.config import settings
-
-# Configure logging
+from hrp_mcp.services import warm_up_services
+
+# Every level name the logging module defines, aliases included
+_LOG_LEVELS = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.CRITICAL,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Configure logging; an unknown HRP_LOG_LEVEL fails here with a KeyError
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
+    level=_LOG_LEVELS[settings.log_level.upper()],
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
-mcp = FastMCP(
-    "hrp-mcp",
-    instructions="""
+# Interned once at import so FastMCP and any caller share one string object
+_INSTRUCTIONS = sys.intern(
+    """
     Human Reliability Program (HRP) MCP Server for DOE/NNSA sites.
 
     This server provides tools for 10 CFR Part 712 - Human Reliability Program:
@@ -59,11 +74,16 @@ mcp = FastMCP(
 
     For official guidance, consult your site's HRP Management Official
     or the applicable DOE Order.
-    """,
+    """
 )
 
+mcp = FastMCP("hrp-mcp", instructions=_INSTRUCTIONS)
+
 # Import tools to register them with FastMCP via @mcp.tool() decorators
-# These imports must happen after mcp is defined
+# These imports must happen after mcp is defined. Registration stays eager
+# because clients list every tool up front; the tool modules only import
+# reference data and lazy service getters, so the embedding model and
+# ChromaDB are not loaded until the first search.
 from hrp_mcp.tools import (  # noqa: E402
     certification,  # noqa: F401
     medical,  # noqa: F401
@@ -77,6 +97,10 @@ def main() -> None:
     """Run the MCP server with configured transport."""
     transport = settings.mcp_transport
 
+    if settings.warm_up:
+        # In the background so the client handshake is not held up
+        threading.Thread(target=warm_up_services, name="hrp-warm-up", daemon=True).start()
+
     if transport == "streamable-http":
         mcp.run(
             transport="streamable-http",
@@ -1,10 +1,12 @@
 """Service layer with singleton getters.
 
-Uses @lru_cache for lazy singleton pattern to avoid circular imports
-and enable late binding of dependencies.
+Services are created lazily on first use and cached in module globals.
+Imports happen inside the getters to avoid circular imports and enable
+late binding of dependencies.
 """
 
-from functools import lru_cache
+import logging
+import threading
 from typing import TYPE_CHECKING
 
 from hrp_mcp.config import settings
@@ -14,36 +16,92 @@ if TYPE_CHECKING:
     from hrp_mcp.services.rag import RagService
     from hrp_mcp.services.vector_store import VectorStoreService
 
+logger = logging.getLogger(__name__)
+
+# Guards first-time creation only; the fast path is a plain global read.
+# Reentrant because get_rag_service builds the other two services.
+_lock = threading.RLock()
+_embedding_service: "EmbeddingService | None" = None
+_vector_store: "VectorStoreService | None" = None
+_rag_service: "RagService | None" = None
+
 
-@lru_cache(maxsize=1)
 def get_embedding_service() -> "EmbeddingService":
     """Get singleton embedding service instance."""
-    from hrp_mcp.services.embeddings import EmbeddingService
+    global _embedding_service
+    if _embedding_service is None:
+        with _lock:
+            if _embedding_service is None:
+                from hrp_mcp.services.embeddings import EmbeddingService
 
-    return EmbeddingService(model_name=settings.embedding_model)
+                _embedding_service = EmbeddingService(
+                    model_name=settings.embedding_model,
+                    device=settings.embedding_device,
+                )
+    return _embedding_service
 
 
-@lru_cache(maxsize=1)
 def get_vector_store() -> "VectorStoreService":
     """Get singleton vector store service instance."""
-    from hrp_mcp.services.vector_store import VectorStoreService
+    global _vector_store
+    if _vector_store is None:
+        with _lock:
+            if _vector_store is None:
+                from hrp_mcp.services.vector_store import VectorStoreService
+
+                vector_store = VectorStoreService(db_path=settings.chroma_persist_dir)
+                if settings.vector_index_in_memory:
+                    from hrp_mcp.models.errors import VectorStoreError
 
-    return VectorStoreService(db_path=settings.chroma_persist_dir)
+                    try:
+                        vector_store.load_into_memory(int8=settings.vector_index_int8)
+                    except VectorStoreError as e:
+                        # Searches still work through Chroma
+                        logger.warning("In-memory vector index not loaded: %s", e)
+                _vector_store = vector_store
+    return _vector_store
 
 
-@lru_cache(maxsize=1)
 def get_rag_service() -> "RagService":
     """Get singleton RAG service instance."""
-    from hrp_mcp.services.rag import RagService
+    global _rag_service
+    if _rag_service is None:
+        with _lock:
+            if _rag_service is None:
+                from hrp_mcp.services.rag import RagService
+
+                _rag_service = RagService(
+                    embedding_service=get_embedding_service(),
+                    vector_store=get_vector_store(),
+                )
+    return _rag_service
+
+
+def warm_up_services() -> None:
+    """Load the embedding model and warm the vector store ahead of the first request.
+
+    Every known section is also loaded into the RAG section cache, so the
+    first get_section calls after a restart skip the vector store.
+
+    Failures are logged rather than raised; the first request then pays the
+    cost and reports any error as usual.
+    """
+    from hrp_mcp.models.errors import HRPError
+    from hrp_mcp.resources.reference_data import HRP_SECTIONS
 
-    return RagService(
-        embedding_service=get_embedding_service(),
-        vector_store=get_vector_store(),
-    )
+    try:
+        get_embedding_service().embed_np("warm up")
+        get_vector_store().warm_up()
+        get_rag_service().preload_sections(list(HRP_SECTIONS))
+    except HRPError as e:
+        logger.warning("Service warm-up failed: %s", e)
+    else:
+        logger.info("Services warmed up")
 
 
 __all__ = [
     "get_embedding_service",
     "get_rag_service",
     "get_vector_store",
+    "warm_up_services",
 ]
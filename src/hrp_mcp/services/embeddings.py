@@ -1,16 +1,29 @@
 """Embedding service using sentence-transformers."""
 
+import threading
+from collections import OrderedDict
 from typing import cast
 
+import numpy as np
+import numpy.typing as npt
+import torch
 from sentence_transformers import SentenceTransformer
 
 from hrp_mcp.models.errors import EmbeddingError
 
+# Longer texts (ingested chunks, not queries) are embedded without caching
+_MAX_CACHED_TEXT_LENGTH = 4096
+
 
 class EmbeddingService:
     """Generate embeddings using sentence-transformers models."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        device: str | None = None,
+        cache_size: int = 1024,
+    ):
         """
         Initialize the embedding service.
 
@@ -20,16 +33,28 @@ class EmbeddingService:
             model_name: Name of the sentence-transformers model to use.
                         Default is all-MiniLM-L6-v2 (384 dimensions, fast).
                         Alternative: BAAI/bge-small-en-v1.5 (better quality).
+            device: Torch device to run on (e.g. "cpu", "cuda"). None lets
+                    sentence-transformers pick CUDA/MPS when available.
+            cache_size: Maximum number of recent embeddings kept in memory.
+                        0 disables caching.
         """
         self._model_name = model_name
+        self._device = device
         self._model: SentenceTransformer | None = None
+        self._dim: int | None = None
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, npt.NDArray[np.float32]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     @property
     def model(self) -> SentenceTransformer:
         """Lazy-load and return the model."""
         if self._model is None:
             try:
-                self._model = SentenceTransformer(self._model_name)
+                model = SentenceTransformer(self._model_name, device=self._device)
+                # Inference only: make sure dropout is off
+                model.eval()
+                self._model = model
             except Exception as e:
                 raise EmbeddingError(f"Failed to load model '{self._model_name}': {e}") from e
         return self._model
@@ -37,7 +62,107 @@ class EmbeddingService:
     @property
     def dimension(self) -> int:
         """Return the embedding dimension for this model."""
-        return self.model.get_sentence_embedding_dimension()
+        # Fixed once the model is loaded, so only ask the model once
+        if self._dim is None:
+            self._dim = self.model.get_sentence_embedding_dimension()
+        return self._dim
+
+    def _cache_get(self, text: str) -> npt.NDArray[np.float32] | None:
+        """Return a cached embedding and mark it most recently used."""
+        with self._cache_lock:
+            embedding = self._cache.get(text)
+            if embedding is not None:
+                self._cache.move_to_end(text)
+            return embedding
+
+    def _cache_put(self, text: str, embedding: npt.NDArray[np.float32]) -> None:
+        """Store an embedding, evicting the least recently used entry if full."""
+        if self._cache_size <= 0 or len(text) > _MAX_CACHED_TEXT_LENGTH:
+            return
+        # Cached arrays are shared between callers, so freeze them
+        embedding.setflags(write=False)
+        with self._cache_lock:
+            self._cache[text] = embedding
+            self._cache.move_to_end(text)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def embed_np(self, text: str) -> npt.NDArray[np.float32]:
+        """
+        Generate embedding for a single text as a float32 array.
+
+        Avoids boxing every component into a Python float; prefer this
+        over embed() on hot paths. Recent results are cached, so the
+        returned array is read-only.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            1-D float32 array of length ``dimension``.
+
+        Raises:
+            EmbeddingError: If embedding generation fails.
+        """
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
+        try:
+            with torch.inference_mode():
+                embedding = cast(
+                    npt.NDArray[np.float32], self.model.encode(text, convert_to_numpy=True)
+                )
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate embedding: {e}") from e
+        self._cache_put(text, embedding)
+        return embedding
+
+    def embed_batch_np(self, texts: list[str], batch_size: int = 32) -> npt.NDArray[np.float32]:
+        """
+        Generate embeddings for multiple texts as a 2-D float32 array.
+
+        Texts already in the cache are not re-encoded.
+
+        Args:
+            texts: List of texts to embed.
+            batch_size: Number of texts to process at once.
+
+        Returns:
+            Array of shape (len(texts), dimension).
+
+        Raises:
+            EmbeddingError: If embedding generation fails.
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        rows: list[npt.NDArray[np.float32] | None] = [self._cache_get(t) for t in texts]
+        misses = [i for i, row in enumerate(rows) if row is None]
+        if not misses:
+            return np.stack(cast(list[npt.NDArray[np.float32]], rows))
+
+        try:
+            with torch.inference_mode():
+                embeddings = self.model.encode(
+                    [texts[i] for i in misses],
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=len(misses) > 100,
+                )
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate batch embeddings: {e}") from e
+
+        embeddings = cast(npt.NDArray[np.float32], embeddings)
+        if len(misses) == len(texts):
+            for text, embedding in zip(texts, embeddings, strict=True):
+                self._cache_put(text, embedding.copy())
+            return embeddings
+
+        for i, embedding in zip(misses, embeddings, strict=True):
+            rows[i] = embedding
+            self._cache_put(texts[i], embedding.copy())
+        return np.stack(cast(list[npt.NDArray[np.float32]], rows))
 
     def embed(self, text: str) -> list[float]:
         """
@@ -52,11 +177,7 @@ class EmbeddingService:
         Raises:
             EmbeddingError: If embedding generation fails.
         """
-        try:
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            return cast(list[float], embedding.tolist())
-        except Exception as e:
-            raise EmbeddingError(f"Failed to generate embedding: {e}") from e
+        return cast(list[float], self.embed_np(text).tolist())
 
     def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
         """
@@ -75,13 +196,4 @@ class EmbeddingService:
         if not texts:
             return []
 
-        try:
-            embeddings = self.model.encode(
-                texts,
-                batch_size=batch_size,
-                convert_to_numpy=True,
-                show_progress_bar=len(texts) > 100,
-            )
-            return cast(list[list[float]], embeddings.tolist())
-        except Exception as e:
-            raise EmbeddingError(f"Failed to generate batch embeddings: {e}") from e
+        return cast(list[list[float]], self.embed_batch_np(texts, batch_size).tolist())
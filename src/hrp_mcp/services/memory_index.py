@@ -0,0 +1,165 @@
+"""In-memory exact vector index for the read-mostly regulation corpus.
+
+The regulation corpus is a few thousand chunks at most, so one float32
+matrix product over every stored embedding is exact and cheaper than a
+round trip through Chroma's HNSW index and SQLite metadata store. Chroma
+stays the store of record; a MemoryIndex is a snapshot loaded from it.
+
+Past COARSE_SEARCH_THRESHOLD candidate rows, a query is first narrowed
+with 1-bit sign codes compared by Hamming distance, and only the closest
+rows are scored exactly.
+
+With int8=True the embeddings are held as int8 codes instead, a quarter of
+the float32 memory, and scores become close approximations of the cosine
+similarity (see services.quantization).
+"""
+
+from collections.abc import Sequence
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from hrp_mcp.services.quantization import int8_cosine_scores, quantize_int8
+
+# Candidate rows above which the binary coarse pass is used
+COARSE_SEARCH_THRESHOLD = 20_000
+# Rows kept from the coarse pass per requested result
+_RERANK_OVERSAMPLE = 10
+# Set bits in each possible byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class MemoryIndex:
+    """Snapshot of stored chunks searched by exact cosine similarity."""
+
+    def __init__(
+        self,
+        records: Sequence[dict[str, Any]],
+        embeddings: npt.NDArray[np.floating],
+        int8: bool = False,
+    ):
+        """
+        Build the index.
+
+        Args:
+            records: One metadata dict per chunk, including "id" and
+                     "content", as returned by VectorStoreService.search.
+            embeddings: 2-D array of embeddings, one row per record.
+            int8: Hold the embeddings as int8 codes and score approximately.
+
+        Raises:
+            ValueError: If records and embeddings lengths don't match.
+        """
+        if len(records) != len(embeddings):
+            raise ValueError(
+                f"Records ({len(records)}) and embeddings ({len(embeddings)}) must have same length"
+            )
+        self._records = tuple(records)
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(len(self._records), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        unit = matrix / np.maximum(norms, np.finfo(np.float32).tiny)
+        # Exactly one of the float32 rows and their int8 codes is kept
+        self._unit: npt.NDArray[np.float32] | None = None if int8 else unit
+        self._codes: npt.NDArray[np.int8] | None = quantize_int8(unit) if int8 else None
+        # One sign bit per dimension: 1/32 of the float32 size
+        self._bits = np.packbits(unit > 0, axis=1)
+        self._sources = np.array([r.get("source") for r in self._records], dtype=object)
+        self._subparts = np.array([r.get("subpart") for r in self._records], dtype=object)
+        self._sections = np.array([r.get("section") for r in self._records], dtype=object)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the stored embeddings, float32 rows or int8 codes."""
+        stored = self._unit if self._unit is not None else self._codes
+        return 0 if stored is None else int(stored.nbytes)
+
+    def _scores(
+        self,
+        query_unit: npt.NDArray[np.float32],
+        rows: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float32]:
+        """Cosine similarity of the query to each row, approximate for int8 codes."""
+        if self._codes is not None:
+            return int8_cosine_scores(quantize_int8(query_unit), self._codes[rows])
+        unit = cast(npt.NDArray[np.float32], self._unit)
+        scores: npt.NDArray[np.float32] = unit[rows] @ query_unit
+        return scores
+
+    def _mask(
+        self,
+        source: str | None,
+        subpart: str | None,
+        section: str | None,
+    ) -> npt.NDArray[np.bool_] | None:
+        """Boolean row mask for the given filters, or None for no filter."""
+        mask: npt.NDArray[np.bool_] | None = None
+        for column, value in (
+            (self._sources, source),
+            (self._subparts, subpart),
+            (self._sections, section),
+        ):
+            if value:
+                matches = column == value
+                mask = matches if mask is None else mask & matches
+        return mask
+
+    def _coarse_candidates(
+        self,
+        query_unit: npt.NDArray[np.float32],
+        rows: npt.NDArray[np.intp],
+        keep: int,
+    ) -> npt.NDArray[np.intp]:
+        """Keep the rows whose sign codes are nearest the query's by Hamming distance."""
+        query_bits = np.packbits(query_unit > 0)
+        distances = _POPCOUNT[self._bits[rows] ^ query_bits].sum(axis=1, dtype=np.int32)
+        return rows[np.argpartition(distances, keep - 1)[:keep]]
+
+    def search(
+        self,
+        query_embedding: npt.NDArray[np.floating] | list[float],
+        source: str | None = None,
+        subpart: str | None = None,
+        section: str | None = None,
+        limit: int = 10,
+    ) -> list[tuple[dict[str, Any], float]]:
+        """
+        Find the most similar chunks.
+
+        Args:
+            query_embedding: Query vector.
+            source: Optional source value filter (e.g. "10cfr712").
+            subpart: Optional subpart value filter (e.g. "subpart_a").
+            section: Optional section filter (e.g. "712.11").
+            limit: Maximum number of results.
+
+        Returns:
+            List of (record, score) tuples, best first, with scores clipped
+            to [0, 1] like VectorStoreService.search. Records are shared
+            and must not be mutated.
+        """
+        if not self._records or limit <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_unit = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        mask = self._mask(source, subpart, section)
+        rows = np.arange(len(self._records)) if mask is None else np.flatnonzero(mask)
+        if rows.size == 0:
+            return []
+
+        keep = limit * _RERANK_OVERSAMPLE
+        if rows.size > COARSE_SEARCH_THRESHOLD and keep < rows.size:
+            rows = self._coarse_candidates(query_unit, rows, keep)
+
+        candidate_scores = self._scores(query_unit, rows)
+        k = min(limit, rows.size)
+        top = np.argpartition(-candidate_scores, k - 1)[:k]
+        top = top[np.argsort(-candidate_scores[top], kind="stable")]
+        return [(self._records[rows[i]], max(0.0, float(candidate_scores[i]))) for i in top]
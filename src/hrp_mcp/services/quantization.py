@@ -0,0 +1,58 @@
+"""Scalar int8 quantization for sentence embeddings.
+
+Embeddings are L2-normalized and scaled by 127 into int8 codes, a 4x
+reduction over float32. Because every vector shares the same scale, the
+int32 dot product of two code vectors divided by 127**2 approximates
+their cosine similarity.
+
+Chroma always stores float32, so the int8 codes are only held in memory,
+by a MemoryIndex built with int8=True.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+INT8_SCALE = 127.0
+
+
+def quantize_int8(embeddings: npt.NDArray[np.floating]) -> npt.NDArray[np.int8]:
+    """
+    Quantize embeddings to int8 codes.
+
+    Args:
+        embeddings: A single vector or a 2-D array of row vectors.
+
+    Returns:
+        int8 array of the same shape with unit-norm rows scaled to [-127, 127].
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    unit = vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+    codes: npt.NDArray[np.int8] = np.rint(unit * INT8_SCALE).astype(np.int8)
+    return codes
+
+
+def dequantize_int8(codes: npt.NDArray[np.int8]) -> npt.NDArray[np.float32]:
+    """Convert int8 codes back to approximately unit-norm float32 vectors."""
+    vectors: npt.NDArray[np.float32] = codes.astype(np.float32) / np.float32(INT8_SCALE)
+    return vectors
+
+
+def int8_cosine_scores(
+    query_codes: npt.NDArray[np.int8],
+    corpus_codes: npt.NDArray[np.int8],
+) -> npt.NDArray[np.float32]:
+    """
+    Approximate cosine similarity between a query and every corpus row.
+
+    Args:
+        query_codes: int8 codes of shape (dim,).
+        corpus_codes: int8 codes of shape (n, dim).
+
+    Returns:
+        float32 array of shape (n,) with similarities in roughly [-1, 1].
+    """
+    # Accumulate in int32 so 384 products of up to 127*127 cannot overflow
+    dots = corpus_codes.astype(np.int32) @ query_codes.astype(np.int32)
+    scores: npt.NDArray[np.float32] = dots.astype(np.float32) / np.float32(INT8_SCALE * INT8_SCALE)
+    return scores
@@ -1,14 +1,81 @@
 """RAG (Retrieval-Augmented Generation) service for HRP regulation search."""
 
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
 from hrp_mcp.models.errors import SectionNotFoundError
 from hrp_mcp.models.regulations import (
     HRPSubpart,
     RegulationChunk,
     SearchResult,
+    SourceType,
 )
 from hrp_mcp.services.embeddings import EmbeddingService
 from hrp_mcp.services.vector_store import VectorStoreService
 
+# Sections are few and static between ingests; keep the most recent ones
+_SECTION_CACHE_SIZE = 128
+# Sections are cached until the next write through this instance, or this
+# many seconds so writes from other processes (re-ingestion) are seen
+_SECTION_CACHE_TTL_SECONDS = 60.0
+_chunk_order = attrgetter("chunk_index")
+
+
+def _chunk_from_metadata(metadata: dict[str, Any]) -> RegulationChunk | None:
+    """Rebuild a RegulationChunk from stored vector store metadata.
+
+    The columns were written from an already validated chunk, so they are
+    trusted and rebuilt with model_construct; only the enums need converting
+    back from their stored values. Section numbers repeat across every chunk
+    of a section and every query, so they are interned to share one string
+    object per section.
+    """
+    content = metadata.get("content")
+    if content is None:
+        return None
+    subpart = metadata.get("subpart")
+    return RegulationChunk.model_construct(
+        id=metadata["id"],
+        source=SourceType(metadata["source"]),
+        subpart=HRPSubpart(subpart) if subpart else None,
+        section=sys.intern(metadata["section"]),
+        title=metadata["title"],
+        content=content,
+        citation=metadata["citation"],
+        chunk_index=metadata["chunk_index"],
+    )
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace so trivially different spellings share a cache entry.
+
+    The tokenizer ignores runs of whitespace, so this never changes the
+    embedding. Case is left alone because not every model is uncased.
+    """
+    return " ".join(query.split())
+
+
+def _to_search_results(results: list[tuple[dict[str, Any], float]]) -> list[SearchResult]:
+    """Convert vector store (metadata, score) pairs to SearchResult objects.
+
+    Chunks come from _chunk_from_metadata and scores are already floats
+    clipped to [0, 1], so results skip validation via model_construct.
+    """
+    search_results: list[SearchResult] = []
+    for metadata, score in results:
+        # Reconstruct RegulationChunk from stored columns
+        chunk = _chunk_from_metadata(metadata)
+        if chunk is not None:
+            search_results.append(SearchResult.model_construct(chunk=chunk, score=score))
+    return search_results
+
 
 class RagService:
     """Retrieval-Augmented Generation service for HRP regulations."""
@@ -27,6 +94,11 @@ class RagService:
         """
         self._embeddings = embedding_service
         self._vector_store = vector_store
+        # section -> (vector store generation, monotonic time stored, chunks
+        # sorted by chunk_index)
+        self._section_cache: OrderedDict[str, tuple[int, float, tuple[RegulationChunk, ...]]] = (
+            OrderedDict()
+        )
 
     async def search(
         self,
@@ -48,7 +120,7 @@ class RagService:
             Ranked list of regulation chunks with relevance scores.
         """
         # Generate query embedding
-        query_embedding = self._embeddings.embed(query)
+        query_embedding = self._embed_query(query)
 
         # Search vector store
         results = self._vector_store.search(
@@ -58,21 +130,70 @@ class RagService:
             limit=limit,
         )
 
-        # Convert to SearchResult objects
-        search_results: list[SearchResult] = []
-        for metadata, score in results:
-            # Reconstruct RegulationChunk from stored JSON
-            full_json = metadata.get("full_json")
-            if full_json:
-                chunk = RegulationChunk.model_validate_json(full_json)
-                search_results.append(
-                    SearchResult(
-                        chunk=chunk,
-                        score=score,
-                    )
-                )
-
-        return search_results
+        return _to_search_results(results)
+
+    async def search_ids(
+        self,
+        query: str,
+        subpart: HRPSubpart | None = None,
+        section: str | None = None,
+        limit: int = 10,
+    ) -> list[tuple[str, float]]:
+        """
+        Lightweight semantic search returning chunk IDs and scores only.
+
+        Intended for callers that re-rank or trim candidates first and then
+        load the survivors with get_chunk().
+
+        Args:
+            query: Natural language search query.
+            subpart: Optional filter (Subpart A or B). None searches all.
+            section: Optional section filter (e.g., "712.11").
+            limit: Maximum number of results to return.
+
+        Returns:
+            Ranked list of (chunk_id, score) tuples.
+        """
+        return self._vector_store.search_ids(
+            self._embed_query(query),
+            subpart=subpart,
+            section=section,
+            limit=limit,
+        )
+
+    async def search_many(
+        self,
+        queries: list[str],
+        subpart: HRPSubpart | None = None,
+        section: str | None = None,
+        limit: int = 10,
+    ) -> list[list[SearchResult]]:
+        """
+        Semantic search for several queries at once.
+
+        All queries are embedded in one model call and sent to the vector
+        store as a single query, sharing the same filters.
+
+        Args:
+            queries: Natural language search queries.
+            subpart: Optional filter (Subpart A or B). None searches all.
+            section: Optional section filter (e.g., "712.11").
+            limit: Maximum number of results per query.
+
+        Returns:
+            One ranked list of results per query, in query order.
+        """
+        if not queries:
+            return []
+
+        query_embeddings = self._embeddings.embed_batch_np([_normalize_query(q) for q in queries])
+        results = self._vector_store.search_many(
+            query_embeddings,
+            subpart=subpart,
+            section=section,
+            limit=limit,
+        )
+        return [_to_search_results(query_results) for query_results in results]
 
     async def search_subpart_a(
         self,
@@ -116,6 +237,39 @@ class RagService:
             limit=limit,
         )
 
+    async def search_both(
+        self,
+        query: str,
+        limit: int = 10,
+    ) -> tuple[list[SearchResult], list[SearchResult]]:
+        """
+        Search Subpart A and Subpart B concurrently with one query embedding.
+
+        Args:
+            query: Natural language search query.
+            limit: Maximum number of results per subpart.
+
+        Returns:
+            (Subpart A results, Subpart B results), each ranked.
+        """
+        query_embedding = self._embed_query(query)
+        # Chroma queries release the GIL, so the two filtered searches overlap
+        results_a, results_b = await asyncio.gather(
+            asyncio.to_thread(
+                self._vector_store.search,
+                query_embedding,
+                subpart=HRPSubpart.SUBPART_A,
+                limit=limit,
+            ),
+            asyncio.to_thread(
+                self._vector_store.search,
+                query_embedding,
+                subpart=HRPSubpart.SUBPART_B,
+                limit=limit,
+            ),
+        )
+        return _to_search_results(results_a), _to_search_results(results_b)
+
     async def get_chunk(self, chunk_id: str) -> RegulationChunk:
         """
         Retrieve a specific regulation chunk by ID.
@@ -134,11 +288,11 @@ class RagService:
         if metadata is None:
             raise SectionNotFoundError(chunk_id)
 
-        full_json = metadata.get("full_json")
-        if not full_json:
+        chunk = _chunk_from_metadata(metadata)
+        if chunk is None:
             raise SectionNotFoundError(chunk_id)
 
-        return RegulationChunk.model_validate_json(full_json)
+        return chunk
 
     async def get_section(self, section: str) -> list[RegulationChunk]:
         """
@@ -147,27 +301,116 @@ class RagService:
         Args:
             section: Section number (e.g., "712.11").
 
+        Sections are cached until the vector store is next written to, or
+        for _SECTION_CACHE_TTL_SECONDS.
+
         Returns:
             List of regulation chunks for the section, ordered by chunk_index.
 
         Raises:
             SectionNotFoundError: If no chunks exist for the section.
         """
+        generation = self._vector_store.generation
+        cached = self._cached_section(section, generation)
+        if cached is not None:
+            return cached
+
         metadata_list = self._vector_store.get_by_section(section)
 
         if not metadata_list:
             raise SectionNotFoundError(section)
 
-        chunks = []
-        for metadata in metadata_list:
-            full_json = metadata.get("full_json")
-            if full_json:
-                chunks.append(RegulationChunk.model_validate_json(full_json))
+        return self._cache_section(section, generation, metadata_list)
+
+    async def get_sections(self, sections: list[str]) -> dict[str, list[RegulationChunk]]:
+        """
+        Retrieve the chunks of several sections with one vector store query.
+
+        Cached sections are served from the section cache and the rest are
+        fetched together.
+
+        Args:
+            sections: Section numbers (e.g., ["712.22", "712.23"]).
+
+        Returns:
+            Mapping of section number to its chunks ordered by chunk_index,
+            in request order. Sections with no chunks are omitted.
+        """
+        generation = self._vector_store.generation
+        found: dict[str, list[RegulationChunk]] = {}
+        missing: list[str] = []
+        for section in dict.fromkeys(sections):
+            cached = self._cached_section(section, generation)
+            if cached is not None:
+                found[section] = cached
+            else:
+                missing.append(section)
+
+        if missing:
+            fetched = self._vector_store.get_by_sections(missing)
+            for section in missing:
+                metadata_list = fetched.get(section)
+                if metadata_list:
+                    found[section] = self._cache_section(section, generation, metadata_list)
+
+        return {section: found[section] for section in dict.fromkeys(sections) if section in found}
+
+    def preload_sections(self, sections: list[str]) -> int:
+        """
+        Load sections into the section cache ahead of the first request.
+
+        Args:
+            sections: Section numbers (e.g., ["712.11", "712.12"]).
+
+        Returns:
+            Number of sections found and cached.
+
+        Raises:
+            VectorStoreError: If the vector store cannot be read.
+        """
+        generation = self._vector_store.generation
+        fetched = self._vector_store.get_by_sections(list(dict.fromkeys(sections)))
+        cached = 0
+        for section, metadata_list in fetched.items():
+            if metadata_list:
+                self._cache_section(section, generation, metadata_list)
+                cached += 1
+        return cached
+
+    def _cached_section(self, section: str, generation: int) -> list[RegulationChunk] | None:
+        """Return a copy of a cached section if it is current, else None."""
+        cached = self._section_cache.get(section)
+        if (
+            cached is None
+            or cached[0] != generation
+            or time.monotonic() - cached[1] >= _SECTION_CACHE_TTL_SECONDS
+        ):
+            return None
+        self._section_cache.move_to_end(section)
+        return list(cached[2])
+
+    def _cache_section(
+        self,
+        section: str,
+        generation: int,
+        metadata_list: list[dict[str, Any]],
+    ) -> list[RegulationChunk]:
+        """Rebuild a section's chunks in chunk_index order and cache them."""
+        chunks = [chunk for chunk in map(_chunk_from_metadata, metadata_list) if chunk is not None]
 
         # Sort by chunk_index
-        chunks.sort(key=lambda c: c.chunk_index)
+        chunks.sort(key=_chunk_order)
+
+        self._section_cache[section] = (generation, time.monotonic(), tuple(chunks))
+        self._section_cache.move_to_end(section)
+        if len(self._section_cache) > _SECTION_CACHE_SIZE:
+            self._section_cache.popitem(last=False)
         return chunks
 
+    def _embed_query(self, query: str) -> npt.NDArray[np.float32]:
+        """Embed a normalized query; repeats are served by the embedding cache."""
+        return self._embeddings.embed_np(_normalize_query(query))
+
     def get_store_count(self, subpart: HRPSubpart | None = None) -> int:
         """Return the number of chunks in the vector store."""
         return self._vector_store.count(subpart)
@@ -1,13 +1,83 @@
 """Vector store service using ChromaDB."""
 
-from typing import Any
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, cast
 
 import chromadb
+import numpy as np
+import numpy.typing as npt
 from chromadb import Collection
 from chromadb.api import ClientAPI
 
 from hrp_mcp.models.errors import VectorStoreError
 from hrp_mcp.models.regulations import HRPSubpart, RegulationChunk, SourceType
+from hrp_mcp.services.memory_index import MemoryIndex
+
+# ChromaDB accepts plain float lists or float32 numpy arrays
+Embedding = list[float] | npt.NDArray[np.float32]
+
+# Chunks per collection.add call; large single adds slow Chroma down
+ADD_BATCH_SIZE = 200
+
+# Subpart-only searches first try an unfiltered query this many times wider
+# and filter in Python, avoiding Chroma's SQLite metadata filter
+_POST_FILTER_OVERSAMPLE = 3
+
+# Counts are cached until the next write through this instance, or this
+# many seconds so writes from other processes are eventually seen
+_COUNT_TTL_SECONDS = 60.0
+
+
+def _chunk_metadata(chunk: RegulationChunk) -> dict[str, Any]:
+    """Scalar metadata stored alongside a chunk; content is the document."""
+    metadata: dict[str, Any] = {
+        "source": chunk.source.value,
+        "section": chunk.section,
+        "title": chunk.title,
+        "citation": chunk.citation,
+        "chunk_index": chunk.chunk_index,
+    }
+    if chunk.subpart:
+        metadata["subpart"] = chunk.subpart.value
+    return metadata
+
+
+@lru_cache(maxsize=256)
+def _build_where(
+    source: SourceType | None,
+    subpart: HRPSubpart | None,
+    section: str | None,
+) -> dict[str, Any] | None:
+    """Build (once per filter combination) the Chroma where clause for a search.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    conditions: list[dict[str, Any]] = []
+    if source:
+        conditions.append({"source": source.value})
+    if subpart:
+        conditions.append({"subpart": subpart.value})
+    if section:
+        conditions.append({"section": section})
+
+    if len(conditions) == 1:
+        return conditions[0]
+    if len(conditions) > 1:
+        return {"$and": conditions}
+    return None
+
+
+def _similarities(distances: Any) -> list[float]:
+    """Convert cosine distances to similarities clipped to [0, 1] in one pass."""
+    similarities = np.maximum(0.0, 1.0 - np.asarray(distances, dtype=np.float64))
+    return cast(list[float], similarities.tolist())
+
+
+def _with_record(metadata: dict[str, Any], chunk_id: str, document: str) -> dict[str, Any]:
+    """Attach the chunk ID and stored document text to a metadata dict."""
+    return {**metadata, "id": chunk_id, "content": document}
 
 
 class VectorStoreService:
@@ -20,12 +90,31 @@ class VectorStoreService:
         """
         Initialize ChromaDB in persistent mode.
 
+        An existing store is opened immediately so the first query does not
+        pay for it; a new store is created lazily on first use.
+
         Args:
             db_path: Path to the ChromaDB storage directory.
         """
         self._db_path = db_path
         self._client: ClientAPI | None = None
         self._collection: Collection | None = None
+        self._generation = 0
+        # (generation it was loaded at, snapshot); see load_into_memory
+        self._memory_index: tuple[int, MemoryIndex] | None = None
+        # subpart -> (generation, monotonic time, count)
+        self._count_cache: dict[HRPSubpart | None, tuple[int, float, int]] = {}
+        if Path(db_path).is_dir():
+            try:
+                self._ensure_ready()
+            except VectorStoreError:
+                # Leave the error to surface from the first operation, where
+                # callers already handle it
+                pass
+
+    def _ensure_ready(self) -> Collection:
+        """Open the client and collection if not already open."""
+        return self.collection
 
     @property
     def client(self) -> ClientAPI:
@@ -39,6 +128,18 @@ class VectorStoreService:
                 ) from e
         return self._client
 
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every write made through this instance."""
+        return self._generation
+
+    def _current_memory_index(self) -> MemoryIndex | None:
+        """Return the in-memory snapshot if no write has happened since it was loaded."""
+        snapshot = self._memory_index
+        if snapshot is None or snapshot[0] != self._generation:
+            return None
+        return snapshot[1]
+
     @property
     def collection(self) -> Collection:
         """Get or create the HRP regulations collection."""
@@ -54,7 +155,7 @@ class VectorStoreService:
                 ) from e
         return self._collection
 
-    def add_chunk(self, chunk: RegulationChunk, embedding: list[float]) -> None:
+    def add_chunk(self, chunk: RegulationChunk, embedding: Embedding) -> None:
         """
         Add a single regulation chunk with its embedding.
 
@@ -66,37 +167,31 @@ class VectorStoreService:
             VectorStoreError: If the operation fails.
         """
         try:
-            metadata = {
-                "source": chunk.source.value,
-                "section": chunk.section,
-                "title": chunk.title,
-                "citation": chunk.citation,
-                "chunk_index": chunk.chunk_index,
-                "full_json": chunk.model_dump_json(),
-            }
-            if chunk.subpart:
-                metadata["subpart"] = chunk.subpart.value
-
             self.collection.add(
                 ids=[chunk.id],
                 embeddings=[embedding],
                 documents=[chunk.content],
-                metadatas=[metadata],
+                metadatas=[_chunk_metadata(chunk)],
             )
+            self._generation += 1
         except Exception as e:
             raise VectorStoreError(f"Failed to add chunk '{chunk.id}': {e}") from e
 
     def add_chunks_batch(
         self,
         chunks: list[RegulationChunk],
-        embeddings: list[list[float]],
+        embeddings: list[list[float]] | npt.NDArray[np.float32],
     ) -> None:
         """
         Add multiple regulation chunks efficiently.
 
+        Large inputs are written in slices of ADD_BATCH_SIZE. A 2-D float32
+        array is passed to Chroma as-is, without boxing every value into a
+        Python float first.
+
         Args:
             chunks: List of chunks to store.
-            embeddings: Corresponding embedding vectors.
+            embeddings: Corresponding embedding vectors, one per chunk.
 
         Raises:
             VectorStoreError: If the operation fails.
@@ -111,32 +206,22 @@ class VectorStoreService:
             return
 
         try:
-            metadatas = []
-            for c in chunks:
-                meta = {
-                    "source": c.source.value,
-                    "section": c.section,
-                    "title": c.title,
-                    "citation": c.citation,
-                    "chunk_index": c.chunk_index,
-                    "full_json": c.model_dump_json(),
-                }
-                if c.subpart:
-                    meta["subpart"] = c.subpart.value
-                metadatas.append(meta)
-
-            self.collection.add(
-                ids=[c.id for c in chunks],
-                embeddings=embeddings,
-                documents=[c.content for c in chunks],
-                metadatas=metadatas,
-            )
+            collection = self.collection
+            for start in range(0, len(chunks), ADD_BATCH_SIZE):
+                batch = chunks[start : start + ADD_BATCH_SIZE]
+                collection.add(
+                    ids=[c.id for c in batch],
+                    embeddings=embeddings[start : start + ADD_BATCH_SIZE],
+                    documents=[c.content for c in batch],
+                    metadatas=[_chunk_metadata(c) for c in batch],
+                )
+                self._generation += 1
         except Exception as e:
             raise VectorStoreError(f"Failed to add batch of {len(chunks)} chunks: {e}") from e
 
     def search(
         self,
-        query_embedding: list[float],
+        query_embedding: Embedding,
         source: SourceType | None = None,
         subpart: HRPSubpart | None = None,
         section: str | None = None,
@@ -154,49 +239,192 @@ class VectorStoreService:
 
         Returns:
             List of (metadata, score) tuples, where score is similarity (0-1).
+            Each metadata dict also carries the chunk "id" and "content".
 
         Raises:
             VectorStoreError: If the search fails.
         """
-        try:
-            # Build where clause
-            conditions = []
-            if source:
-                conditions.append({"source": source.value})
-            if subpart:
-                conditions.append({"subpart": subpart.value})
-            if section:
-                conditions.append({"section": section})
-
-            where: dict[str, Any] | None = None
-            if len(conditions) == 1:
-                where = conditions[0]
-            elif len(conditions) > 1:
-                where = {"$and": conditions}
+        memory_index = self._current_memory_index()
+        if memory_index is not None:
+            return memory_index.search(
+                query_embedding,
+                source=source.value if source else None,
+                subpart=subpart.value if subpart else None,
+                section=section,
+                limit=limit,
+            )
 
+        if source is None and section is None:
+            if subpart is None:
+                return self._search_unfiltered(query_embedding, limit)
+
+            candidate_limit = limit * _POST_FILTER_OVERSAMPLE
+            candidates = self._search_unfiltered(query_embedding, candidate_limit)
+            matches = [c for c in candidates if c[0].get("subpart") == subpart.value]
+            # Exact unless the widened query was cut off before enough matches;
+            # then fall back to the filtered query below
+            if len(matches) >= limit or len(candidates) < candidate_limit:
+                return matches[:limit]
+
+        return self.search_many(
+            [query_embedding],
+            source=source,
+            subpart=subpart,
+            section=section,
+            limit=limit,
+        )[0]
+
+    def _search_unfiltered(
+        self,
+        query_embedding: Embedding,
+        limit: int,
+    ) -> list[tuple[dict[str, Any], float]]:
+        """Single query with no where clause, the cheapest Chroma query path."""
+        try:
             results = self.collection.query(
                 query_embeddings=[query_embedding],
                 n_results=limit,
-                where=where,
-                include=["metadatas", "distances"],
+                include=["metadatas", "documents", "distances"],
             )
+        except Exception as e:
+            raise VectorStoreError(f"Search failed: {e}") from e
 
-            all_results: list[tuple[dict[str, Any], float]] = []
-            if results["metadatas"] and results["distances"]:
-                for metadata, distance in zip(
-                    results["metadatas"][0],
-                    results["distances"][0],
-                    strict=True,
-                ):
-                    # Cosine distance to similarity: similarity = 1 - distance
-                    similarity = max(0.0, 1.0 - distance)
-                    all_results.append((metadata, similarity))
+        if not (results["metadatas"] and results["documents"] and results["distances"]):
+            return []
+        return [
+            (_with_record(metadata, chunk_id, document), similarity)
+            for chunk_id, metadata, document, similarity in zip(
+                results["ids"][0],
+                results["metadatas"][0],
+                results["documents"][0],
+                _similarities(results["distances"][0]),
+                strict=True,
+            )
+        ]
 
-            return all_results
+    def search_many(
+        self,
+        query_embeddings: list[Embedding] | npt.NDArray[np.float32],
+        source: SourceType | None = None,
+        subpart: HRPSubpart | None = None,
+        section: str | None = None,
+        limit: int = 10,
+    ) -> list[list[tuple[dict[str, Any], float]]]:
+        """
+        Search for several query vectors in a single collection query.
+
+        All queries share the same filters.
+
+        Args:
+            query_embeddings: Query vectors (a list, or a 2-D array of rows).
+            source: Optional source filter (10cfr712, 10cfr710, etc.).
+            subpart: Optional subpart filter (A or B) - for 712 only.
+            section: Optional section filter (e.g., "712.11").
+            limit: Maximum number of results per query.
+
+        Returns:
+            One list of (metadata, score) tuples per query, in query order.
+
+        Raises:
+            VectorStoreError: If the search fails.
+        """
+        if len(query_embeddings) == 0:
+            return []
+
+        memory_index = self._current_memory_index()
+        if memory_index is not None:
+            return [
+                memory_index.search(
+                    query_embedding,
+                    source=source.value if source else None,
+                    subpart=subpart.value if subpart else None,
+                    section=section,
+                    limit=limit,
+                )
+                for query_embedding in query_embeddings
+            ]
+
+        try:
+            results = self.collection.query(
+                query_embeddings=list(query_embeddings),
+                n_results=limit,
+                where=_build_where(source, subpart, section),
+                include=["metadatas", "documents", "distances"],
+            )
+
+            if not (results["metadatas"] and results["documents"] and results["distances"]):
+                return [[] for _ in query_embeddings]
+
+            return [
+                [
+                    (_with_record(metadata, chunk_id, document), similarity)
+                    for chunk_id, metadata, document, similarity in zip(
+                        results["ids"][i],
+                        results["metadatas"][i],
+                        results["documents"][i],
+                        _similarities(results["distances"][i]),
+                        strict=True,
+                    )
+                ]
+                for i in range(len(query_embeddings))
+            ]
 
         except Exception as e:
             raise VectorStoreError(f"Search failed: {e}") from e
 
+    def search_ids(
+        self,
+        query_embedding: Embedding,
+        source: SourceType | None = None,
+        subpart: HRPSubpart | None = None,
+        section: str | None = None,
+        limit: int = 10,
+    ) -> list[tuple[str, float]]:
+        """
+        Search for similar chunks, returning only IDs and scores.
+
+        Skips transferring metadata and documents; use get_by_id to load
+        the chunks that are actually needed (e.g. after re-ranking).
+
+        Args:
+            query_embedding: Query vector.
+            source: Optional source filter (10cfr712, 10cfr710, etc.).
+            subpart: Optional subpart filter (A or B) - for 712 only.
+            section: Optional section filter (e.g., "712.11").
+            limit: Maximum number of results.
+
+        Returns:
+            List of (chunk_id, score) tuples, where score is similarity (0-1).
+
+        Raises:
+            VectorStoreError: If the search fails.
+        """
+        memory_index = self._current_memory_index()
+        if memory_index is not None:
+            return [
+                (record["id"], score)
+                for record, score in memory_index.search(
+                    query_embedding,
+                    source=source.value if source else None,
+                    subpart=subpart.value if subpart else None,
+                    section=section,
+                    limit=limit,
+                )
+            ]
+
+        try:
+            results = self.collection.query(
+                query_embeddings=[query_embedding],
+                n_results=limit,
+                where=_build_where(source, subpart, section),
+                include=["distances"],
+            )
+            if not results["distances"]:
+                return []
+            return list(zip(results["ids"][0], _similarities(results["distances"][0]), strict=True))
+        except Exception as e:
+            raise VectorStoreError(f"Search failed: {e}") from e
+
     def get_by_id(self, chunk_id: str) -> dict[str, Any] | None:
         """
         Get a chunk by exact ID match.
@@ -205,7 +433,7 @@ class VectorStoreService:
             chunk_id: Chunk identifier.
 
         Returns:
-            Chunk metadata dict or None if not found.
+            Chunk metadata dict (with "id" and "content") or None if not found.
 
         Raises:
             VectorStoreError: If the operation fails.
@@ -213,10 +441,12 @@ class VectorStoreService:
         try:
             results = self.collection.get(
                 ids=[chunk_id],
-                include=["metadatas"],
+                include=["metadatas", "documents"],
             )
-            if results["metadatas"]:
-                return results["metadatas"][0]
+            if results["metadatas"] and results["documents"]:
+                return _with_record(
+                    results["metadatas"][0], results["ids"][0], results["documents"][0]
+                )
             return None
 
         except Exception as e:
@@ -230,7 +460,7 @@ class VectorStoreService:
             section: Section number (e.g., "712.11").
 
         Returns:
-            List of chunk metadata dicts.
+            List of chunk metadata dicts, each with "id" and "content".
 
         Raises:
             VectorStoreError: If the operation fails.
@@ -238,44 +468,173 @@ class VectorStoreService:
         try:
             results = self.collection.get(
                 where={"section": section},
-                include=["metadatas"],
+                include=["metadatas", "documents"],
             )
-            return results["metadatas"] if results["metadatas"] else []
+            if not results["metadatas"] or not results["documents"]:
+                return []
+            return [
+                _with_record(metadata, chunk_id, document)
+                for chunk_id, metadata, document in zip(
+                    results["ids"], results["metadatas"], results["documents"], strict=True
+                )
+            ]
 
         except Exception as e:
             raise VectorStoreError(f"Failed to get section '{section}': {e}") from e
 
+    def get_by_sections(self, sections: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get all chunks for several sections in one query.
+
+        Args:
+            sections: Section numbers (e.g., ["712.22", "712.23"]).
+
+        Returns:
+            Mapping of section number to its chunk metadata dicts, each with
+            "id" and "content". Sections without chunks are omitted.
+
+        Raises:
+            VectorStoreError: If the operation fails.
+        """
+        unique = list(dict.fromkeys(sections))
+        if not unique:
+            return {}
+        where: dict[str, Any] = (
+            {"section": unique[0]} if len(unique) == 1 else {"section": {"$in": unique}}
+        )
+        try:
+            results = self.collection.get(where=where, include=["metadatas", "documents"])
+            by_section: dict[str, list[dict[str, Any]]] = {}
+            if not results["metadatas"] or not results["documents"]:
+                return by_section
+            for chunk_id, metadata, document in zip(
+                results["ids"], results["metadatas"], results["documents"], strict=True
+            ):
+                record = _with_record(metadata, chunk_id, document)
+                by_section.setdefault(record["section"], []).append(record)
+            return by_section
+
+        except Exception as e:
+            raise VectorStoreError(f"Failed to get sections {unique}: {e}") from e
+
     def count(self, subpart: HRPSubpart | None = None) -> int:
         """
         Return the total number of chunks in the store.
 
+        Counts are cached per subpart; see _COUNT_TTL_SECONDS.
+
         Args:
             subpart: Optional subpart to count. None counts all.
 
         Returns:
             Number of stored chunks.
         """
+        now = time.monotonic()
+        cached = self._count_cache.get(subpart)
+        if (
+            cached is not None
+            and cached[0] == self._generation
+            and now - cached[1] < _COUNT_TTL_SECONDS
+        ):
+            return cached[2]
+
         if subpart is None:
-            return self.collection.count()
+            total = self.collection.count()
+        else:
+            try:
+                # include=[] fetches IDs only, no metadatas or documents
+                results = self.collection.get(
+                    where=_build_where(None, subpart, None),
+                    include=[],
+                )
+            except Exception:
+                return 0
+            total = len(results["ids"]) if results["ids"] else 0
+
+        self._count_cache[subpart] = (self._generation, now, total)
+        return total
 
+    def warm_up(self) -> None:
+        """
+        Run one small read and query so the first real search is not cold.
+
+        Pulls the HNSW index and SQLite metadata pages into memory. Does
+        nothing for an empty store or while the in-memory index is current.
+
+        Raises:
+            VectorStoreError: If the store cannot be read.
+        """
+        if self._current_memory_index() is not None:
+            return
         try:
-            results = self.collection.get(
-                where={"subpart": subpart.value},
-                include=[],
+            sample = self.collection.get(limit=1, include=["embeddings"])
+            embeddings = sample["embeddings"]
+            if embeddings is None or len(embeddings) == 0:
+                return
+            self.collection.query(
+                query_embeddings=[embeddings[0]],
+                n_results=1,
+                include=["metadatas", "documents", "distances"],
             )
-            return len(results["ids"]) if results["ids"] else 0
-        except Exception:
-            return 0
+        except Exception as e:
+            raise VectorStoreError(f"Warm-up failed: {e}") from e
+
+    def load_into_memory(self, int8: bool = False) -> MemoryIndex:
+        """
+        Load every stored chunk and embedding into an in-memory index.
+
+        Until the next write through this instance, search, search_many and
+        search_ids are answered from the snapshot without querying Chroma.
+        Writes made by other processes (e.g. a separate ingest run) are not
+        seen; reload after re-ingesting.
+
+        Args:
+            int8: Hold embeddings as int8 codes, a quarter of the memory,
+                  with approximate scores.
+
+        Returns:
+            The loaded MemoryIndex.
+
+        Raises:
+            VectorStoreError: If the collection cannot be read.
+        """
+        try:
+            results = self.collection.get(include=["metadatas", "documents", "embeddings"])
+        except Exception as e:
+            raise VectorStoreError(f"Failed to load collection into memory: {e}") from e
+
+        ids = results["ids"] or []
+        if len(ids) == 0:
+            index = MemoryIndex([], np.empty((0, 0), dtype=np.float32), int8=int8)
+        else:
+            records = [
+                _with_record(metadata, chunk_id, document)
+                for chunk_id, metadata, document in zip(
+                    ids, results["metadatas"], results["documents"], strict=True
+                )
+            ]
+            index = MemoryIndex(
+                records, np.asarray(results["embeddings"], dtype=np.float32), int8=int8
+            )
+
+        self._memory_index = (self._generation, index)
+        return index
 
     def delete_all(self) -> None:
         """
         Delete all chunks from the collection.
 
+        Drops the collection rather than deleting IDs one by one; it is
+        recreated empty (with the same settings) on next access.
+
         Warning: Use with caution.
         """
         try:
-            all_ids = self.collection.get()["ids"]
-            if all_ids:
-                self.collection.delete(ids=all_ids)
+            # Resolve first so the drop never targets a missing collection
+            self._ensure_ready()
+            self.client.delete_collection(self.HRP_COLLECTION)
         except Exception as e:
             raise VectorStoreError(f"Failed to delete chunks: {e}") from e
+        finally:
+            self._collection = None
+            self._generation += 1
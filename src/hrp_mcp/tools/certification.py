@@ -4,23 +4,61 @@ Provides tools for HRP certification requirements, position types,
 and disqualifying factors.
 """
 
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+from hrp_mcp._matcher import KeywordMatcher, normalize_description
 from hrp_mcp.audit import audit_log
-from hrp_mcp.models.hrp import DisqualifyingFactor
 from hrp_mcp.resources.reference_data import (
     CERTIFICATION_COMPONENTS,
+    DISQUALIFYING_FACTORS,
     HRP_POSITION_TYPES,
-    get_disqualifying_factor,
     get_position_type,
 )
 from hrp_mcp.server import mcp
 
+# Response forms of the static reference data, built once; responses get
+# shallow list copies, so the dicts inside are shared and must not be mutated
+_COMPONENT_DICTS = tuple(comp.to_dict() for comp in CERTIFICATION_COMPONENTS.values())
+_POSITION_TYPE_DICTS = tuple(pos_info.to_dict() for pos_info in HRP_POSITION_TYPES.values())
+_VALID_POSITION_TYPES = tuple(HRP_POSITION_TYPES)
+# Requirements for every HRP position (712.11)
+_GENERAL_REQUIREMENTS = (
+    "Completion of initial HRP instruction",
+    "Successful completion of supervisory review",
+    "Successful completion of medical assessment",
+    "Successful completion of management evaluation",
+    "Successful completion of DOE personnel security review",
+    "No use of hallucinogens in the preceding 5 years",
+    "No flashback from hallucinogen use",
+    "Initial drug test with negative result",
+    "Initial alcohol test with negative result",
+    "For designated positions: successful counterintelligence evaluation (may include polygraph)",
+)
+# Position-specific fields of get_certification_requirements, per position type
+_POSITION_REQUIREMENT_FIELDS = {
+    pos_info.position_type: {
+        "position_type": pos_info.position_type.value,
+        "position_title": pos_info.title,
+        "specific_requirements": list(pos_info.requirements),
+        "access_type": pos_info.access_type,
+    }
+    for pos_info in HRP_POSITION_TYPES.values()
+}
+# Shared by every response listing the factor, so must not be mutated
+_FACTOR_DICT_BY_ID = {fid: factor.to_dict() for fid, factor in DISQUALIFYING_FACTORS.items()}
+_GUIDANCE_LINE_BY_ID = {
+    fid: f"{factor.name}: {factor.evaluation_guidance}"
+    for fid, factor in DISQUALIFYING_FACTORS.items()
+}
+
 # --- Disqualifying Factor Evaluation Helpers ---
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FactorMatcher:
     """Configuration for matching a disqualifying factor."""
 
@@ -84,74 +122,108 @@ FACTOR_MATCHERS: list[FactorMatcher] = [
 ]
 
 HALLUCINOGEN_KEYWORDS = ("hallucinogen", "lsd", "mushroom", "psilocybin", "mescaline", "peyote")
+FLASHBACK_KEYWORD = "flashback"
 
+# "1 year" through "5 years", but not the tail of "15 years" or "25 years"
+_WITHIN_5_YEARS_RE = re.compile(r"\b[1-5]\s*year")
 
-def _contains_any(text: str, keywords: tuple[str, ...]) -> bool:
-    """Check if text contains any of the keywords."""
-    return any(keyword in text for keyword in keywords)
+# Distinct normalized descriptions whose evaluation is kept
+_EVALUATION_CACHE_SIZE = 1024
 
+# Every keyword any check looks for, scanned in one pass per description
+_KEYWORD_MATCHER = KeywordMatcher(
+    [*HALLUCINOGEN_KEYWORDS, FLASHBACK_KEYWORD]
+    + [kw for m in FACTOR_MATCHERS for kw in m.keywords + (m.secondary_keywords or ())]
+)
+_matched_keywords = _KEYWORD_MATCHER.scan
+
+# Per-matcher keyword sets, tested against the scanned keywords with isdisjoint;
+# matchers for factors missing from the reference data are dropped here once
+_HALLUCINOGEN_KEYWORD_SET = frozenset(HALLUCINOGEN_KEYWORDS)
+_FACTOR_KEYWORD_SETS = tuple(
+    (matcher, frozenset(matcher.keywords), frozenset(matcher.secondary_keywords or ()))
+    for matcher in FACTOR_MATCHERS
+    if matcher.factor_id in DISQUALIFYING_FACTORS
+)
+_HAS_HALLUCINOGEN_USE = "hallucinogen_use" in DISQUALIFYING_FACTORS
+_HAS_HALLUCINOGEN_FLASHBACK = "hallucinogen_flashback" in DISQUALIFYING_FACTORS
 
-def _check_hallucinogen_factors(factor_lower: str) -> list[tuple[DisqualifyingFactor, bool]]:
+
+def _check_hallucinogen_factors(factor_lower: str) -> tuple[tuple[str, bool], ...]:
     """
     Check for hallucinogen-related disqualifying factors.
 
-    Returns list of (factor, is_absolute) tuples.
+    Returns tuple of (factor_id, is_absolute) pairs.
     """
-    results: list[tuple[DisqualifyingFactor, bool]] = []
+    hits = _matched_keywords(factor_lower)
+    if _HALLUCINOGEN_KEYWORD_SET.isdisjoint(hits):
+        return ()
 
-    if not _contains_any(factor_lower, HALLUCINOGEN_KEYWORDS):
-        return results
+    results: list[tuple[str, bool]] = []
 
     # Check for use within 5 years (absolute disqualifier)
-    within_5_years = "5 year" in factor_lower or any(
-        f"{i} year" in factor_lower for i in range(1, 5)
-    )
-    if within_5_years:
-        factor = get_disqualifying_factor("hallucinogen_use")
-        if factor:
-            results.append((factor, True))
+    if _HAS_HALLUCINOGEN_USE and _WITHIN_5_YEARS_RE.search(factor_lower):
+        results.append(("hallucinogen_use", True))
 
     # Check for flashback (absolute disqualifier)
-    if "flashback" in factor_lower:
-        factor = get_disqualifying_factor("hallucinogen_flashback")
-        if factor:
-            results.append((factor, True))
+    if _HAS_HALLUCINOGEN_FLASHBACK and FLASHBACK_KEYWORD in hits:
+        results.append(("hallucinogen_flashback", True))
 
-    return results
+    return tuple(results)
 
 
-def _check_standard_factors(factor_lower: str) -> list[tuple[DisqualifyingFactor, bool]]:
+def _check_standard_factors(factor_lower: str) -> tuple[tuple[str, bool], ...]:
     """
     Check for standard (non-hallucinogen) disqualifying factors.
 
-    Returns list of (factor, is_absolute) tuples.
+    Returns tuple of (factor_id, is_absolute) pairs.
+    """
+    hits = _matched_keywords(factor_lower)
+    return tuple(
+        (matcher.factor_id, matcher.is_absolute)
+        for matcher, keywords, secondary_keywords in _FACTOR_KEYWORD_SETS
+        # Secondary keywords, when given, must match as well
+        if not keywords.isdisjoint(hits)
+        and not (secondary_keywords and secondary_keywords.isdisjoint(hits))
+    )
+
+
+def _merge_matches(matches: Iterable[tuple[str, bool]]) -> tuple[tuple[str, bool], ...]:
     """
-    results: list[tuple[DisqualifyingFactor, bool]] = []
+    Collapse repeated factor ids, keeping first-match order.
 
-    for matcher in FACTOR_MATCHERS:
-        if not _contains_any(factor_lower, matcher.keywords):
-            continue
+    A factor reported by several matchers is absolute if any of them is.
+    """
+    merged: dict[str, bool] = {}
+    for factor_id, is_absolute in matches:
+        merged[factor_id] = merged.get(factor_id, False) or is_absolute
+    return tuple(merged.items())
 
-        # Check secondary keywords if required
-        if matcher.secondary_keywords and not _contains_any(
-            factor_lower, matcher.secondary_keywords
-        ):
-            continue
 
-        factor = get_disqualifying_factor(matcher.factor_id)
-        if factor:
-            results.append((factor, matcher.is_absolute))
+@lru_cache(maxsize=_EVALUATION_CACHE_SIZE)
+def _evaluate_factors(factor_lower: str) -> tuple[tuple[str, bool], ...]:
+    """
+    Run both factor checks on a description from normalize_description.
 
-    return results
+    Each factor id appears once. The result depends only on the text and
+    static reference data, so it is cached; repeated descriptions skip
+    matching entirely.
+    """
+    return _merge_matches(
+        _check_hallucinogen_factors(factor_lower) + _check_standard_factors(factor_lower)
+    )
 
 
 def _build_disqualifying_response(
     factor_description: str,
-    matching_factors: list[dict[str, Any]],
+    factor_ids: list[str],
     is_absolute: bool,
 ) -> dict[str, Any]:
-    """Build the response dictionary for disqualifying factor evaluation."""
-    if not matching_factors:
+    """Build the response dictionary for disqualifying factor evaluation.
+
+    Factor dicts and guidance lines come from tables built at import.
+    """
+    if not factor_ids:
         return {
             "factor_description": factor_description,
             "matching_factors": [],
@@ -161,10 +233,6 @@ def _build_disqualifying_response(
             "disclaimer": "This is informational guidance only. All HRP eligibility determinations must be made by authorized HRP officials.",
         }
 
-    guidance_lines = [
-        f"{match['name']}: {match['evaluation_guidance']}" for match in matching_factors
-    ]
-
     recommendation = (
         "Immediate consultation with HRP management official required."
         if is_absolute
@@ -173,9 +241,9 @@ def _build_disqualifying_response(
 
     return {
         "factor_description": factor_description,
-        "matching_factors": matching_factors,
+        "matching_factors": [_FACTOR_DICT_BY_ID[fid] for fid in factor_ids],
         "is_absolute_disqualifier": is_absolute,
-        "guidance": "\n".join(guidance_lines),
+        "guidance": "\n".join([_GUIDANCE_LINE_BY_ID[fid] for fid in factor_ids]),
         "recommendation": recommendation,
         "disclaimer": "This is informational guidance only. All HRP eligibility determinations must be made by authorized HRP officials.",
     }
@@ -183,7 +251,7 @@ def _build_disqualifying_response(
 
 @mcp.tool()
 @audit_log
-async def get_certification_requirements(position_type: str | None = None) -> dict[str, Any]:
+def get_certification_requirements(position_type: str | None = None) -> dict[str, Any]:
     """
     Get the requirements for initial HRP certification per 10 CFR 712.11.
 
@@ -207,61 +275,26 @@ async def get_certification_requirements(position_type: str | None = None) -> di
         - four_components: The four annual certification components
         - section: CFR section reference
     """
-    general_requirements = [
-        "Completion of initial HRP instruction",
-        "Successful completion of supervisory review",
-        "Successful completion of medical assessment",
-        "Successful completion of management evaluation",
-        "Successful completion of DOE personnel security review",
-        "No use of hallucinogens in the preceding 5 years",
-        "No flashback from hallucinogen use",
-        "Initial drug test with negative result",
-        "Initial alcohol test with negative result",
-        "For designated positions: successful counterintelligence evaluation (may include polygraph)",
-    ]
-
-    # Get four components
-    components = []
-    for comp in CERTIFICATION_COMPONENTS.values():
-        components.append(comp.to_dict())
-
     result = {
         "section": "712.11",
         "citation": "10 CFR 712.11",
-        "general_requirements": general_requirements,
-        "four_components": components,
+        "general_requirements": list(_GENERAL_REQUIREMENTS),
+        "four_components": list(_COMPONENT_DICTS),
     }
 
     if position_type:
         pos_info = get_position_type(position_type)
         if pos_info:
-            result["position_type"] = pos_info.position_type.value
-            result["position_title"] = pos_info.title
-            result["specific_requirements"] = pos_info.requirements
-            result["access_type"] = pos_info.access_type
+            result.update(_POSITION_REQUIREMENT_FIELDS[pos_info.position_type])
         else:
             result["position_type_error"] = f"Unknown position type: {position_type}"
-            result["valid_types"] = list(HRP_POSITION_TYPES.keys())
+            result["valid_types"] = list(_VALID_POSITION_TYPES)
 
     return result
 
 
-@mcp.tool()
-@audit_log
-async def get_recertification_requirements() -> dict[str, Any]:
-    """
-    Get the requirements for annual HRP recertification per 10 CFR 712.12.
-
-    Retrieve the requirements for maintaining HRP certification through
-    annual recertification.
-
-    Returns:
-        Recertification requirements including:
-        - annual_requirements: List of annual requirements
-        - four_components: The four components that must be completed annually
-        - random_testing: Random testing requirements
-        - section: CFR section reference
-    """
+def _build_recertification_requirements() -> dict[str, Any]:
+    """Build the get_recertification_requirements response."""
     annual_requirements = [
         "Annual completion of HRP instruction",
         "Successful annual supervisory review",
@@ -274,15 +307,11 @@ async def get_recertification_requirements() -> dict[str, Any]:
         "Immediate reporting of any safety or security concerns",
     ]
 
-    components = []
-    for comp in CERTIFICATION_COMPONENTS.values():
-        components.append(comp.to_dict())
-
     return {
         "section": "712.12",
         "citation": "10 CFR 712.12",
         "annual_requirements": annual_requirements,
-        "four_components": components,
+        "four_components": list(_COMPONENT_DICTS),
         "random_testing": {
             "drug_testing": "At least once every 12 months from previous test",
             "alcohol_testing": "At least once every 12 months from previous test",
@@ -292,9 +321,34 @@ async def get_recertification_requirements() -> dict[str, Any]:
     }
 
 
+# No-argument responses depend only on static reference data; each is built
+# once at import and returned as a shallow copy, so nested lists and dicts
+# are shared between calls and must not be mutated
+_RECERTIFICATION_REQUIREMENTS = _build_recertification_requirements()
+
+
+@mcp.tool()
+@audit_log
+def get_recertification_requirements() -> dict[str, Any]:
+    """
+    Get the requirements for annual HRP recertification per 10 CFR 712.12.
+
+    Retrieve the requirements for maintaining HRP certification through
+    annual recertification.
+
+    Returns:
+        Recertification requirements including:
+        - annual_requirements: List of annual requirements
+        - four_components: The four components that must be completed annually
+        - random_testing: Random testing requirements
+        - section: CFR section reference
+    """
+    return dict(_RECERTIFICATION_REQUIREMENTS)
+
+
 @mcp.tool()
 @audit_log
-async def check_disqualifying_factors(factor_description: str) -> dict[str, Any]:
+def check_disqualifying_factors(factor_description: str) -> dict[str, Any]:
     """
     Evaluate potential disqualifying factors for HRP certification.
 
@@ -317,21 +371,36 @@ async def check_disqualifying_factors(factor_description: str) -> dict[str, Any]
         - guidance: Guidance on how the factor is typically evaluated
         - recommendation: Recommended next steps
     """
-    factor_lower = factor_description.lower()
+    # Collect matching factors from both checkers, noting in the same pass
+    # whether any is an absolute disqualifier
+    factor_ids: list[str] = []
+    is_absolute = False
+    for factor_id, factor_is_absolute in _evaluate_factors(
+        normalize_description(factor_description)
+    ):
+        factor_ids.append(factor_id)
+        is_absolute = is_absolute or factor_is_absolute
+
+    return _build_disqualifying_response(factor_description, factor_ids, is_absolute)
+
 
-    # Collect all matching factors from both checkers
-    all_matches = _check_hallucinogen_factors(factor_lower) + _check_standard_factors(factor_lower)
+def _build_hrp_position_types() -> dict[str, Any]:
+    """Build the get_hrp_position_types response."""
+    return {
+        "section": "712.10",
+        "citation": "10 CFR 712.10",
+        "title": "Designation of HRP positions",
+        "position_types": list(_POSITION_TYPE_DICTS),
+        "note": "DOE/NNSA sites may designate additional positions as HRP positions based on specific site requirements and national security considerations.",
+    }
 
-    # Convert to dicts and determine if any are absolute disqualifiers
-    matching_factors = [factor.to_dict() for factor, _ in all_matches]
-    is_absolute = any(is_abs for _, is_abs in all_matches)
 
-    return _build_disqualifying_response(factor_description, matching_factors, is_absolute)
+_HRP_POSITION_TYPES = _build_hrp_position_types()
 
 
 @mcp.tool()
 @audit_log
-async def get_hrp_position_types() -> dict[str, Any]:
+def get_hrp_position_types() -> dict[str, Any]:
     """
     Get information about all HRP position types per 10 CFR 712.10.
 
@@ -343,14 +412,4 @@ async def get_hrp_position_types() -> dict[str, Any]:
         - section: CFR section reference
         - position_types: List of all position types with details
     """
-    position_types = []
-    for pos_info in HRP_POSITION_TYPES.values():
-        position_types.append(pos_info.to_dict())
-
-    return {
-        "section": "712.10",
-        "citation": "10 CFR 712.10",
-        "title": "Designation of HRP positions",
-        "position_types": position_types,
-        "note": "DOE/NNSA sites may designate additional positions as HRP positions based on specific site requirements and national security considerations.",
-    }
+    return dict(_HRP_POSITION_TYPES)
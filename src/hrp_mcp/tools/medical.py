@@ -3,9 +3,12 @@
 Provides tools for HRP medical standards from Subpart B.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
+from hrp_mcp._matcher import KeywordMatcher, normalize_description
 from hrp_mcp.audit import audit_log
 from hrp_mcp.resources.reference_data import (
     MEDICAL_STANDARDS,
@@ -14,16 +17,46 @@ from hrp_mcp.resources.reference_data import (
 )
 from hrp_mcp.server import mcp
 
+# Response forms of the static reference data, built once and shared between
+# responses, so they must not be mutated; standards are keyed by the IDs
+# CONDITION_MATCHERS refer to
+_STANDARD_DICTS = {key: standard.to_dict() for key, standard in MEDICAL_STANDARDS.items()}
+_ALL_STANDARD_DICTS = tuple(_STANDARD_DICTS.values())
+
+
+def _build_standards_by_category() -> dict[str, tuple[dict[str, Any], ...]]:
+    """Map every accepted category filter to its matching standard dicts.
+
+    A filter matches a standard when it equals the standard's category or
+    occurs anywhere in its key, so each category and every substring of every
+    key is precomputed as an alias.
+    """
+    aliases = {standard.category for standard in MEDICAL_STANDARDS.values()}
+    for key in MEDICAL_STANDARDS:
+        aliases.update(key[i:j] for i in range(len(key) + 1) for j in range(i, len(key) + 1))
+    by_category: dict[str, tuple[dict[str, Any], ...]] = {}
+    for alias in aliases:
+        by_category[alias] = tuple(
+            _STANDARD_DICTS[key]
+            for key, standard in MEDICAL_STANDARDS.items()
+            if standard.category == alias or alias in key
+        )
+    return by_category
+
+
+# Normalized category filter -> matching standards, in MEDICAL_STANDARDS order
+_STANDARDS_BY_CATEGORY = _build_standards_by_category()
+
 # --- Medical Condition Evaluation Helpers ---
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConditionMatcher:
     """Configuration for matching a medical condition to standards."""
 
     standard_id: str
     keywords: tuple[str, ...]
-    considerations: list[str] = field(default_factory=list)
+    considerations: tuple[str, ...] = ()
 
 
 # Keyword mappings for medical condition evaluation
@@ -31,13 +64,13 @@ CONDITION_MATCHERS: list[ConditionMatcher] = [
     ConditionMatcher(
         standard_id="psychological_evaluation",
         keywords=("depression", "anxiety", "bipolar", "ptsd", "psychiatric", "mental"),
-        considerations=[
+        considerations=(
             "Current symptom status and stability",
             "Medication regimen and compliance",
             "Treatment history and response",
             "Impact on job performance",
             "Risk of decompensation under stress",
-        ],
+        ),
     ),
     ConditionMatcher(
         standard_id="physical_examination",
@@ -52,24 +85,24 @@ CONDITION_MATCHERS: list[ConditionMatcher] = [
             "back",
             "injury",
         ),
-        considerations=[
+        considerations=(
             "Condition stability and control",
             "Medication side effects",
             "Risk of sudden incapacitation",
             "Ability to perform essential job functions",
             "Need for accommodations",
-        ],
+        ),
     ),
     ConditionMatcher(
         standard_id="substance_use",
         keywords=("alcohol", "drug", "substance", "addiction", "recovery"),
-        considerations=[
+        considerations=(
             "Duration of sobriety/recovery",
             "Participation in treatment program",
             "Ongoing support system",
             "Risk of relapse",
             "Compliance with random testing",
-        ],
+        ),
     ),
 ]
 
@@ -79,6 +112,9 @@ DEFAULT_CONSIDERATIONS = [
     "Risk assessment for self and others",
 ]
 
+# Distinct normalized conditions whose evaluation is kept
+_EVALUATION_CACHE_SIZE = 1024
+
 EVALUATION_PROCESS = [
     "Review of medical documentation",
     "Physical examination by Designated Physician",
@@ -87,38 +123,74 @@ EVALUATION_PROCESS = [
     "Determination of fitness for duty",
 ]
 
+# Every condition keyword, scanned in one pass per description
+_KEYWORD_MATCHER = KeywordMatcher(kw for m in CONDITION_MATCHERS for kw in m.keywords)
+_matched_keywords = _KEYWORD_MATCHER.scan
+
 
-def _contains_any(text: str, keywords: tuple[str, ...]) -> bool:
-    """Check if text contains any of the keywords."""
-    return any(keyword in text for keyword in keywords)
+def _build_keyword_index(matchers: list[ConditionMatcher]) -> dict[str, tuple[int, ...]]:
+    """Map each keyword to the indices of the matchers listing it."""
+    index: dict[str, list[int]] = {}
+    for position, matcher in enumerate(matchers):
+        for keyword in matcher.keywords:
+            index.setdefault(keyword, []).append(position)
+    return {keyword: tuple(positions) for keyword, positions in index.items()}
+
+
+# keyword -> indices of the CONDITION_MATCHERS entries listing it
+_KEYWORD_TO_MATCHERS = _build_keyword_index(CONDITION_MATCHERS)
+
+
+@lru_cache(maxsize=32)
+def _considerations_for(matcher_indices: tuple[int, ...]) -> tuple[str, ...]:
+    """Concatenate the considerations of the given CONDITION_MATCHERS entries."""
+    return tuple(chain.from_iterable(CONDITION_MATCHERS[i].considerations for i in matcher_indices))
 
 
 def _find_matching_standards(
     condition_lower: str,
-) -> tuple[list[dict[str, Any]], list[str]]:
+) -> tuple[list[dict[str, Any]], tuple[str, ...]]:
     """
     Find medical standards and considerations matching the condition.
 
-    Returns tuple of (standards list, considerations list).
+    Returns tuple of (standards list, considerations tuple). The
+    considerations tuple is shared between calls with the same matches.
     """
     standards: list[dict[str, Any]] = []
-    considerations: list[str] = []
+    used_indices: list[int] = []
     matched_standard_ids: set[str] = set()
-
-    for matcher in CONDITION_MATCHERS:
-        if _contains_any(condition_lower, matcher.keywords):
-            std = get_medical_standard(matcher.standard_id)
-            if std and matcher.standard_id not in matched_standard_ids:
-                standards.append(std.to_dict())
-                matched_standard_ids.add(matcher.standard_id)
-                considerations.extend(matcher.considerations)
+    matched_indices: set[int] = set()
+    for keyword in _matched_keywords(condition_lower):
+        matched_indices.update(_KEYWORD_TO_MATCHERS[keyword])
+
+    # In CONDITION_MATCHERS order, so results do not depend on set iteration
+    for index in sorted(matched_indices):
+        matcher = CONDITION_MATCHERS[index]
+        std = _STANDARD_DICTS.get(matcher.standard_id)
+        if std and matcher.standard_id not in matched_standard_ids:
+            standards.append(std)
+            matched_standard_ids.add(matcher.standard_id)
+            used_indices.append(index)
 
     # Always include general medical standard
-    gen_std = get_medical_standard("general_medical")
+    gen_std = _STANDARD_DICTS.get("general_medical")
     if gen_std and "general_medical" not in matched_standard_ids:
-        standards.append(gen_std.to_dict())
+        standards.append(gen_std)
+
+    return standards, _considerations_for(tuple(used_indices))
 
-    return standards, considerations
+
+@lru_cache(maxsize=_EVALUATION_CACHE_SIZE)
+def _evaluate_condition(
+    condition_lower: str,
+) -> tuple[tuple[dict[str, Any], ...], tuple[str, ...]]:
+    """
+    Cached _find_matching_standards for a condition from normalize_description.
+
+    Returns tuples so the cached entry cannot be changed through a response.
+    """
+    standards, considerations = _find_matching_standards(condition_lower)
+    return tuple(standards), considerations
 
 
 def _build_medical_condition_response(
@@ -130,8 +202,8 @@ def _build_medical_condition_response(
     return {
         "condition": condition,
         "relevant_standards": standards,
-        "evaluation_process": EVALUATION_PROCESS,
-        "key_considerations": considerations if considerations else DEFAULT_CONSIDERATIONS,
+        "evaluation_process": list(EVALUATION_PROCESS),
+        "key_considerations": considerations if considerations else list(DEFAULT_CONSIDERATIONS),
         "recommendation": "Formal evaluation by Designated Physician required for official determination.",
         "disclaimer": "This is informational guidance only. All medical fitness determinations must be made by the Designated Physician.",
     }
@@ -139,7 +211,7 @@ def _build_medical_condition_response(
 
 @mcp.tool()
 @audit_log
-async def get_medical_standards(category: str | None = None) -> dict[str, Any]:
+def get_medical_standards(category: str | None = None) -> dict[str, Any]:
     """
     Get HRP medical standards from 10 CFR 712 Subpart B.
 
@@ -159,16 +231,10 @@ async def get_medical_standards(category: str | None = None) -> dict[str, Any]:
         - standards: List of medical standards with details
         - subpart: Subpart B reference
     """
-    standards = []
-
     if category:
-        category_lower = category.lower().strip()
-        for key, standard in MEDICAL_STANDARDS.items():
-            if standard.category == category_lower or category_lower in key:
-                standards.append(standard.to_dict())
+        standards = list(_STANDARDS_BY_CATEGORY.get(category.lower().strip(), ()))
     else:
-        for standard in MEDICAL_STANDARDS.values():
-            standards.append(standard.to_dict())
+        standards = list(_ALL_STANDARD_DICTS)
 
     if not standards and category:
         return {
@@ -185,23 +251,8 @@ async def get_medical_standards(category: str | None = None) -> dict[str, Any]:
     }
 
 
-@mcp.tool()
-@audit_log
-async def get_psychological_evaluation() -> dict[str, Any]:
-    """
-    Get psychological evaluation requirements per 10 CFR 712.34.
-
-    Retrieve information about psychological evaluation criteria and
-    procedures for HRP candidates and certified individuals.
-
-    Returns:
-        Psychological evaluation information including:
-        - purpose: Purpose of psychological evaluation
-        - when_required: When evaluation is required
-        - evaluation_areas: Areas assessed in evaluation
-        - evaluator: Who conducts the evaluation
-        - section: CFR section reference
-    """
+def _build_psychological_evaluation() -> dict[str, Any]:
+    """Build the get_psychological_evaluation response."""
     psych_standard = get_medical_standard("psychological_evaluation")
 
     return {
@@ -216,7 +267,7 @@ async def get_psychological_evaluation() -> dict[str, Any]:
             "Return-to-work evaluation after psychological issue",
             "Following any concerning behavioral observation",
         ],
-        "evaluation_areas": psych_standard.evaluation_criteria
+        "evaluation_areas": list(psych_standard.evaluation_criteria)
         if psych_standard
         else [
             "Emotional stability",
@@ -226,7 +277,7 @@ async def get_psychological_evaluation() -> dict[str, Any]:
             "Interpersonal functioning",
             "Honesty and integrity",
         ],
-        "conditions_of_concern": psych_standard.conditions
+        "conditions_of_concern": list(psych_standard.conditions)
         if psych_standard
         else [
             "Mood disorders",
@@ -241,9 +292,35 @@ async def get_psychological_evaluation() -> dict[str, Any]:
     }
 
 
+# No-argument responses depend only on static reference data; each is built
+# once at import and returned as a shallow copy, so nested lists are shared
+# between calls and must not be mutated
+_PSYCHOLOGICAL_EVALUATION = _build_psychological_evaluation()
+
+
+@mcp.tool()
+@audit_log
+def get_psychological_evaluation() -> dict[str, Any]:
+    """
+    Get psychological evaluation requirements per 10 CFR 712.34.
+
+    Retrieve information about psychological evaluation criteria and
+    procedures for HRP candidates and certified individuals.
+
+    Returns:
+        Psychological evaluation information including:
+        - purpose: Purpose of psychological evaluation
+        - when_required: When evaluation is required
+        - evaluation_areas: Areas assessed in evaluation
+        - evaluator: Who conducts the evaluation
+        - section: CFR section reference
+    """
+    return dict(_PSYCHOLOGICAL_EVALUATION)
+
+
 @mcp.tool()
 @audit_log
-async def check_medical_condition(condition: str) -> dict[str, Any]:
+def check_medical_condition(condition: str) -> dict[str, Any]:
     """
     Evaluate a medical condition against HRP medical standards.
 
@@ -265,30 +342,14 @@ async def check_medical_condition(condition: str) -> dict[str, Any]:
         - key_considerations: Important factors in evaluation
         - recommendation: Recommended next steps
     """
-    condition_lower = condition.lower()
-
     # Find matching standards and considerations
-    standards, considerations = _find_matching_standards(condition_lower)
-
-    return _build_medical_condition_response(condition, standards, considerations)
+    standards, considerations = _evaluate_condition(normalize_description(condition))
 
+    return _build_medical_condition_response(condition, list(standards), list(considerations))
 
-@mcp.tool()
-@audit_log
-async def get_designated_physician_role() -> dict[str, Any]:
-    """
-    Get information about the Designated Physician role per 10 CFR 712.33.
-
-    Retrieve details about the responsibilities and qualifications of
-    the Designated Physician in the HRP.
 
-    Returns:
-        Designated Physician information including:
-        - title: Role title
-        - responsibilities: List of responsibilities
-        - qualifications: Required qualifications
-        - section: CFR section reference
-    """
+def _build_designated_physician_role() -> dict[str, Any]:
+    """Build the get_designated_physician_role response."""
     dp_info = get_hrp_role("designated_physician")
 
     return {
@@ -298,7 +359,7 @@ async def get_designated_physician_role() -> dict[str, Any]:
         "description": dp_info.description
         if dp_info
         else "A licensed physician designated to provide medical evaluations of HRP candidates and certified individuals.",
-        "responsibilities": dp_info.responsibilities
+        "responsibilities": list(dp_info.responsibilities)
         if dp_info
         else [
             "Conduct medical assessments",
@@ -308,7 +369,7 @@ async def get_designated_physician_role() -> dict[str, Any]:
             "Recommend accommodations if appropriate",
             "Report medical concerns to HRP management",
         ],
-        "qualifications": dp_info.qualifications
+        "qualifications": list(dp_info.qualifications)
         if dp_info
         else [
             "Licensed physician (MD or DO)",
@@ -323,3 +384,25 @@ async def get_designated_physician_role() -> dict[str, Any]:
             "Provides return-to-work evaluations",
         ],
     }
+
+
+_DESIGNATED_PHYSICIAN_ROLE = _build_designated_physician_role()
+
+
+@mcp.tool()
+@audit_log
+def get_designated_physician_role() -> dict[str, Any]:
+    """
+    Get information about the Designated Physician role per 10 CFR 712.33.
+
+    Retrieve details about the responsibilities and qualifications of
+    the Designated Physician in the HRP.
+
+    Returns:
+        Designated Physician information including:
+        - title: Role title
+        - responsibilities: List of responsibilities
+        - qualifications: Required qualifications
+        - section: CFR section reference
+    """
+    return dict(_DESIGNATED_PHYSICIAN_ROLE)
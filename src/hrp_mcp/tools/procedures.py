@@ -13,23 +13,8 @@ from hrp_mcp.resources.reference_data import (
 from hrp_mcp.server import mcp
 
 
-@mcp.tool()
-@audit_log
-async def get_temporary_removal_process() -> dict[str, Any]:
-    """
-    Get the temporary removal process per 10 CFR 712.19.
-
-    Retrieve information about when and how individuals are temporarily
-    removed from HRP duties.
-
-    Returns:
-        Temporary removal information including:
-        - grounds: Grounds for temporary removal
-        - procedures: Steps in the removal process
-        - individual_rights: Rights of the removed individual
-        - resolution: How temporary removals are resolved
-        - section: CFR section reference
-    """
+def _build_temporary_removal_process() -> dict[str, Any]:
+    """Build the get_temporary_removal_process response."""
     return {
         "section": "712.19",
         "citation": "10 CFR 712.19",
@@ -70,22 +55,34 @@ async def get_temporary_removal_process() -> dict[str, Any]:
     }
 
 
+# No-argument responses depend only on static reference data; each is built
+# once at import and returned as a shallow copy, so nested lists and dicts
+# are shared between calls and must not be mutated
+_TEMPORARY_REMOVAL_PROCESS = _build_temporary_removal_process()
+
+
 @mcp.tool()
 @audit_log
-async def get_permanent_removal_process() -> dict[str, Any]:
+async def get_temporary_removal_process() -> dict[str, Any]:
     """
-    Get the permanent removal process per 10 CFR 712.20.
+    Get the temporary removal process per 10 CFR 712.19.
 
-    Retrieve information about permanent removal (revocation) from HRP.
+    Retrieve information about when and how individuals are temporarily
+    removed from HRP duties.
 
     Returns:
-        Permanent removal information including:
-        - grounds: Grounds for permanent removal
+        Temporary removal information including:
+        - grounds: Grounds for temporary removal
         - procedures: Steps in the removal process
         - individual_rights: Rights of the removed individual
-        - consequences: Consequences of permanent removal
+        - resolution: How temporary removals are resolved
         - section: CFR section reference
     """
+    return dict(_TEMPORARY_REMOVAL_PROCESS)
+
+
+def _build_permanent_removal_process() -> dict[str, Any]:
+    """Build the get_permanent_removal_process response."""
     return {
         "section": "712.20",
         "citation": "10 CFR 712.20",
@@ -131,22 +128,30 @@ async def get_permanent_removal_process() -> dict[str, Any]:
     }
 
 
+_PERMANENT_REMOVAL_PROCESS = _build_permanent_removal_process()
+
+
 @mcp.tool()
 @audit_log
-async def get_reinstatement_process() -> dict[str, Any]:
+async def get_permanent_removal_process() -> dict[str, Any]:
     """
-    Get the reinstatement process per 10 CFR 712.21.
+    Get the permanent removal process per 10 CFR 712.20.
 
-    Retrieve information about how individuals may be reinstated to HRP
-    after removal.
+    Retrieve information about permanent removal (revocation) from HRP.
 
     Returns:
-        Reinstatement information including:
-        - eligibility: Who may seek reinstatement
-        - requirements: Requirements for reinstatement
-        - procedures: Steps in the reinstatement process
+        Permanent removal information including:
+        - grounds: Grounds for permanent removal
+        - procedures: Steps in the removal process
+        - individual_rights: Rights of the removed individual
+        - consequences: Consequences of permanent removal
         - section: CFR section reference
     """
+    return dict(_PERMANENT_REMOVAL_PROCESS)
+
+
+def _build_reinstatement_process() -> dict[str, Any]:
+    """Build the get_reinstatement_process response."""
     return {
         "section": "712.21",
         "citation": "10 CFR 712.21",
@@ -187,21 +192,30 @@ async def get_reinstatement_process() -> dict[str, Any]:
     }
 
 
+_REINSTATEMENT_PROCESS = _build_reinstatement_process()
+
+
 @mcp.tool()
 @audit_log
-async def get_appeal_process() -> dict[str, Any]:
+async def get_reinstatement_process() -> dict[str, Any]:
     """
-    Get the administrative review and appeal process per 10 CFR 712.22-712.25.
+    Get the reinstatement process per 10 CFR 712.21.
 
-    Retrieve information about how individuals may appeal HRP decisions.
+    Retrieve information about how individuals may be reinstated to HRP
+    after removal.
 
     Returns:
-        Appeal process information including:
-        - stages: Different stages of appeal
-        - timeframes: Time limits for appeals
-        - procedures: Steps at each stage
-        - section: CFR section references
+        Reinstatement information including:
+        - eligibility: Who may seek reinstatement
+        - requirements: Requirements for reinstatement
+        - procedures: Steps in the reinstatement process
+        - section: CFR section reference
     """
+    return dict(_REINSTATEMENT_PROCESS)
+
+
+def _build_appeal_process() -> dict[str, Any]:
+    """Build the get_appeal_process response."""
     return {
         "title": "Administrative Review and Appeal Process",
         "stages": [
@@ -273,46 +287,57 @@ async def get_appeal_process() -> dict[str, Any]:
     }
 
 
+_APPEAL_PROCESS = _build_appeal_process()
+
+
 @mcp.tool()
 @audit_log
-async def get_hrp_roles() -> dict[str, Any]:
+async def get_appeal_process() -> dict[str, Any]:
     """
-    Get information about HRP official roles.
+    Get the administrative review and appeal process per 10 CFR 712.22-712.25.
 
-    Retrieve details about the various official roles in the HRP
-    and their responsibilities.
+    Retrieve information about how individuals may appeal HRP decisions.
 
     Returns:
-        HRP roles information including:
-        - roles: List of HRP roles with responsibilities
+        Appeal process information including:
+        - stages: Different stages of appeal
+        - timeframes: Time limits for appeals
+        - procedures: Steps at each stage
+        - section: CFR section references
     """
-    roles = []
-    for role_info in HRP_ROLES.values():
-        roles.append(role_info.to_dict())
+    return dict(_APPEAL_PROCESS)
+
 
+def _build_hrp_roles() -> dict[str, Any]:
+    """Build the get_hrp_roles response."""
     return {
         "title": "HRP Official Roles",
-        "roles": roles,
+        "roles": [role_info.to_dict() for role_info in HRP_ROLES.values()],
         "note": "Specific responsibilities may vary by site. Consult local HRP procedures for site-specific information.",
     }
 
 
+_HRP_ROLES = _build_hrp_roles()
+
+
 @mcp.tool()
 @audit_log
-async def get_supervisory_review() -> dict[str, Any]:
+async def get_hrp_roles() -> dict[str, Any]:
     """
-    Get supervisory review requirements per 10 CFR 712.14.
+    Get information about HRP official roles.
 
-    Retrieve information about the supervisory review component of HRP.
+    Retrieve details about the various official roles in the HRP
+    and their responsibilities.
 
     Returns:
-        Supervisory review information including:
-        - purpose: Purpose of supervisory review
-        - responsibilities: Supervisor responsibilities
-        - what_to_observe: What supervisors should observe
-        - reporting: How concerns should be reported
-        - section: CFR section reference
+        HRP roles information including:
+        - roles: List of HRP roles with responsibilities
     """
+    return dict(_HRP_ROLES)
+
+
+def _build_supervisory_review() -> dict[str, Any]:
+    """Build the get_supervisory_review response."""
     comp = CERTIFICATION_COMPONENTS.get("supervisory_review")
 
     return {
@@ -349,21 +374,30 @@ async def get_supervisory_review() -> dict[str, Any]:
     }
 
 
+_SUPERVISORY_REVIEW = _build_supervisory_review()
+
+
 @mcp.tool()
 @audit_log
-async def get_management_evaluation() -> dict[str, Any]:
+async def get_supervisory_review() -> dict[str, Any]:
     """
-    Get management evaluation requirements per 10 CFR 712.16.
+    Get supervisory review requirements per 10 CFR 712.14.
 
-    Retrieve information about the management evaluation component of HRP.
+    Retrieve information about the supervisory review component of HRP.
 
     Returns:
-        Management evaluation information including:
-        - purpose: Purpose of management evaluation
-        - what_is_reviewed: Information reviewed in evaluation
-        - outcome: Possible outcomes
+        Supervisory review information including:
+        - purpose: Purpose of supervisory review
+        - responsibilities: Supervisor responsibilities
+        - what_to_observe: What supervisors should observe
+        - reporting: How concerns should be reported
         - section: CFR section reference
     """
+    return dict(_SUPERVISORY_REVIEW)
+
+
+def _build_management_evaluation() -> dict[str, Any]:
+    """Build the get_management_evaluation response."""
     comp = CERTIFICATION_COMPONENTS.get("management_evaluation")
 
     return {
@@ -399,21 +433,29 @@ async def get_management_evaluation() -> dict[str, Any]:
     }
 
 
+_MANAGEMENT_EVALUATION = _build_management_evaluation()
+
+
 @mcp.tool()
 @audit_log
-async def get_security_review() -> dict[str, Any]:
+async def get_management_evaluation() -> dict[str, Any]:
     """
-    Get DOE security review requirements per 10 CFR 712.17.
+    Get management evaluation requirements per 10 CFR 712.16.
 
-    Retrieve information about the DOE personnel security review component.
+    Retrieve information about the management evaluation component of HRP.
 
     Returns:
-        Security review information including:
-        - purpose: Purpose of security review
-        - what_is_reviewed: Information reviewed
-        - relationship_to_clearance: Relationship to security clearance
+        Management evaluation information including:
+        - purpose: Purpose of management evaluation
+        - what_is_reviewed: Information reviewed in evaluation
+        - outcome: Possible outcomes
         - section: CFR section reference
     """
+    return dict(_MANAGEMENT_EVALUATION)
+
+
+def _build_security_review() -> dict[str, Any]:
+    """Build the get_security_review response."""
     comp = CERTIFICATION_COMPONENTS.get("security_review")
 
     return {
@@ -443,3 +485,24 @@ async def get_security_review() -> dict[str, Any]:
         },
         "outcome": "Security determination provided to HRP management for certification decision",
     }
+
+
+_SECURITY_REVIEW = _build_security_review()
+
+
+@mcp.tool()
+@audit_log
+async def get_security_review() -> dict[str, Any]:
+    """
+    Get DOE security review requirements per 10 CFR 712.17.
+
+    Retrieve information about the DOE personnel security review component.
+
+    Returns:
+        Security review information including:
+        - purpose: Purpose of security review
+        - what_is_reviewed: Information reviewed
+        - relationship_to_clearance: Relationship to security clearance
+        - section: CFR section reference
+    """
+    return dict(_SECURITY_REVIEW)
@@ -4,12 +4,23 @@ Provides semantic search capabilities for 10 CFR Part 712 regulations,
 section lookups, and HRP terminology definitions.
 """
 
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
+from hrp_mcp._frozen import freeze, thaw
 from hrp_mcp.audit import audit_log
+from hrp_mcp.models.errors import SectionNotFoundError
 from hrp_mcp.models.regulations import HRPSubpart, RegulationChunk
 from hrp_mcp.resources.reference_data import (
+    HRP_DEFINITIONS,
     HRP_SECTIONS,
     get_definition,
     get_section_info,
@@ -17,12 +28,45 @@ from hrp_mcp.resources.reference_data import (
 from hrp_mcp.server import mcp
 from hrp_mcp.services import get_rag_service
 
+if TYPE_CHECKING:
+    from hrp_mcp.services.rag import RagService
+
+logger = logging.getLogger(__name__)
+
+
+def _build_subpart_aliases() -> dict[str, HRPSubpart]:
+    """Map accepted spellings of each subpart to the subpart.
+
+    Upper-case forms are the canonical keys; lower-case and title-case
+    variants are included so common inputs resolve without re-casing.
+    """
+    aliases: dict[str, HRPSubpart] = {}
+    for subpart, letter in ((HRPSubpart.SUBPART_A, "A"), (HRPSubpart.SUBPART_B, "B")):
+        for alias in (letter, f"SUBPART_{letter}", f"SUBPART {letter}"):
+            for variant in (alias, alias.lower(), alias.title()):
+                aliases[variant] = subpart
+    return aliases
+
+
+# Accepted spellings of each subpart; anything else is tried again after
+# upper() and strip()
+_SUBPART_ALIASES = _build_subpart_aliases()
+
+
+def _parse_subpart(subpart: str) -> HRPSubpart | None:
+    """Resolve a subpart spelling such as "A" or "subpart_b", or None."""
+    found = _SUBPART_ALIASES.get(subpart)
+    if found is None:
+        found = _SUBPART_ALIASES.get(subpart.upper().strip())
+    return found
+
+
 # --- Section Retrieval Helpers ---
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SectionData:
-    """Data retrieved for a regulation section."""
+    """Data retrieved for a regulation section; cached entries are shared."""
 
     content: str
     num_chunks: int
@@ -30,28 +74,216 @@ class SectionData:
     title: str
 
 
-async def _fetch_section_from_rag(section_num: str) -> SectionData | None:
+# Regulation text only changes on re-ingestion, which runs in another
+# process and cannot invalidate this cache. Cached lookups expire after this
+# TTL and are then re-read from the RAG service, whose own section cache
+# expires within a minute, so a running server sees re-ingested text within
+# about an hour
+_SECTION_CACHE_TTL_SECONDS = 3600.0
+# A section missing from the vector store is usually one not ingested yet,
+# so a server started before ingestion stops serving fallback text soon
+# after the section is ingested
+_MISSING_SECTION_CACHE_TTL_SECONDS = 60.0
+_SECTION_CACHE_SIZE = 128
+
+# section number -> (monotonic time stored, data or None if not ingested)
+_section_cache: OrderedDict[str, tuple[float, SectionData | None]] = OrderedDict()
+# section number -> lookup in progress, shared by concurrent requests
+_inflight_sections: dict[str, asyncio.Task[SectionData | None]] = {}
+
+
+def invalidate_section_cache() -> None:
+    """Forget cached section lookups, e.g. after re-ingesting in this process."""
+    _section_cache.clear()
+
+
+def _cached_section_data(section_num: str) -> tuple[bool, SectionData | None]:
+    """Return (True, data) for a section cached within its TTL, else (False, None)."""
+    cached = _section_cache.get(section_num)
+    if cached is None:
+        return False, None
+    stored, data = cached
+    ttl = _SECTION_CACHE_TTL_SECONDS if data is not None else _MISSING_SECTION_CACHE_TTL_SECONDS
+    if time.monotonic() - stored < ttl:
+        return True, data
+    return False, None
+
+
+def _cache_section_data(section_num: str, chunks: list[RegulationChunk]) -> SectionData | None:
+    """Combine a section's chunks into SectionData, or None if empty, and cache it."""
+    data = None
+    if chunks:
+        data = SectionData(
+            content="\n\n".join(chunk.content for chunk in chunks),
+            num_chunks=len(chunks),
+            subpart=chunks[0].subpart.value if chunks[0].subpart else "unknown",
+            title=chunks[0].title,
+        )
+
+    _section_cache[section_num] = (time.monotonic(), data)
+    _section_cache.move_to_end(section_num)
+    if len(_section_cache) > _SECTION_CACHE_SIZE:
+        _section_cache.popitem(last=False)
+    return data
+
+
+async def _load_section_from_rag(rag_service: "RagService", section_num: str) -> SectionData | None:
     """
-    Fetch section data from RAG service.
+    Load section data from RAG service and cache the outcome.
 
-    Returns SectionData if found, None if section not in vector store.
+    Returns SectionData if found, None if section not in vector store. A
+    missing section is cached too; other errors propagate uncached.
     """
-    rag_service = get_rag_service()
     try:
         chunks: list[RegulationChunk] = await rag_service.get_section(section_num)
-        if not chunks:
-            return None
+    except SectionNotFoundError:
+        chunks = []
+    return _cache_section_data(section_num, chunks)
 
-        return SectionData(
-            content="\n\n".join(chunk.content for chunk in chunks),
-            num_chunks=len(chunks),
-            subpart=chunks[0].subpart.value if chunks[0].subpart else "unknown",
-            title=chunks[0].title,
-        )
+
+def _finish_section_lookup(section_num: str, task: asyncio.Task[SectionData | None]) -> None:
+    """Drop a finished lookup from the in-flight map and log its failure.
+
+    Reading the exception here marks it retrieved, so asyncio does not
+    report it when every caller awaiting the lookup was cancelled.
+    """
+    _inflight_sections.pop(section_num, None)
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.warning("Section lookup failed for %s: %s", section_num, error)
+
+
+async def _fetch_section_from_rag(section_num: str) -> SectionData | None:
+    """
+    Fetch section data from RAG service, sharing concurrent lookups.
+
+    Results are served from cache for _SECTION_CACHE_TTL_SECONDS, and
+    sections missing from the vector store for the shorter
+    _MISSING_SECTION_CACHE_TTL_SECONDS. Requests for a section already being loaded
+    await that lookup instead of starting another. The lookup is shielded,
+    so one cancelled caller does not cancel it for the others.
+
+    Returns SectionData if found, None if section not in vector store or
+    the lookup failed.
+    """
+    hit, data = _cached_section_data(section_num)
+    if hit:
+        return data
+
+    rag_service = get_rag_service()
+    task = _inflight_sections.get(section_num)
+    if task is None:
+        task = asyncio.create_task(_load_section_from_rag(rag_service, section_num))
+        _inflight_sections[section_num] = task
+        task.add_done_callback(lambda done: _finish_section_lookup(section_num, done))
+    try:
+        return await asyncio.shield(task)
     except Exception:
+        # The failure itself is logged once by _finish_section_lookup
+        logger.debug("Serving fallback text for section %s", section_num)
         return None
 
 
+async def _fetch_sections_from_rag(section_nums: list[str]) -> dict[str, SectionData | None]:
+    """
+    Fetch several sections, loading every uncached one in a single query.
+
+    Returns a mapping of each section number to SectionData, or None if it
+    is not in the vector store or the lookup failed.
+    """
+    found: dict[str, SectionData | None] = {}
+    to_load: list[str] = []
+    for section_num in section_nums:
+        hit, data = _cached_section_data(section_num)
+        if hit:
+            found[section_num] = data
+        else:
+            to_load.append(section_num)
+
+    if to_load:
+        rag_service = get_rag_service()
+        try:
+            chunks_by_section = await rag_service.get_sections(to_load)
+        except Exception as e:
+            logger.warning("Section lookup failed for %s: %s", ", ".join(to_load), e)
+            chunks_by_section = None
+        for section_num in to_load:
+            if chunks_by_section is None:
+                found[section_num] = None
+            else:
+                found[section_num] = _cache_section_data(
+                    section_num, chunks_by_section.get(section_num, [])
+                )
+    return found
+
+
+# Repeated searches within the TTL skip embedding and the vector store
+_SEARCH_CACHE_TTL_SECONDS = 300.0
+_SEARCH_CACHE_SIZE = 256
+
+# (query, subpart, limit) -> (monotonic time stored, frozen formatted results)
+_search_cache: OrderedDict[
+    tuple[str, HRPSubpart | None, int], tuple[float, tuple[Mapping[str, Any], ...]]
+] = OrderedDict()
+
+
+def invalidate_search_cache() -> None:
+    """Forget cached search results, e.g. after re-ingesting regulations."""
+    _search_cache.clear()
+
+
+async def _search_regulations(
+    query: str, subpart: HRPSubpart | None, limit: int
+) -> list[dict[str, Any]]:
+    """
+    Search the RAG service and format results, caching them for the TTL.
+
+    Queries differing only in whitespace share an entry; case is kept, as
+    the RAG service does. Failed searches are not cached. Results are cached
+    frozen and every call, hit or miss, gets its own thawed copy.
+    """
+    key = (" ".join(query.split()), subpart, limit)
+    cached = _search_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL_SECONDS:
+        _search_cache.move_to_end(key)
+        return thaw(cached[1])
+
+    results = await get_rag_service().search(query=query, subpart=subpart, limit=limit)
+
+    # Format response for MCP
+    formatted = freeze([r.to_dict() for r in results])
+    _search_cache[key] = (time.monotonic(), formatted)
+    _search_cache.move_to_end(key)
+    if len(_search_cache) > _SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+    return thaw(formatted)
+
+
+# Plain section numbers, with or without the "712." prefix
+_SECTION_RE = re.compile(r"\s*(?:712\.)?(\d+[a-z]?)\s*", re.IGNORECASE)
+
+
+def _normalize_section_number(section: str) -> str:
+    """Turn "11" or " 712.11 " into "712.11"."""
+    match = _SECTION_RE.fullmatch(section)
+    if match:
+        return f"712.{match.group(1)}"
+
+    # Anything else, e.g. "712.3(c)", only gets the prefix added if missing
+    section_num = section.strip()
+    if not section_num.startswith("712."):
+        section_num = f"712.{section_num}"
+    return section_num
+
+
+# Citations for the known sections, built once instead of per response
+_CITATIONS = {section_num: f"10 CFR {section_num}" for section_num in HRP_SECTIONS}
+
+
+def _citation(section_num: str) -> str:
+    """Return the CFR citation for a section, e.g. "10 CFR 712.11"."""
+    return _CITATIONS.get(section_num) or f"10 CFR {section_num}"
+
+
 def _get_fallback_section_data(section_num: str) -> SectionData:
     """Get section data from reference data when RAG lookup fails."""
     section_info = get_section_info(section_num)
@@ -80,7 +312,7 @@ def _build_section_response(section_num: str, data: SectionData) -> dict[str, An
         "section": section_num,
         "title": title,
         "subpart": subpart,
-        "citation": f"10 CFR {section_num}",
+        "citation": _citation(section_num),
         "content": content,
         "chunks": data.num_chunks,
     }
@@ -128,29 +360,13 @@ async def search_10cfr712(
         - citation: CFR citation (e.g., "10 CFR 712.11")
         - score: Relevance score (0-1, higher is more relevant)
     """
-    rag_service = get_rag_service()
-
     # Clamp limit to reasonable range
-    limit = max(1, min(limit, 50))
+    limit = 1 if limit < 1 else 50 if limit > 50 else limit
 
     # Parse subpart filter
-    subpart_filter = None
-    if subpart:
-        subpart_upper = subpart.upper().strip()
-        if subpart_upper in ("A", "SUBPART_A", "SUBPART A"):
-            subpart_filter = HRPSubpart.SUBPART_A
-        elif subpart_upper in ("B", "SUBPART_B", "SUBPART B"):
-            subpart_filter = HRPSubpart.SUBPART_B
-
-    # Perform search
-    results = await rag_service.search(
-        query=query,
-        subpart=subpart_filter,
-        limit=limit,
-    )
+    subpart_filter = _parse_subpart(subpart) if subpart else None
 
-    # Format response for MCP
-    return [r.to_dict() for r in results]
+    return await _search_regulations(query, subpart_filter, limit)
 
 
 @mcp.tool()
@@ -179,10 +395,7 @@ async def get_section(section: str) -> dict[str, Any]:
         - content: Complete section text
         - chunks: Number of chunks for this section
     """
-    # Normalize section number
-    section_num = section.strip()
-    if not section_num.startswith("712."):
-        section_num = f"712.{section_num}"
+    section_num = _normalize_section_number(section)
 
     # Try RAG service first, fall back to reference data
     data = await _fetch_section_from_rag(section_num)
@@ -192,6 +405,85 @@ async def get_section(section: str) -> dict[str, Any]:
     return _build_section_response(section_num, data)
 
 
+def _section_sort_key(section_num: str) -> tuple[int, ...]:
+    """Order "712.2" before "712.10" by comparing the numeric parts."""
+    return tuple(int(part) for part in section_num.split("."))
+
+
+def _build_subpart_response(subpart_id: str, title: str) -> dict[str, Any]:
+    """Build the get_subpart response for one subpart."""
+    # Get sections for this subpart, sorted by section number
+    sections = [
+        {
+            "section": section_num,
+            "title": info.get("title", ""),
+            "description": info.get("description", ""),
+            "citation": _CITATIONS[section_num],
+        }
+        for section_num, info in sorted(
+            HRP_SECTIONS.items(), key=lambda item: _section_sort_key(item[0])
+        )
+        if info.get("subpart") == subpart_id
+    ]
+
+    return {
+        "subpart": subpart_id,
+        "title": title,
+        "citation": f"10 CFR Part 712, Subpart {subpart_id}",
+        "section_count": len(sections),
+        "sections": sections,
+    }
+
+
+# Both subpart responses depend only on static reference data; each is built
+# once at import and returned as a shallow copy, so the section list is
+# shared between calls and must not be mutated
+_SUBPART_RESPONSES = {
+    HRPSubpart.SUBPART_A: _build_subpart_response(
+        "A", "Establishment of and Procedures for the Human Reliability Program"
+    ),
+    HRPSubpart.SUBPART_B: _build_subpart_response("B", "Medical Standards"),
+}
+_VALID_SUBPARTS = ("A", "B")
+
+
+@mcp.tool()
+@audit_log
+async def get_sections(sections: list[str]) -> list[dict[str, Any]]:
+    """
+    Get the full text of several sections of 10 CFR Part 712 at once.
+
+    Use this instead of repeated get_section calls when you need a group of
+    related sections, such as the appeal process in 712.22 through 712.25.
+    The sections are retrieved together in one lookup.
+
+    Args:
+        sections: Section numbers to retrieve, e.g. ["712.22", "712.23"].
+                  Short forms like "22" are interpreted as "712.22".
+                  Repeated sections are returned once.
+
+    Returns:
+        One entry per section, in request order, with the same fields as
+        get_section:
+        - section: Section number
+        - title: Section title
+        - subpart: Subpart A or B
+        - citation: Full CFR citation
+        - content: Complete section text
+        - chunks: Number of chunks for this section
+    """
+    section_nums = list(dict.fromkeys(map(_normalize_section_number, sections)))
+
+    # Try RAG service first, fall back to reference data
+    found = await _fetch_sections_from_rag(section_nums)
+    return [
+        _build_section_response(
+            section_num, found.get(section_num) or _get_fallback_section_data(section_num)
+        )
+        for section_num in section_nums
+    ]
+
+
 @mcp.tool()
 @audit_log
 async def get_subpart(subpart: str) -> dict[str, Any]:
@@ -211,45 +503,38 @@ async def get_subpart(subpart: str) -> dict[str, Any]:
         - title: Subpart title
         - sections: List of section summaries in this subpart
     """
-    subpart_upper = subpart.upper().strip()
-
-    if subpart_upper in ("A", "SUBPART_A", "SUBPART A"):
-        subpart_id = "A"
-        title = "Establishment of and Procedures for the Human Reliability Program"
-    elif subpart_upper in ("B", "SUBPART_B", "SUBPART B"):
-        subpart_id = "B"
-        title = "Medical Standards"
-    else:
-        return {
-            "error": f"Invalid subpart '{subpart}'. Use 'A' or 'B'.",
-            "valid_subparts": ["A", "B"],
-        }
-
-    # Get sections for this subpart
-    sections = []
-    for section_num, info in HRP_SECTIONS.items():
-        if info.get("subpart") == subpart_id:
-            sections.append(
-                {
-                    "section": section_num,
-                    "title": info.get("title", ""),
-                    "description": info.get("description", ""),
-                    "citation": f"10 CFR {section_num}",
-                }
-            )
-
-    # Sort by section number
-    sections.sort(key=lambda x: float(x["section"].replace("712.", "")))
-
+    subpart_id = _parse_subpart(subpart)
+    if subpart_id is not None:
+        return dict(_SUBPART_RESPONSES[subpart_id])
     return {
-        "subpart": subpart_id,
-        "title": title,
-        "citation": f"10 CFR Part 712, Subpart {subpart_id}",
-        "section_count": len(sections),
-        "sections": sections,
+        "error": f"Invalid subpart '{subpart}'. Use 'A' or 'B'.",
+        "valid_subparts": list(_VALID_SUBPARTS),
     }
 
 
+# (registry key, lower-cased term, display term) for each definition
+_SUGGESTION_CANDIDATES = tuple(
+    (key, value.get("term", key).lower(), value.get("term", key))
+    for key, value in HRP_DEFINITIONS.items()
+)
+_MAX_SUGGESTIONS = 5
+
+
+@lru_cache(maxsize=256)
+def _term_suggestions(term_lower: str) -> tuple[str, ...]:
+    """Up to _MAX_SUGGESTIONS terms whose key or name contains term_lower."""
+    return tuple(
+        islice(
+            (
+                display
+                for key, term, display in _SUGGESTION_CANDIDATES
+                if term_lower in key or term_lower in term
+            ),
+            _MAX_SUGGESTIONS,
+        )
+    )
+
+
 @mcp.tool()
 @audit_log
 async def explain_term(term: str) -> dict[str, Any]:
@@ -280,27 +565,19 @@ async def explain_term(term: str) -> dict[str, Any]:
     result = get_definition(term)
 
     if result:
+        section = result.get("section", "712.3")
         return {
             "term": result.get("term", term),
             "definition": result.get("definition", ""),
-            "section": result.get("section", "712.3"),
-            "citation": f"10 CFR {result.get('section', '712.3')}",
+            "section": section,
+            "citation": _citation(section),
             "found": True,
         }
 
-    # Try to provide suggestions
-    from hrp_mcp.resources.reference_data import HRP_DEFINITIONS
-
-    suggestions = []
-    term_lower = term.lower()
-    for key, value in HRP_DEFINITIONS.items():
-        if term_lower in key or term_lower in value.get("term", "").lower():
-            suggestions.append(value.get("term", key))
-
     return {
         "term": term,
         "definition": None,
         "found": False,
         "message": f"Term '{term}' not found in HRP definitions.",
-        "suggestions": suggestions[:5] if suggestions else [],
+        "suggestions": list(_term_suggestions(term.lower())),
     }
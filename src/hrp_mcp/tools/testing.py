@@ -9,6 +9,10 @@ from hrp_mcp.audit import audit_log
 from hrp_mcp.resources.reference_data import CONTROLLED_SUBSTANCES
 from hrp_mcp.server import mcp
 
+# Response form of the substance panel, built once; responses get shallow
+# list copies, so the dicts inside are shared and must not be mutated
+_SUBSTANCE_DICTS = tuple(substance.to_dict() for substance in CONTROLLED_SUBSTANCES)
+
 
 @mcp.tool()
 @audit_log
@@ -39,7 +43,7 @@ async def get_drug_testing_requirements() -> dict[str, Any]:
             "return_to_duty": "Before returning to HRP duties after treatment",
             "follow_up": "After return to duty, unannounced testing for specified period",
         },
-        "substances_tested": CONTROLLED_SUBSTANCES,
+        "substances_tested": list(_SUBSTANCE_DICTS),
         "testing_procedures": [
             "Collection by trained personnel",
             "Split specimen collection",
@@ -182,7 +186,7 @@ async def get_substance_list() -> dict[str, Any]:
         "section": "712.15",
         "citation": "10 CFR 712.15",
         "title": "Controlled substances tested",
-        "substances": CONTROLLED_SUBSTANCES,
+        "substances": list(_SUBSTANCE_DICTS),
         "testing_standard": "Testing follows HHS Mandatory Guidelines for Federal Workplace Drug Testing Programs",
         "cutoff_levels": {
             "initial_screening": "Immunoassay screening at specified cutoff levels",
@@ -219,6 +219,22 @@ class TestWriteAuditLog:
 
             assert log_file.exists()
 
+    def test_should_not_create_directories_once_they_exist(self, tmp_path):
+        """Test that writes to an existing directory skip directory creation."""
+        log_file = tmp_path / "audit.jsonl"
+
+        with (
+            patch("hrp_mcp.audit.settings") as mock_settings,
+            patch("hrp_mcp.audit.Path.mkdir") as mock_mkdir,
+        ):
+            mock_settings.audit_log_path = str(log_file)
+
+            _write_audit_log({"tool": "first"})
+            _write_audit_log({"tool": "second"})
+
+            mock_mkdir.assert_not_called()
+            assert len(log_file.read_text().strip().split("\n")) == 2
+
     def test_should_raise_on_write_error(self, tmp_path):
         """Test that AuditLogError is raised on write failure."""
         # Use an invalid path (directory instead of file)
@@ -0,0 +1,49 @@
+"""Tests for read-only response storage."""
+
+import json
+
+import pytest
+from pydantic_core import to_json
+
+from hrp_mcp._frozen import freeze, thaw
+
+
+def _response() -> dict:
+    return {
+        "section": "712.11",
+        "stages": [{"name": "Review", "steps": ["a", "b"]}],
+        "pair": ("x", "y"),
+    }
+
+
+def test_freeze_makes_nested_values_read_only():
+    """Test that nested mappings and sequences cannot be changed."""
+    frozen = freeze(_response())
+
+    with pytest.raises(TypeError):
+        frozen["section"] = "HACKED"
+    with pytest.raises(TypeError):
+        frozen["stages"][0]["name"] = "HACKED"
+    assert frozen["stages"][0]["steps"] == ("a", "b")
+
+
+def test_thaw_returns_fresh_plain_copies():
+    """Test that thawed copies are plain, equal to the original, and unshared."""
+    frozen = freeze(_response())
+
+    first = thaw(frozen)
+    first["stages"][0]["steps"].append("c")
+
+    assert thaw(frozen) == {
+        "section": "712.11",
+        "stages": [{"name": "Review", "steps": ["a", "b"]}],
+        "pair": ["x", "y"],
+    }
+    assert type(first["stages"][0]) is dict
+
+
+def test_thawed_copies_serialize_to_json():
+    """Test that thawed responses serialize, since MappingProxyType does not."""
+    frozen = freeze(_response())
+
+    assert json.loads(to_json(thaw(frozen)))["stages"][0]["steps"] == ["a", "b"]
@@ -0,0 +1,44 @@
+"""Tests for shared keyword scanning."""
+
+import pytest
+
+from hrp_mcp._matcher import KeywordMatcher, normalize_description
+
+
+def test_normalize_description_folds_case_and_whitespace():
+    """Test that case, padding and line breaks are normalized away."""
+    assert normalize_description("  Positive\n  TEST  ") == "positive test"
+    assert normalize_description("") == ""
+
+
+def test_keyword_matcher_reports_overlapping_and_nested_keywords():
+    """Test that keywords inside or overlapping others are all found."""
+    matcher = KeywordMatcher(["alcohol", "alcoholism", "holism", "drug"])
+
+    assert matcher.scan("history of alcoholism") == {"alcohol", "alcoholism", "holism"}
+    assert matcher.scan("no findings") == frozenset()
+
+
+def test_keyword_matcher_compiles_on_first_scan():
+    """Test that the pattern is built lazily and then reused."""
+    matcher = KeywordMatcher(["drug"])
+    assert matcher._pattern is None
+
+    matcher.scan("drug test")
+    pattern = matcher._pattern
+
+    assert pattern is not None
+    matcher.scan("another drug test")
+    assert matcher._pattern is pattern
+
+
+def test_keyword_matcher_with_empty_vocabulary_matches_nothing():
+    """Test that an empty vocabulary never reports a match."""
+    assert KeywordMatcher([]).scan("anything") == frozenset()
+
+
+@pytest.mark.parametrize("keyword", ["", "Alcohol", " drug", "positive  test"])
+def test_keyword_matcher_rejects_unnormalized_keywords(keyword):
+    """Test that keywords a normalized text could never contain are refused."""
+    with pytest.raises(ValueError, match="normalized"):
+        KeywordMatcher([keyword])
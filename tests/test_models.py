@@ -1,6 +1,10 @@
 """Tests for data models."""
 
+import pytest
+from pydantic import ValidationError
+
 from hrp_mcp.models.hrp import (
+    CertificationComponent,
     CertificationStatus,
     HRPPositionType,
     RemovalType,
@@ -73,6 +77,21 @@ def test_search_result_to_dict():
     assert "content" in result_dict
 
 
+def test_search_result_is_frozen():
+    """Test that search results reject mutation after construction."""
+    chunk = RegulationChunk(
+        id="hrp:712-11:chunk-000",
+        section="712.11",
+        title="General requirements",
+        content="Test content.",
+        citation="10 CFR 712.11",
+    )
+    result = SearchResult(chunk=chunk, score=0.95)
+
+    with pytest.raises(ValidationError):
+        result.score = 0.5
+
+
 def test_get_subpart_for_section():
     """Test section to subpart mapping."""
     assert get_subpart_for_section("712.11") == HRPSubpart.SUBPART_A
@@ -97,3 +116,26 @@ def test_removal_type_enum():
     """Test RemovalType enum."""
     assert RemovalType.TEMPORARY.value == "temporary"
     assert RemovalType.PERMANENT.value == "permanent"
+
+
+def test_get_subpart_for_unlisted_section():
+    """Test subpart inference for sections outside the lookup table."""
+    assert get_subpart_for_section("712.13(c)") == HRPSubpart.SUBPART_A
+    assert get_subpart_for_section("712.39") == HRPSubpart.SUBPART_B
+    assert get_subpart_for_section("unknown") == HRPSubpart.SUBPART_A
+
+
+def test_registry_models_are_frozen():
+    """Test that reference data models reject mutation and are hashable."""
+    component = CertificationComponent(
+        name="Supervisory Review",
+        description="Annual supervisory review",
+        section="712.14",
+        frequency="Annual",
+        responsible_official="Supervisor",
+        key_elements=("Observe behavior",),
+    )
+
+    with pytest.raises(ValidationError):
+        component.name = "Changed"
+    assert hash(component) == hash(component.model_copy())
@@ -3,8 +3,45 @@
 Tests cover token counting, text chunking, and overlap handling.
 """
 
+import dataclasses
+import itertools
+import threading
+
+import pytest
+
 from hrp_mcp.models.regulations import SourceType
+from hrp_mcp.rag import tokenization
 from hrp_mcp.rag.chunking import ChunkMetadata, RegulationChunker
+from hrp_mcp.rag.tokenization import Tokenizer
+
+
+class WhitespaceTokenizer:
+    """Deterministic word-level tokenizer used to test pluggable backends."""
+
+    def __init__(self) -> None:
+        self._vocab: dict[str, int] = {}
+        self._words: list[str] = []
+        self._lock = threading.Lock()
+
+    def encode(self, text: str) -> list[int]:
+        ids = []
+        with self._lock:
+            for word in text.split():
+                if word not in self._vocab:
+                    self._vocab[word] = len(self._words)
+                    self._words.append(word)
+                ids.append(self._vocab[word])
+        return ids
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        return [self.encode(text) for text in texts]
+
+    def decode(self, tokens: list[int]) -> str:
+        return " ".join(self._words[t] for t in tokens)
+
+    def decode_batch(self, batch: list[list[int]]) -> list[str]:
+        return [self.decode(tokens) for tokens in batch]
+
 
 # --- ChunkMetadata Tests ---
 
@@ -35,6 +72,19 @@ class TestChunkMetadata:
         assert metadata.citation == "10 CFR 712.15"
         assert metadata.source == SourceType.CFR_710
 
+    def test_should_be_immutable(self):
+        """Test that metadata cannot be modified after creation."""
+        metadata = ChunkMetadata(section="712.11")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metadata.section = "712.15"  # type: ignore[misc]
+
+    def test_should_not_have_instance_dict(self):
+        """Test that metadata uses slots instead of a per-instance __dict__."""
+        metadata = ChunkMetadata(section="712.11")
+
+        assert not hasattr(metadata, "__dict__")
+
 
 # --- RegulationChunker Initialization Tests ---
 
@@ -57,6 +107,99 @@ class TestRegulationChunkerInit:
         assert chunker.overlap_tokens == 25
 
 
+# --- Tokenizer Backend Tests ---
+
+
+class TestRegulationChunkerBackend:
+    """Tests for pluggable tokenizer backends."""
+
+    def test_should_satisfy_tokenizer_protocol(self):
+        """Test that custom backends are recognized as tokenizers."""
+        assert isinstance(WhitespaceTokenizer(), Tokenizer)
+
+    def test_should_count_tokens_with_custom_backend(self):
+        """Test that token counting uses the provided backend."""
+        chunker = RegulationChunker(backend=WhitespaceTokenizer())
+
+        assert chunker.count_tokens("one two three four") == 4
+
+    def test_should_chunk_with_custom_backend(self):
+        """Test that chunk sizes are measured with the provided backend."""
+        backend = WhitespaceTokenizer()
+        chunker = RegulationChunker(max_tokens=20, overlap_tokens=5, backend=backend)
+        metadata = ChunkMetadata(section="712.11")
+
+        text = "\n\n".join(f"Paragraph {i} has exactly six words." for i in range(10))
+        chunks = chunker.chunk_text(text, metadata)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(backend.encode(chunk.content)) <= 20
+
+    def test_should_emit_stripped_chunk_content(self):
+        """Test that surrounding whitespace never reaches chunk content."""
+        chunker = RegulationChunker(max_tokens=12, overlap_tokens=3, backend=WhitespaceTokenizer())
+        metadata = ChunkMetadata(section="712.11")
+
+        text = "\n  " + "\n\n".join(f"Paragraph {i} has six words." for i in range(6)) + "  \n"
+        chunks = chunker.chunk_text(text, metadata)
+        short = chunker.chunk_text("  \n Short text. \n", metadata)
+
+        assert len(chunks) > 1
+        for chunk in [*chunks, *short]:
+            assert chunk.content == chunk.content.strip()
+        assert short[0].content == "Short text."
+
+    def test_should_split_long_paragraph_into_token_windows(self):
+        """Test that an oversized paragraph is split on exact token windows."""
+        backend = WhitespaceTokenizer()
+        chunker = RegulationChunker(max_tokens=30, overlap_tokens=5, backend=backend)
+        metadata = ChunkMetadata(section="712.11")
+
+        words = [f"word{i}" for i in range(100)]
+        chunks = chunker.chunk_text(" ".join(words), metadata)
+
+        windows = [chunk.content.split() for chunk in chunks]
+        assert [len(w) for w in windows] == [30, 30, 30, 25]
+        # Consecutive windows share overlap_tokens tokens
+        for previous, current in itertools.pairwise(windows):
+            assert previous[-5:] == current[:5]
+        assert windows[-1][-1] == "word99"
+        assert [c.chunk_index for c in chunks] == [0, 1, 2, 3]
+
+
+# --- Parallel Chunking Tests ---
+
+
+class TestRegulationChunkerChunkMany:
+    """Tests for chunking many sections at once."""
+
+    def test_should_match_sequential_chunking_in_order(self):
+        """Test that parallel chunking returns the same chunks in input order."""
+        chunker = RegulationChunker(max_tokens=20, overlap_tokens=5, backend=WhitespaceTokenizer())
+        items = [
+            (
+                "\n\n".join(f"Section {n} paragraph {i} text." for i in range(n + 1)),
+                ChunkMetadata(section=f"712.{n}"),
+            )
+            for n in range(1, 12)
+        ]
+
+        expected = [chunk for text, meta in items for chunk in chunker.chunk_text(text, meta)]
+        result = chunker.chunk_many(items, max_workers=4)
+
+        assert [c.id for c in result] == [c.id for c in expected]
+        assert [c.content for c in result] == [c.content for c in expected]
+
+    def test_should_handle_empty_and_single_inputs(self):
+        """Test that trivial inputs are chunked without a thread pool."""
+        chunker = RegulationChunker(backend=WhitespaceTokenizer())
+        metadata = ChunkMetadata(section="712.11")
+
+        assert chunker.chunk_many([]) == []
+        assert len(chunker.chunk_many([("Short text.", metadata)])) == 1
+
+
 # --- Token Counting Tests ---
 
 
@@ -111,6 +254,37 @@ class TestRegulationChunkerChunkText:
         assert chunks[0].section == "712.11"
         assert chunks[0].chunk_index == 0
 
+    def test_should_skip_token_count_for_short_ascii_text(self, monkeypatch):
+        """Test that short ASCII text takes the fast path without encoding."""
+        chunker = RegulationChunker(max_tokens=512)
+        metadata = ChunkMetadata(section="712.11")
+
+        def fail_count(text: str) -> int:
+            raise AssertionError("count_tokens should not be called")
+
+        monkeypatch.setattr(chunker, "count_tokens", fail_count)
+        chunks = chunker.chunk_text("Short regulation text.", metadata)
+
+        assert len(chunks) == 1
+        assert chunks[0].content == "Short regulation text."
+
+    def test_should_count_tokens_for_short_non_ascii_text(self, monkeypatch):
+        """Test that non-ASCII text is measured exactly instead of by length."""
+        chunker = RegulationChunker(max_tokens=512)
+        metadata = ChunkMetadata(section="712.11")
+        counted: list[str] = []
+        original_count = chunker.count_tokens
+
+        def spy_count(text: str) -> int:
+            counted.append(text)
+            return original_count(text)
+
+        monkeypatch.setattr(chunker, "count_tokens", spy_count)
+        chunks = chunker.chunk_text("Certification \u00a7 712.11", metadata)
+
+        assert counted == ["Certification \u00a7 712.11"]
+        assert len(chunks) == 1
+
     def test_should_split_long_text_into_multiple_chunks(self):
         """Test that long text is split into multiple chunks."""
         chunker = RegulationChunker(max_tokens=50, overlap_tokens=10)
@@ -330,5 +504,31 @@ class TestRegulationChunkerEdgeCases:
         long_para = " ".join(sentences)
         chunks = chunker.chunk_text(long_para, metadata)
 
-        # Should split into multiple chunks due to sentence-based splitting
+        # Should split into multiple chunks on token windows
         assert len(chunks) > 1
+
+
+# --- Tokenizer Backend Caching Tests ---
+
+
+class TestTiktokenBackendCaching:
+    """Tests for shared tiktoken encodings."""
+
+    def test_should_load_encoding_once_per_name(self, monkeypatch):
+        """Test that chunkers share a single loaded encoding."""
+        loaded: list[str] = []
+
+        def fake_get_encoding(name: str) -> object:
+            loaded.append(name)
+            return object()
+
+        monkeypatch.setattr(tokenization.tiktoken, "get_encoding", fake_get_encoding)
+        tokenization._get_encoding.cache_clear()
+        try:
+            first = RegulationChunker(tokenizer="fake_base")
+            second = RegulationChunker(tokenizer="fake_base")
+
+            assert loaded == ["fake_base"]
+            assert first._tokenizer._encoding is second._tokenizer._encoding
+        finally:
+            tokenization._get_encoding.cache_clear()
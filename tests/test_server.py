@@ -0,0 +1,39 @@
+"""Tests for server startup."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def test_server_import_defers_heavy_dependencies():
+    """Test that registering tools does not load the model or vector store."""
+    pytest.importorskip("fastmcp")
+    code = (
+        "import sys, hrp_mcp.server; "
+        "print(','.join(m for m in ('sentence_transformers', 'chromadb', 'torch') "
+        "if m in sys.modules))"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize("level", ["WARN", "fatal", "NOTSET", "debug"])
+def test_server_accepts_logging_level_aliases(level):
+    """Test that every level name the logging module knows starts the server."""
+    pytest.importorskip("fastmcp")
+
+    subprocess.run(
+        [sys.executable, "-c", "import hrp_mcp.server"],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "HRP_LOG_LEVEL": level},
+    )
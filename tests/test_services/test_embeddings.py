@@ -32,3 +32,82 @@ def test_embedding_service_consistency(embedding_service):
     emb2 = embedding_service.embed(text)
 
     assert emb1 == emb2
+
+
+def test_get_embedding_service_returns_singleton():
+    """Test that the service getter always returns the same instance."""
+    from hrp_mcp.services import get_embedding_service
+
+    assert get_embedding_service() is get_embedding_service()
+
+
+def test_embedding_dimension_matches_embeddings(embedding_service):
+    """Test that the cached dimension matches generated embeddings."""
+    dimension = embedding_service.dimension
+
+    assert dimension == len(embedding_service.embed("HRP"))
+    assert embedding_service.dimension == dimension
+
+
+def test_embedding_service_numpy_outputs(embedding_service):
+    """Test that numpy embeddings match the list-returning API."""
+    import numpy as np
+
+    texts = ["HRP certification", "Medical evaluation"]
+    single = embedding_service.embed_np(texts[0])
+    batch = embedding_service.embed_batch_np(texts)
+
+    assert single.dtype == np.float32
+    assert batch.shape == (2, embedding_service.dimension)
+    assert np.allclose(single, embedding_service.embed(texts[0]))
+    assert embedding_service.embed_batch_np([]).shape == (0, embedding_service.dimension)
+
+
+class _CountingModel:
+    """Stand-in model that records which texts it was asked to encode."""
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts, **kwargs):
+        import numpy as np
+
+        batch = [texts] if isinstance(texts, str) else list(texts)
+        self.encoded.extend(batch)
+        vectors = np.array([[float(len(t)), 1.0] for t in batch], dtype=np.float32)
+        return vectors[0] if isinstance(texts, str) else vectors
+
+
+def test_embedding_service_caches_repeated_texts():
+    """Test that repeated texts are served from the cache, not re-encoded."""
+    from hrp_mcp.services.embeddings import EmbeddingService
+
+    service = EmbeddingService(cache_size=2)
+    model = _CountingModel()
+    service._model = model
+
+    first = service.embed_np("HRP")
+    second = service.embed_np("HRP")
+    batch = service.embed_batch_np(["HRP", "drug testing"])
+
+    assert first is second
+    assert not first.flags.writeable
+    assert batch.tolist() == [[3.0, 1.0], [12.0, 1.0]]
+    assert model.encoded == ["HRP", "drug testing"]
+
+
+def test_embedding_service_cache_evicts_least_recently_used():
+    """Test that the cache stays bounded and skips very long texts."""
+    from hrp_mcp.services.embeddings import EmbeddingService
+
+    service = EmbeddingService(cache_size=2)
+    model = _CountingModel()
+    service._model = model
+    long_text = "x" * 5000
+
+    service.embed_batch_np(["a", "b", "c", long_text])
+    service.embed_np("a")
+    service.embed_np(long_text)
+
+    assert len(service._cache) == 2
+    assert model.encoded == ["a", "b", "c", long_text, "a", long_text]
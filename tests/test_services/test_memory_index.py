@@ -0,0 +1,80 @@
+"""Tests for the in-memory vector index."""
+
+import numpy as np
+import pytest
+
+from hrp_mcp.services.memory_index import MemoryIndex
+
+
+def _records() -> list[dict]:
+    return [
+        {"id": "a-11", "source": "10cfr712", "subpart": "subpart_a", "section": "712.11"},
+        {"id": "a-12", "source": "10cfr712", "subpart": "subpart_a", "section": "712.12"},
+        {"id": "b-31", "source": "10cfr712", "subpart": "subpart_b", "section": "712.31"},
+    ]
+
+
+def _embeddings() -> np.ndarray:
+    return np.array([[1.0, 0.0], [0.8, 0.6], [0.0, 2.0]], dtype=np.float32)
+
+
+def test_memory_index_ranks_by_cosine_similarity():
+    """Test that results are ordered by exact cosine similarity."""
+    index = MemoryIndex(_records(), _embeddings())
+
+    results = index.search([1.0, 0.0], limit=3)
+
+    assert [record["id"] for record, _ in results] == ["a-11", "a-12", "b-31"]
+    assert [round(score, 3) for _, score in results] == [1.0, 0.8, 0.0]
+
+
+def test_memory_index_applies_filters():
+    """Test that subpart and section filters restrict the candidates."""
+    index = MemoryIndex(_records(), _embeddings())
+
+    subpart_b = index.search([1.0, 0.0], subpart="subpart_b")
+    section = index.search([1.0, 0.0], subpart="subpart_a", section="712.12")
+
+    assert [record["id"] for record, _ in subpart_b] == ["b-31"]
+    assert [record["id"] for record, _ in section] == ["a-12"]
+    assert index.search([1.0, 0.0], section="712.99") == []
+
+
+def test_memory_index_rejects_mismatched_lengths():
+    """Test that records and embeddings must line up."""
+    with pytest.raises(ValueError):
+        MemoryIndex(_records(), _embeddings()[:2])
+
+
+def test_memory_index_coarse_pass_keeps_nearest(monkeypatch):
+    """Test that the binary coarse pass still returns the exact best match."""
+    from hrp_mcp.services import memory_index
+
+    monkeypatch.setattr(memory_index, "COARSE_SEARCH_THRESHOLD", 10)
+    rng = np.random.default_rng(712)
+    embeddings = rng.standard_normal((200, 384)).astype(np.float32)
+    records = [{"id": f"chunk-{i:03d}"} for i in range(200)]
+    index = MemoryIndex(records, embeddings)
+
+    results = index.search(embeddings[42] + 0.05 * rng.standard_normal(384), limit=3)
+
+    assert len(results) == 3
+    assert results[0][0]["id"] == "chunk-042"
+    assert results[0][1] > 0.99
+
+
+def test_memory_index_int8_matches_float_ranking():
+    """Test that int8 storage finds the same best match in a quarter of the memory."""
+    rng = np.random.default_rng(712)
+    embeddings = rng.standard_normal((50, 384)).astype(np.float32)
+    records = [{"id": f"chunk-{i:03d}"} for i in range(50)]
+    exact = MemoryIndex(records, embeddings)
+    quantized = MemoryIndex(records, embeddings, int8=True)
+    query = embeddings[7] + 0.1 * rng.standard_normal(384)
+
+    exact_results = exact.search(query, limit=5)
+    int8_results = quantized.search(query, limit=5)
+
+    assert quantized.nbytes * 4 == exact.nbytes
+    assert int8_results[0][0]["id"] == exact_results[0][0]["id"] == "chunk-007"
+    assert int8_results[0][1] == pytest.approx(exact_results[0][1], abs=0.02)
@@ -0,0 +1,54 @@
+"""Tests for int8 embedding quantization."""
+
+import numpy as np
+
+from hrp_mcp.services.quantization import (
+    dequantize_int8,
+    int8_cosine_scores,
+    quantize_int8,
+)
+
+
+def _random_embeddings(n: int, dim: int = 384) -> np.ndarray:
+    rng = np.random.default_rng(712)
+    return rng.standard_normal((n, dim)).astype(np.float32)
+
+
+def test_quantize_int8_produces_unit_scaled_codes():
+    """Test that codes are int8 and use the full symmetric range."""
+    codes = quantize_int8(_random_embeddings(4))
+
+    assert codes.dtype == np.int8
+    assert codes.shape == (4, 384)
+    assert np.abs(codes).max() <= 127
+
+
+def test_quantize_int8_handles_zero_vector():
+    """Test that an all-zero vector quantizes to zeros instead of NaN."""
+    codes = quantize_int8(np.zeros(8, dtype=np.float32))
+
+    assert not codes.any()
+
+
+def test_dequantize_round_trips_unit_vectors():
+    """Test that dequantized vectors are close to the normalized originals."""
+    embeddings = _random_embeddings(3)
+    unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    restored = dequantize_int8(quantize_int8(embeddings))
+
+    assert np.allclose(restored, unit, atol=0.5 / 127)
+
+
+def test_int8_cosine_scores_preserve_ranking():
+    """Test that int8 scores track float cosine similarity closely."""
+    corpus = _random_embeddings(50)
+    query = corpus[7] + 0.1 * _random_embeddings(1)[0]
+
+    unit_corpus = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    exact = unit_corpus @ (query / np.linalg.norm(query))
+    approx = int8_cosine_scores(quantize_int8(query), quantize_int8(corpus))
+
+    assert approx.dtype == np.float32
+    assert np.abs(approx - exact).max() < 0.02
+    assert int(np.argmax(approx)) == 7
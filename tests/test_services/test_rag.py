@@ -68,6 +68,8 @@ class TestRagServiceSearch:
         if results:
             assert hasattr(results[0], "score")
             assert 0 <= results[0].score <= 1
+            assert isinstance(results[0].score, float)
+            assert results[0].to_dict()["score"] == round(results[0].score, 3)
 
     @pytest.mark.asyncio
     async def test_should_respect_limit_parameter(
@@ -94,6 +96,64 @@ class TestRagServiceSearch:
 
         assert len(results) <= 2
 
+    @pytest.mark.asyncio
+    async def test_should_search_many_queries_in_order(
+        self, embedding_service, populated_vector_store, sample_hrp_chunk
+    ):
+        """Test that search_many returns one result list per query, in order."""
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+        queries = ["HRP certification requirements", "annual supervisory review"]
+
+        batched = await rag.search_many(queries, limit=3)
+
+        assert len(batched) == 2
+        for query, results in zip(queries, batched, strict=True):
+            single = await rag.search(query, limit=3)
+            assert [r.chunk.id for r in results] == [r.chunk.id for r in single]
+        assert batched[0][0].chunk.id == sample_hrp_chunk.id
+        assert await rag.search_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_should_search_ids_matching_full_search(
+        self, embedding_service, populated_vector_store, sample_hrp_chunk
+    ):
+        """Test that the ID-only search ranks the same chunks as search."""
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+
+        hits = await rag.search_ids("HRP certification requirements", limit=3)
+        full = await rag.search("HRP certification requirements", limit=3)
+
+        assert [chunk_id for chunk_id, _ in hits] == [r.chunk.id for r in full]
+        assert hits[0][0] == sample_hrp_chunk.id
+        assert (await rag.get_chunk(hits[0][0])).content == sample_hrp_chunk.content
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_embedding_for_whitespace_variants(
+        self, embedding_service, populated_vector_store, monkeypatch
+    ):
+        """Test that queries differing only in whitespace are embedded once."""
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+        embedded = []
+        original = embedding_service.embed_np
+        monkeypatch.setattr(
+            embedding_service, "embed_np", lambda text: embedded.append(text) or original(text)
+        )
+
+        first = await rag.search("HRP  certification\nrequirements ")
+        second = await rag.search("HRP certification requirements")
+
+        assert embedded == ["HRP certification requirements"] * 2
+        assert [r.chunk.id for r in first] == [r.chunk.id for r in second]
+
 
 class TestRagServiceSearchSubparts:
     """Tests for subpart-specific search methods."""
@@ -112,6 +172,22 @@ class TestRagServiceSearchSubparts:
 
         assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_search_both_matches_separate_searches(
+        self, embedding_service, populated_vector_store
+    ):
+        """Test that search_both returns the per-subpart search results."""
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+
+        results_a, results_b = await rag.search_both("certification", limit=3)
+
+        separate_a = await rag.search_subpart_a("certification", limit=3)
+        assert [r.chunk.id for r in results_a] == [r.chunk.id for r in separate_a]
+        assert results_b == []
+
 
 # --- Get Chunk Tests ---
 
@@ -140,6 +216,22 @@ class TestRagServiceGetChunk:
         assert chunk.id == sample_hrp_chunk.id
         assert chunk.section == sample_hrp_chunk.section
 
+    @pytest.mark.asyncio
+    async def test_should_rebuild_chunk_identical_to_stored(
+        self, embedding_service, populated_vector_store, sample_hrp_chunk
+    ):
+        """Test that the rebuilt chunk equals the stored one, enums included."""
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+
+        chunk = await rag.get_chunk(sample_hrp_chunk.id)
+
+        assert chunk == sample_hrp_chunk
+        assert chunk.source is SourceType.CFR_712
+        assert chunk.subpart is HRPSubpart.SUBPART_A
+
 
 # --- Get Section Tests ---
 
@@ -190,6 +282,145 @@ class TestRagServiceGetSection:
         assert len(chunks) == 3
         assert [c.chunk_index for c in chunks] == [0, 1, 2]
 
+    @pytest.mark.asyncio
+    async def test_should_share_section_string_across_chunks(self, embedding_service, vector_store):
+        """Test that rebuilt chunks of one section share an interned section string."""
+        for i in range(2):
+            chunk = RegulationChunk(
+                id=f"test:712-16:chunk-{i:03d}",
+                section="712.16",
+                title="Removal",
+                content=f"Removal content {i}",
+                citation="10 CFR 712.16",
+                chunk_index=i,
+            )
+            vector_store.add_chunk(chunk, embedding_service.embed(chunk.to_embedding_text()))
+
+        rag = RagService(embedding_service=embedding_service, vector_store=vector_store)
+        first, second = await rag.get_section("712.16")
+
+        assert first.section is second.section
+
+    @pytest.mark.asyncio
+    async def test_should_cache_section_until_store_changes(
+        self, embedding_service, populated_vector_store, sample_hrp_chunk
+    ):
+        """Test that repeat lookups are cached and writes invalidate the cache."""
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+        first = await rag.get_section("712.11")
+
+        calls = []
+        original = populated_vector_store.get_by_section
+        populated_vector_store.get_by_section = lambda s: calls.append(s) or original(s)
+
+        assert await rag.get_section("712.11") == first
+        assert calls == []
+
+        extra = sample_hrp_chunk.model_copy(
+            update={"id": "10cfr712:712-11:chunk-001", "chunk_index": 1}
+        )
+        populated_vector_store.add_chunk(extra, embedding_service.embed(extra.content))
+
+        refreshed = await rag.get_section("712.11")
+        assert calls == ["712.11"]
+        assert [c.chunk_index for c in refreshed] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_should_expire_cached_sections(
+        self, embedding_service, populated_vector_store, monkeypatch
+    ):
+        """Test that sections are re-read once the cache TTL has passed."""
+        from hrp_mcp.services import rag as rag_module
+
+        monkeypatch.setattr(rag_module, "_SECTION_CACHE_TTL_SECONDS", 0.0)
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+        rag.preload_sections(["712.11"])
+
+        calls = []
+        original = populated_vector_store.get_by_section
+        populated_vector_store.get_by_section = lambda s: calls.append(s) or original(s)
+
+        await rag.get_section("712.11")
+        await rag.get_section("712.11")
+
+        assert calls == ["712.11", "712.11"]
+
+    @pytest.mark.asyncio
+    async def test_should_see_sections_written_by_another_process(
+        self,
+        embedding_service,
+        populated_vector_store,
+        temp_chroma_path,
+        sample_hrp_chunk,
+        monkeypatch,
+    ):
+        """Test that a write through another store instance is seen after the TTL."""
+        from hrp_mcp.services import rag as rag_module
+        from hrp_mcp.services.vector_store import VectorStoreService
+
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+        assert len(await rag.get_section("712.11")) == 1
+
+        # A separate ingest run opens its own store, so this instance's
+        # generation does not change
+        ingest_store = VectorStoreService(db_path=temp_chroma_path)
+        extra = sample_hrp_chunk.model_copy(
+            update={"id": "10cfr712:712-11:chunk-001", "chunk_index": 1}
+        )
+        ingest_store.add_chunk(extra, embedding_service.embed(extra.content))
+
+        assert len(await rag.get_section("712.11")) == 1
+        monkeypatch.setattr(rag_module, "_SECTION_CACHE_TTL_SECONDS", 0.0)
+        assert [c.chunk_index for c in await rag.get_section("712.11")] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_should_get_several_sections_in_one_query(
+        self, embedding_service, populated_vector_store
+    ):
+        """Test that uncached sections are fetched together and misses omitted."""
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+
+        calls = []
+        original = populated_vector_store.get_by_sections
+        populated_vector_store.get_by_sections = lambda s: calls.append(s) or original(s)
+
+        sections = await rag.get_sections(["712.999", "712.11", "712.11"])
+
+        assert list(sections) == ["712.11"]
+        assert sections["712.11"] == await rag.get_section("712.11")
+        assert calls == [["712.999", "712.11"]]
+
+    @pytest.mark.asyncio
+    async def test_should_serve_preloaded_sections_from_cache(
+        self, embedding_service, populated_vector_store
+    ):
+        """Test that preloaded sections are not fetched again."""
+        rag = RagService(
+            embedding_service=embedding_service,
+            vector_store=populated_vector_store,
+        )
+
+        assert rag.preload_sections(["712.11", "712.999"]) == 1
+
+        calls = []
+        populated_vector_store.get_by_section = lambda s: calls.append(s) or []
+        chunks = await rag.get_section("712.11")
+
+        assert chunks[0].section == "712.11"
+        assert calls == []
+
 
 # --- Store Count Tests ---
 
@@ -1,9 +1,15 @@
 """Tests for reference data."""
 
+import pytest
+
+from hrp_mcp.resources import reference_data
 from hrp_mcp.resources.reference_data import (
+    CERTIFICATION_COMPONENTS,
+    CONTROLLED_SUBSTANCES,
     HRP_DEFINITIONS,
     HRP_POSITION_TYPES,
     HRP_SECTIONS,
+    get_all_by_section,
     get_definition,
     get_position_type,
     get_section_info,
@@ -69,3 +75,94 @@ def test_get_section_info():
     assert result is not None
     assert result["section"] == "712.11"
     assert "subpart" in result
+
+
+def test_reference_registries_are_read_only():
+    """Test that section and definition registries cannot be mutated."""
+    with pytest.raises(TypeError):
+        HRP_SECTIONS["712.99"] = {}  # type: ignore[index]
+    with pytest.raises(TypeError):
+        HRP_DEFINITIONS["hrp_candidate"]["definition"] = "changed"  # type: ignore[index]
+
+
+def test_resources_package_reexports_reference_data():
+    """Test that the resources package exports the reference data API."""
+    import hrp_mcp.resources as resources
+
+    assert resources.__all__ == reference_data.__all__
+    for name in reference_data.__all__:
+        assert getattr(resources, name) is getattr(reference_data, name)
+
+
+def test_lookups_accept_key_spellings():
+    """Test that lookups accept space, hyphen and case variants of keys."""
+    expected = get_position_type("category_i_snm")
+
+    assert get_position_type("Category I SNM") is expected
+    assert get_position_type("category-i-snm") is expected
+    assert get_position_type("  CATEGORY_I snm ") is expected
+    assert get_section_info("11") is get_section_info("712.11")
+    assert get_definition("Human Reliability Program (HRP)") is get_definition(
+        "human_reliability_program"
+    )
+
+
+def test_controlled_substances_panel():
+    """Test that the substance panel is immutable and serializes to dicts."""
+    assert isinstance(CONTROLLED_SUBSTANCES, tuple)
+    assert len(CONTROLLED_SUBSTANCES) == 8
+
+    cocaine = next(s for s in CONTROLLED_SUBSTANCES if s.substance == "Cocaine")
+    assert cocaine.to_dict() == {
+        "substance": "Cocaine",
+        "category": "Stimulant",
+        "initial_cutoff": "150 ng/mL",
+        "confirmatory_cutoff": "100 ng/mL",
+    }
+
+
+def test_registry_list_fields_are_tuples():
+    """Test that static registry sequences are tuples but serialize as lists."""
+    component = CERTIFICATION_COMPONENTS["supervisory_review"]
+
+    assert isinstance(component.key_elements, tuple)
+    assert isinstance(component.to_dict()["key_elements"], list)
+    assert isinstance(HRP_POSITION_TYPES["category_i_snm"].requirements, tuple)
+
+
+def test_get_definition_matches_words_in_any_order():
+    """Test that the fallback matches entries containing every query word."""
+    result = get_definition("program reliability")
+
+    assert result is not None
+    assert result["term"] == "Human Reliability Program (HRP)"
+
+
+@pytest.mark.parametrize(
+    "registry",
+    [
+        "CERTIFICATION_COMPONENTS",
+        "DISQUALIFYING_FACTORS",
+        "HRP_POSITION_TYPES",
+        "HRP_ROLES",
+        "MEDICAL_STANDARDS",
+    ],
+)
+def test_model_registries_are_read_only(registry):
+    """Test that model registries reject item assignment."""
+    mapping = getattr(reference_data, registry)
+
+    with pytest.raises(TypeError):
+        mapping["new_entry"] = next(iter(mapping.values()))
+
+
+def test_get_all_by_section_groups_registries():
+    """Test that entries citing a section are gathered across registries."""
+    related = get_all_by_section("712.13")
+
+    assert set(related) >= {"disqualifying_factors", "medical_standards"}
+    for entries in related.values():
+        assert all(entry.section.startswith("712.13") for entry in entries)
+    assert get_all_by_section("13") is related
+    assert len(get_all_by_section("712.10")["position_types"]) == 4
+    assert get_all_by_section("712.99") == {}
@@ -1,5 +1,7 @@
 """Tests for vector store service."""
 
+import pytest
+
 from hrp_mcp.models.regulations import HRPSubpart
 
 
@@ -57,6 +59,18 @@ def test_vector_store_delete_all(populated_vector_store):
     assert populated_vector_store.count() == 0
 
 
+def test_vector_store_accepts_chunks_after_delete_all(
+    populated_vector_store, embedding_service, sample_hrp_chunk
+):
+    """Test that the dropped collection is recreated on the next write."""
+    populated_vector_store.delete_all()
+    populated_vector_store.add_chunk(
+        sample_hrp_chunk, embedding_service.embed(sample_hrp_chunk.to_embedding_text())
+    )
+
+    assert populated_vector_store.count() == 1
+
+
 def test_vector_store_get_by_id(populated_vector_store):
     """Test getting a chunk by its ID."""
     result = populated_vector_store.get_by_id("10cfr712:712-11:chunk-000")
@@ -68,3 +82,206 @@ def test_vector_store_get_by_id_not_found(vector_store):
     """Test getting a non-existent chunk returns None."""
     result = vector_store.get_by_id("nonexistent-id")
     assert result is None
+
+
+def test_vector_store_returns_id_and_content(populated_vector_store, sample_hrp_chunk):
+    """Test that records carry ID and document text instead of a JSON copy."""
+    result = populated_vector_store.get_by_id(sample_hrp_chunk.id)
+
+    assert result["id"] == sample_hrp_chunk.id
+    assert result["content"] == sample_hrp_chunk.content
+    assert "full_json" not in result
+
+
+def test_vector_store_opens_existing_store_eagerly(temp_chroma_path):
+    """Test that an existing store is opened at construction, a new one lazily."""
+    from hrp_mcp.services.vector_store import VectorStoreService
+
+    fresh = VectorStoreService(db_path=temp_chroma_path)
+    assert fresh._collection is None
+    assert fresh.count() == 0
+
+    reopened = VectorStoreService(db_path=temp_chroma_path)
+    assert reopened._collection is not None
+
+
+def test_vector_store_reuses_where_clauses():
+    """Test that identical filter combinations share one where clause."""
+    from hrp_mcp.services.vector_store import _build_where
+
+    assert _build_where(None, None, None) is None
+    assert _build_where(None, HRPSubpart.SUBPART_A, None) == {"subpart": "subpart_a"}
+    assert _build_where(None, HRPSubpart.SUBPART_A, "712.11") is _build_where(
+        None, HRPSubpart.SUBPART_A, "712.11"
+    )
+    assert _build_where(None, HRPSubpart.SUBPART_A, "712.11") == {
+        "$and": [{"subpart": "subpart_a"}, {"section": "712.11"}]
+    }
+
+
+def test_vector_store_loads_int8_index(populated_vector_store, embedding_service):
+    """Test that an int8 in-memory index finds the same chunk as Chroma."""
+    query = embedding_service.embed("HRP certification requirements")
+    best_metadata, _ = populated_vector_store.search(query, limit=1)[0]
+
+    index = populated_vector_store.load_into_memory(int8=True)
+
+    assert len(index) == populated_vector_store.count()
+    assert populated_vector_store.search(query, limit=1)[0][0]["id"] == best_metadata["id"]
+
+
+def test_vector_store_adds_large_batches_in_slices(vector_store, monkeypatch):
+    """Test that add_chunks_batch splits input into ADD_BATCH_SIZE slices."""
+    from hrp_mcp.models.regulations import RegulationChunk
+    from hrp_mcp.services import vector_store as vector_store_module
+
+    monkeypatch.setattr(vector_store_module, "ADD_BATCH_SIZE", 2)
+    chunks = [
+        RegulationChunk(
+            id=f"test:712-11:chunk-{i:03d}",
+            section="712.11",
+            title="Certification",
+            content=f"Content {i}",
+            citation="10 CFR 712.11",
+            chunk_index=i,
+        )
+        for i in range(5)
+    ]
+
+    vector_store.add_chunks_batch(chunks, [[float(i), 1.0, 0.0] for i in range(5)])
+
+    assert vector_store.count() == 5
+    assert vector_store.generation == 3
+
+
+def test_vector_store_converts_distances_to_clipped_similarities():
+    """Test that cosine distances map to similarities clipped at zero."""
+    from hrp_mcp.services.vector_store import _similarities
+
+    assert _similarities([0.0, 0.25, 1.0, 1.5]) == [1.0, 0.75, 0.0, 0.0]
+    assert _similarities([]) == []
+
+
+def test_vector_store_subpart_search_falls_back_to_filter(vector_store, monkeypatch):
+    """Test that a rare subpart is still found when the widened query misses it."""
+    from hrp_mcp.models.regulations import RegulationChunk
+    from hrp_mcp.services import vector_store as vector_store_module
+
+    monkeypatch.setattr(vector_store_module, "_POST_FILTER_OVERSAMPLE", 2)
+    chunks = [
+        RegulationChunk(
+            id=f"test:{section}:chunk-000",
+            subpart=HRPSubpart.SUBPART_A if i < 4 else HRPSubpart.SUBPART_B,
+            section=section,
+            title="Test",
+            content=f"Content {i}",
+            citation=f"10 CFR {section}",
+        )
+        for i, section in enumerate(["712.11", "712.12", "712.13", "712.14", "712.31"])
+    ]
+    embeddings = [[1.0, 0.1 * i, 0.0] for i in range(4)] + [[0.0, 0.0, 1.0]]
+    vector_store.add_chunks_batch(chunks, embeddings)
+
+    results_b = vector_store.search([1.0, 0.0, 0.0], subpart=HRPSubpart.SUBPART_B, limit=1)
+    results_a = vector_store.search([1.0, 0.0, 0.0], subpart=HRPSubpart.SUBPART_A, limit=2)
+
+    assert [metadata["section"] for metadata, _ in results_b] == ["712.31"]
+    assert [metadata["section"] for metadata, _ in results_a] == ["712.11", "712.12"]
+
+
+def test_vector_store_serves_searches_from_memory_until_write(
+    populated_vector_store, embedding_service, sample_hrp_chunk
+):
+    """Test that the in-memory snapshot matches Chroma and is dropped on write."""
+    query = embedding_service.embed("HRP certification requirements")
+    from_chroma = populated_vector_store.search(query, limit=5)
+
+    populated_vector_store.load_into_memory()
+    from_memory = populated_vector_store.search(query, limit=5)
+
+    assert [m["id"] for m, _ in from_memory] == [m["id"] for m, _ in from_chroma]
+    assert from_memory[0][1] == pytest.approx(from_chroma[0][1], abs=1e-4)
+    assert populated_vector_store._current_memory_index() is not None
+
+    extra = sample_hrp_chunk.model_copy(update={"id": "10cfr712:712-11:chunk-001"})
+    populated_vector_store.add_chunk(extra, query)
+    assert populated_vector_store._current_memory_index() is None
+
+
+def test_vector_store_caches_count_until_write(vector_store, embedding_service, sample_hrp_chunk):
+    """Test that counts are cached per subpart and refreshed after a write."""
+    assert vector_store.count() == 0
+    assert vector_store.count(HRPSubpart.SUBPART_A) == 0
+    assert set(vector_store._count_cache) == {None, HRPSubpart.SUBPART_A}
+
+    vector_store.add_chunk(
+        sample_hrp_chunk, embedding_service.embed(sample_hrp_chunk.to_embedding_text())
+    )
+
+    assert vector_store.count() == 1
+    assert vector_store.count(HRPSubpart.SUBPART_A) == 1
+
+
+def test_vector_store_adds_batch_from_float32_array(
+    vector_store, embedding_service, sample_hrp_chunk
+):
+    """Test that add_chunks_batch accepts a 2-D float32 array directly."""
+    embeddings = embedding_service.embed_batch_np([sample_hrp_chunk.to_embedding_text()])
+
+    vector_store.add_chunks_batch([sample_hrp_chunk], embeddings)
+
+    best, score = vector_store.search(embeddings[0], limit=1)[0]
+    assert best["id"] == sample_hrp_chunk.id
+    assert score == pytest.approx(1.0, abs=1e-4)
+
+
+def test_vector_store_unfiltered_search_matches_search_many(
+    populated_vector_store, embedding_service
+):
+    """Test that the no-filter fast path returns the same rows as search_many."""
+    query = embedding_service.embed("HRP certification requirements")
+
+    assert (
+        populated_vector_store.search(query, limit=3)
+        == populated_vector_store.search_many([query], limit=3)[0]
+    )
+
+
+def test_vector_store_warm_up(vector_store, embedding_service, sample_hrp_chunk):
+    """Test that warm-up is a no-op on an empty store and runs on a populated one."""
+    vector_store.warm_up()
+
+    vector_store.add_chunk(
+        sample_hrp_chunk, embedding_service.embed(sample_hrp_chunk.to_embedding_text())
+    )
+    vector_store.warm_up()
+
+    assert vector_store.count() == 1
+
+
+def test_vector_store_get_by_sections(vector_store, embedding_service):
+    """Test that several sections are fetched together and grouped by section."""
+    from hrp_mcp.models.regulations import RegulationChunk
+
+    chunks = [
+        RegulationChunk(
+            id=f"test:{section}:chunk-{i:03d}",
+            section=section,
+            title="Test",
+            content=f"Content {section} {i}",
+            citation=f"10 CFR {section}",
+            chunk_index=i,
+        )
+        for section in ["712.22", "712.23"]
+        for i in range(2)
+    ]
+    vector_store.add_chunks_batch(
+        chunks, embedding_service.embed_batch([c.content for c in chunks])
+    )
+
+    by_section = vector_store.get_by_sections(["712.22", "712.23", "712.99"])
+
+    assert set(by_section) == {"712.22", "712.23"}
+    assert all(len(records) == 2 for records in by_section.values())
+    assert vector_store.get_by_sections(["712.22"])["712.22"][0]["section"] == "712.22"
+    assert vector_store.get_by_sections([]) == {}
@@ -4,40 +4,49 @@ Tests cover the business logic for HRP certification requirements,
 disqualifying factors, and position types.
 """
 
+import pytest
+
+from hrp_mcp._matcher import normalize_description
 from hrp_mcp.tools.certification import (
     FACTOR_MATCHERS,
     HALLUCINOGEN_KEYWORDS,
     _build_disqualifying_response,
     _check_hallucinogen_factors,
     _check_standard_factors,
-    _contains_any,
+    _evaluate_factors,
+    _matched_keywords,
+    _merge_matches,
 )
 
 # --- Helper Function Tests ---
 
 
-class TestContainsAny:
-    """Tests for _contains_any helper function."""
+class TestMatchedKeywords:
+    """Tests for the single-scan _matched_keywords helper."""
 
-    def test_should_return_true_when_keyword_present(self):
+    def test_should_return_keyword_when_present(self):
         """Test that matching keyword is found."""
-        assert _contains_any("marijuana use", ("marijuana", "cocaine")) is True
+        assert "marijuana" in _matched_keywords("marijuana use")
 
-    def test_should_return_false_when_no_keywords_present(self):
-        """Test that non-matching text returns False."""
-        assert _contains_any("clean record", ("marijuana", "cocaine")) is False
+    def test_should_return_empty_when_no_keywords_present(self):
+        """Test that non-matching text returns no keywords."""
+        assert _matched_keywords("clean record") == frozenset()
 
-    def test_should_return_true_for_partial_match(self):
+    def test_should_match_partial_words(self):
         """Test that partial word matches work (substring)."""
-        assert _contains_any("hallucinogenic drugs", ("hallucinogen",)) is True
+        assert {"hallucinogen", "drug"} <= _matched_keywords("hallucinogenic drugs")
+
+    def test_should_report_keywords_sharing_a_start(self):
+        """Test that a keyword and its prefix at the same position are both found."""
+        assert {"alcohol", "alcoholism"} <= _matched_keywords("history of alcoholism")
+
+    def test_should_report_overlapping_keywords(self):
+        """Test that keywords overlapping each other are all found."""
+        assert {"positive test", "security"} <= _matched_keywords("positive testsecurity")
 
     def test_should_handle_empty_text(self):
         """Test empty input text."""
-        assert _contains_any("", ("marijuana",)) is False
-
-    def test_should_handle_empty_keywords(self):
-        """Test empty keywords tuple."""
-        assert _contains_any("marijuana", ()) is False
+        assert _matched_keywords("") == frozenset()
 
 
 class TestCheckHallucinogenFactors:
@@ -63,6 +72,15 @@ class TestCheckHallucinogenFactors:
         # Should not match the time-based rule (no "X year" where X < 5)
         assert len(results) == 0
 
+    def test_should_not_read_longer_year_counts_as_recent(self):
+        """Test that "15 years" and "11 years" are not taken for 5 and 1 years."""
+        for text in ["lsd use 15 years ago", "peyote 11 years ago"]:
+            assert _check_hallucinogen_factors(text) == (), text
+
+    def test_should_accept_year_count_without_space(self):
+        """Test that "3years" is still read as within 5 years."""
+        assert len(_check_hallucinogen_factors("psilocybin 3years ago")) == 1
+
     def test_should_return_empty_for_non_hallucinogen(self):
         """Test that non-hallucinogen substances don't trigger hallucinogen checks."""
         results = _check_hallucinogen_factors("marijuana use last month")
@@ -82,9 +100,9 @@ class TestCheckStandardFactors:
         """Test detection of drug-related factors."""
         results = _check_standard_factors("positive drug test for cocaine")
         assert len(results) >= 1
-        factor_ids = [f.name for f, _ in results]
+        factor_ids = [fid for fid, _ in results]
         # Should find drug_test_positive based on keywords
-        assert any("drug" in fid.lower() or "positive" in fid.lower() for fid in factor_ids)
+        assert "drug_test_positive" in factor_ids
 
     def test_should_detect_alcohol_disorder_with_secondary_keyword(self):
         """Test that alcohol disorder requires secondary keywords."""
@@ -93,9 +111,10 @@ class TestCheckStandardFactors:
         results_disorder = _check_standard_factors("alcohol use disorder diagnosis")
 
         # Disorder result should have more matches (includes disorder-specific)
-        simple_ids = {f.name for f, _ in results_simple}
-        disorder_ids = {f.name for f, _ in results_disorder}
+        simple_ids = {fid for fid, _ in results_simple}
+        disorder_ids = {fid for fid, _ in results_disorder}
         assert len(disorder_ids) >= len(simple_ids)
+        assert "alcohol_use_disorder" in disorder_ids - simple_ids
 
     def test_should_detect_mental_health_conditions(self):
         """Test detection of mental health conditions."""
@@ -115,6 +134,42 @@ class TestCheckStandardFactors:
         assert len(results) == 0
 
 
+class TestEvaluateFactors:
+    """Tests for the cached evaluation of both factor checks."""
+
+    def test_should_combine_both_checks(self):
+        """Test that hallucinogen and standard matches are both returned."""
+        text = "lsd use 2 years ago and a positive drug test"
+        expected = _check_hallucinogen_factors(text) + _check_standard_factors(text)
+
+        assert _evaluate_factors(text) == expected
+
+    def test_should_merge_repeated_factor_ids(self):
+        """Test that a factor reported twice appears once, absolute if either is."""
+        merged = _merge_matches(
+            [
+                ("drug_test_positive", False),
+                ("security_concern", False),
+                ("drug_test_positive", True),
+            ]
+        )
+
+        assert merged == (("drug_test_positive", True), ("security_concern", False))
+
+    def test_should_reuse_cached_evaluation(self):
+        """Test that a repeated description is served from the cache."""
+        first = _evaluate_factors("diagnosed with depression")
+
+        assert _evaluate_factors("diagnosed with depression") is first
+
+    def test_should_normalize_case_and_whitespace(self):
+        """Test that spelling variants share one normalized key."""
+        assert normalize_description("  Positive\n  TEST  ") == "positive test"
+        assert _evaluate_factors(normalize_description("Positive\ntest")) == _evaluate_factors(
+            "positive test"
+        )
+
+
 class TestBuildDisqualifyingResponse:
     """Tests for response building."""
 
@@ -128,17 +183,26 @@ class TestBuildDisqualifyingResponse:
         assert "No specific disqualifying factors" in response["guidance"]
 
     def test_should_include_guidance_for_matching_factors(self):
-        """Test response includes guidance when factors match."""
-        mock_factors = [{"name": "Test Factor", "evaluation_guidance": "Evaluate carefully"}]
-        response = _build_disqualifying_response("test condition", mock_factors, False)
+        """Test response includes factor details and guidance when factors match."""
+        response = _build_disqualifying_response("test condition", ["drug_test_positive"], False)
 
         assert len(response["matching_factors"]) == 1
-        assert "Test Factor" in response["guidance"]
+        name = response["matching_factors"][0]["name"]
+        assert response["guidance"].startswith(f"{name}: ")
+
+    def test_should_join_guidance_lines_in_order(self):
+        """Test that guidance has one line per factor, in match order."""
+        factor_ids = ["mental_health_condition", "security_concern"]
+        response = _build_disqualifying_response("test", factor_ids, False)
+
+        lines = response["guidance"].split("\n")
+        assert [m["name"] for m in response["matching_factors"]] == [
+            line.split(": ", 1)[0] for line in lines
+        ]
 
     def test_should_indicate_absolute_disqualifier(self):
         """Test that absolute disqualifier flag is set correctly."""
-        mock_factors = [{"name": "Hallucinogen Use", "evaluation_guidance": ""}]
-        response = _build_disqualifying_response("lsd use", mock_factors, True)
+        response = _build_disqualifying_response("lsd use", ["hallucinogen_use"], True)
 
         assert response["is_absolute_disqualifier"] is True
         assert "Immediate consultation" in response["recommendation"]
@@ -168,11 +232,9 @@ class TestDisqualifyingFactorWorkflow:
         all_matches = _check_hallucinogen_factors(factor_lower) + _check_standard_factors(
             factor_lower
         )
-        matching_factors = [factor.to_dict() for factor, _ in all_matches]
+        factor_ids = [fid for fid, _ in all_matches]
         is_absolute = any(is_abs for _, is_abs in all_matches)
-        result = _build_disqualifying_response(
-            "used LSD 3 years ago", matching_factors, is_absolute
-        )
+        result = _build_disqualifying_response("used LSD 3 years ago", factor_ids, is_absolute)
 
         assert result["is_absolute_disqualifier"] is True
         assert len(result["matching_factors"]) >= 1
@@ -184,9 +246,9 @@ class TestDisqualifyingFactorWorkflow:
         all_matches = _check_hallucinogen_factors(factor_lower) + _check_standard_factors(
             factor_lower
         )
-        matching_factors = [factor.to_dict() for factor, _ in all_matches]
+        factor_ids = [fid for fid, _ in all_matches]
         is_absolute = any(is_abs for _, is_abs in all_matches)
-        result = _build_disqualifying_response(factor_lower, matching_factors, is_absolute)
+        result = _build_disqualifying_response(factor_lower, factor_ids, is_absolute)
 
         assert len(result["matching_factors"]) >= 1
         assert result["is_absolute_disqualifier"] is False  # Drug test is not absolute
@@ -198,9 +260,9 @@ class TestDisqualifyingFactorWorkflow:
         all_matches = _check_hallucinogen_factors(factor_lower) + _check_standard_factors(
             factor_lower
         )
-        matching_factors = [factor.to_dict() for factor, _ in all_matches]
+        factor_ids = [fid for fid, _ in all_matches]
         is_absolute = any(is_abs for _, is_abs in all_matches)
-        result = _build_disqualifying_response(factor_lower, matching_factors, is_absolute)
+        result = _build_disqualifying_response(factor_lower, factor_ids, is_absolute)
 
         assert len(result["matching_factors"]) >= 1
         assert result["is_absolute_disqualifier"] is False
@@ -212,9 +274,9 @@ class TestDisqualifyingFactorWorkflow:
         all_matches = _check_hallucinogen_factors(factor_lower) + _check_standard_factors(
             factor_lower
         )
-        matching_factors = [factor.to_dict() for factor, _ in all_matches]
+        factor_ids = [fid for fid, _ in all_matches]
         is_absolute = any(is_abs for _, is_abs in all_matches)
-        result = _build_disqualifying_response(factor_lower, matching_factors, is_absolute)
+        result = _build_disqualifying_response(factor_lower, factor_ids, is_absolute)
 
         assert result["matching_factors"] == []
         assert result["is_absolute_disqualifier"] is False
@@ -226,10 +288,10 @@ class TestDisqualifyingFactorWorkflow:
         all_matches = _check_hallucinogen_factors(factor_lower) + _check_standard_factors(
             factor_lower
         )
-        matching_factors = [factor.to_dict() for factor, _ in all_matches]
+        factor_ids = [fid for fid, _ in all_matches]
 
         # Should find multiple factors
-        assert len(matching_factors) >= 2
+        assert len(factor_ids) >= 2
 
     def test_should_be_case_insensitive(self):
         """Test that matching is case-insensitive."""
@@ -247,8 +309,8 @@ class TestDisqualifyingFactorWorkflow:
         all_matches = _check_hallucinogen_factors(factor_lower) + _check_standard_factors(
             factor_lower
         )
-        matching_factors = [factor.to_dict() for factor, _ in all_matches]
-        result = _build_disqualifying_response("", matching_factors, False)
+        factor_ids = [fid for fid, _ in all_matches]
+        result = _build_disqualifying_response("", factor_ids, False)
 
         assert result["matching_factors"] == []
         assert "factor_description" in result
@@ -282,6 +344,14 @@ class TestFactorMatcherConfiguration:
         for matcher in FACTOR_MATCHERS:
             assert len(matcher.keywords) > 0, f"{matcher.factor_id} has no keywords"
 
+    def test_should_use_frozen_slotted_matchers(self):
+        """Test that matchers are read-only and carry no instance dict."""
+        matcher = FACTOR_MATCHERS[0]
+
+        assert not hasattr(matcher, "__dict__")
+        with pytest.raises(AttributeError):
+            matcher.is_absolute = True  # type: ignore[misc]
+
     def test_hallucinogen_keywords_should_be_defined(self):
         """Test that hallucinogen keywords are properly defined."""
         assert len(HALLUCINOGEN_KEYWORDS) >= 5
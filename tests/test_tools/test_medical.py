@@ -4,36 +4,37 @@ Tests cover the business logic for HRP medical standards evaluation,
 condition checking, and physician role information.
 """
 
+import pytest
+
+from hrp_mcp._matcher import normalize_description
 from hrp_mcp.tools.medical import (
+    _STANDARDS_BY_CATEGORY,
     CONDITION_MATCHERS,
     DEFAULT_CONSIDERATIONS,
     EVALUATION_PROCESS,
     _build_medical_condition_response,
-    _contains_any,
+    _evaluate_condition,
     _find_matching_standards,
+    _matched_keywords,
 )
 
 # --- Helper Function Tests ---
 
 
-class TestContainsAny:
-    """Tests for _contains_any helper function."""
+class TestMatchedKeywords:
+    """Tests for the single-scan _matched_keywords helper."""
 
-    def test_should_return_true_when_keyword_present(self):
+    def test_should_return_keyword_when_present(self):
         """Test that matching keyword is found."""
-        assert _contains_any("hypertension diagnosis", ("hypertension", "diabetes")) is True
+        assert _matched_keywords("hypertension diagnosis") == {"hypertension"}
 
-    def test_should_return_false_when_no_keywords_present(self):
-        """Test that non-matching text returns False."""
-        assert _contains_any("healthy individual", ("hypertension", "diabetes")) is False
+    def test_should_return_empty_when_no_keywords_present(self):
+        """Test that non-matching text returns no keywords."""
+        assert _matched_keywords("healthy individual") == frozenset()
 
     def test_should_handle_empty_text(self):
         """Test empty input text."""
-        assert _contains_any("", ("depression",)) is False
-
-    def test_should_handle_empty_keywords(self):
-        """Test empty keywords tuple."""
-        assert _contains_any("depression", ()) is False
+        assert _matched_keywords("") == frozenset()
 
 
 class TestFindMatchingStandards:
@@ -70,6 +71,25 @@ class TestFindMatchingStandards:
         # Should still have at least general medical standard
         assert len(standards) >= 1
 
+    def test_should_order_standards_like_condition_matchers(self):
+        """Test that matched standards follow CONDITION_MATCHERS order, then general."""
+        standards, _ = _find_matching_standards("alcohol use and depression with back injury")
+
+        assert [s["name"] for s in standards] == [
+            "Psychological Evaluation Requirements",
+            "Physical Examination Requirements",
+            "Substance Use Standards",
+            "General Medical Standards",
+        ]
+
+    def test_should_share_considerations_for_same_matches(self):
+        """Test that identical matches reuse one considerations tuple."""
+        _, first = _find_matching_standards("depression")
+        _, second = _find_matching_standards("anxiety and ptsd")
+
+        assert isinstance(first, tuple)
+        assert second is first
+
     def test_should_not_duplicate_standards(self):
         """Test that standards are not duplicated."""
         standards, _ = _find_matching_standards("depression and anxiety")
@@ -79,6 +99,28 @@ class TestFindMatchingStandards:
         assert len(standard_names) == len(set(standard_names))
 
 
+class TestEvaluateCondition:
+    """Tests for the cached condition evaluation."""
+
+    def test_should_match_uncached_evaluation(self):
+        """Test that cached results equal _find_matching_standards."""
+        standards, considerations = _find_matching_standards("type 2 diabetes")
+
+        assert _evaluate_condition("type 2 diabetes") == (tuple(standards), considerations)
+
+    def test_should_reuse_cached_evaluation(self):
+        """Test that a repeated condition is served from the cache."""
+        first = _evaluate_condition("controlled hypertension")
+
+        assert _evaluate_condition("controlled hypertension") is first
+
+    def test_should_share_entry_for_whitespace_and_case_variants(self):
+        """Test that normalized variants of one condition hit the same entry."""
+        first = _evaluate_condition(normalize_description("Type 2  Diabetes"))
+
+        assert _evaluate_condition(normalize_description(" type 2 diabetes\n")) is first
+
+
 class TestBuildMedicalConditionResponse:
     """Tests for response building."""
 
@@ -213,6 +255,15 @@ class TestConditionMatcherConfiguration:
         for matcher in CONDITION_MATCHERS:
             assert len(matcher.keywords) > 0, f"{matcher.standard_id} has no keywords"
 
+    def test_should_use_frozen_slotted_matchers(self):
+        """Test that matchers are read-only and carry no instance dict."""
+        matcher = CONDITION_MATCHERS[0]
+
+        assert not hasattr(matcher, "__dict__")
+        assert isinstance(matcher.considerations, tuple)
+        with pytest.raises(AttributeError):
+            matcher.standard_id = "other"  # type: ignore[misc]
+
     def test_should_have_considerations_for_each_matcher(self):
         """Test that each matcher has considerations."""
         for matcher in CONDITION_MATCHERS:
@@ -243,3 +294,15 @@ class TestMedicalToolsEdgeCases:
 
         # Should still get general medical standard
         assert len(result["relevant_standards"]) >= 1
+
+
+class TestToolResponses:
+    """Tests for responses built from precomputed reference data."""
+
+    def test_should_bucket_standards_by_category_and_key_fragment(self):
+        """Test that category filters resolve to the same standards as a key scan."""
+        assert [s["name"] for s in _STANDARDS_BY_CATEGORY["psychological"]] == [
+            "Psychological Evaluation Requirements"
+        ]
+        assert _STANDARDS_BY_CATEGORY["substance"] == _STANDARDS_BY_CATEGORY["substance_use"]
+        assert "cardiac" not in _STANDARDS_BY_CATEGORY
@@ -0,0 +1,26 @@
+"""Tests for procedural tools.
+
+Tests cover the precomputed responses for HRP removal, reinstatement,
+appeals, and certification component procedures.
+"""
+
+from hrp_mcp.tools.procedures import (
+    _APPEAL_PROCESS,
+    _HRP_ROLES,
+)
+
+
+class TestToolResponses:
+    """Tests for responses built from precomputed reference data."""
+
+    def test_should_list_appeal_stages_in_order(self):
+        """Test that appeal stages run from reconsideration to Secretary review."""
+        sections = [stage["section"] for stage in _APPEAL_PROCESS["stages"]]
+
+        assert sections == ["712.22", "712.23", "712.24", "712.25"]
+
+    def test_should_include_every_hrp_role(self):
+        """Test that the roles response lists each role from the reference data."""
+        from hrp_mcp.resources.reference_data import HRP_ROLES
+
+        assert len(_HRP_ROLES["roles"]) == len(HRP_ROLES)
@@ -4,12 +4,74 @@ Tests cover the business logic for searching and retrieving
 10 CFR Part 712 regulations.
 """
 
+import asyncio
+
+import pytest
+
+from hrp_mcp.models.errors import SectionNotFoundError
+from hrp_mcp.models.regulations import HRPSubpart, RegulationChunk, SearchResult
+from hrp_mcp.tools import regulations
 from hrp_mcp.tools.regulations import (
+    _SUBPART_RESPONSES,
     SectionData,
     _build_section_response,
+    _citation,
+    _fetch_section_from_rag,
+    _fetch_sections_from_rag,
     _get_fallback_section_data,
+    _normalize_section_number,
+    _parse_subpart,
+    _search_regulations,
+    _section_sort_key,
+    _term_suggestions,
+    invalidate_search_cache,
+    invalidate_section_cache,
 )
 
+
+class _SlowRagService:
+    """Stand-in RAG service that counts section lookups."""
+
+    def __init__(self, missing: bool = False, error: Exception | None = None) -> None:
+        self.calls = 0
+        self._missing = missing
+        self._error = error
+
+    async def get_section(self, section: str) -> list[RegulationChunk]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self._error is not None:
+            raise self._error
+        if self._missing:
+            raise SectionNotFoundError(section)
+        return [_chunk(section)]
+
+    async def get_sections(self, sections: list[str]) -> dict[str, list[RegulationChunk]]:
+        self.calls += 1
+        if self._error is not None:
+            raise self._error
+        return {section: [_chunk(section)] for section in sections if section != "712.99"}
+
+    async def search(
+        self, query: str, subpart: HRPSubpart | None = None, limit: int = 10
+    ) -> list[SearchResult]:
+        self.calls += 1
+        if self._error is not None:
+            raise self._error
+        return [SearchResult(chunk=_chunk("712.11"), score=0.9)]
+
+
+def _chunk(section: str) -> RegulationChunk:
+    return RegulationChunk(
+        id=f"10cfr712:{section}:chunk-000",
+        subpart=HRPSubpart.SUBPART_A,
+        section=section,
+        title="Test Title",
+        content="Test content",
+        citation=f"10 CFR {section}",
+    )
+
+
 # --- Helper Function Tests ---
 
 
@@ -90,6 +152,284 @@ class TestBuildSectionResponse:
         assert response["title"] != "" or response["title"] == ""  # May or may not have fallback
 
 
+class TestFetchSectionFromRag:
+    """Tests for shared and cached section lookups."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_section_cache(self):
+        invalidate_section_cache()
+        yield
+        invalidate_section_cache()
+
+    async def test_should_share_concurrent_lookups_of_one_section(self, monkeypatch):
+        """Test that concurrent requests for a section query the RAG service once."""
+        rag = _SlowRagService()
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        first, second = await asyncio.gather(
+            _fetch_section_from_rag("712.11"), _fetch_section_from_rag("712.11")
+        )
+
+        assert rag.calls == 1
+        assert first is second
+        assert first is not None and first.title == "Test Title"
+        assert regulations._inflight_sections == {}
+
+    async def test_should_serve_repeat_lookups_from_cache_until_invalidated(self, monkeypatch):
+        """Test that a finished lookup is reused until the cache is invalidated."""
+        rag = _SlowRagService()
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        first = await _fetch_section_from_rag("712.11")
+        second = await _fetch_section_from_rag("712.11")
+        assert rag.calls == 1
+        assert first is second
+
+        invalidate_section_cache()
+        await _fetch_section_from_rag("712.11")
+        assert rag.calls == 2
+
+    async def test_should_expire_cached_lookups(self, monkeypatch):
+        """Test that lookups older than the TTL are repeated."""
+        rag = _SlowRagService()
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+        monkeypatch.setattr(regulations, "_SECTION_CACHE_TTL_SECONDS", 0.0)
+
+        await _fetch_section_from_rag("712.11")
+        await _fetch_section_from_rag("712.11")
+
+        assert rag.calls == 2
+
+    async def test_should_cache_missing_sections(self, monkeypatch):
+        """Test that a section not in the vector store is not looked up again."""
+        rag = _SlowRagService(missing=True)
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        assert await _fetch_section_from_rag("712.99") is None
+        assert await _fetch_section_from_rag("712.99") is None
+        assert rag.calls == 1
+
+    async def test_should_expire_missing_sections_sooner(self, monkeypatch):
+        """Test that a section ingested after a miss is found before the full TTL."""
+        rag = _SlowRagService(missing=True)
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+        monkeypatch.setattr(regulations, "_MISSING_SECTION_CACHE_TTL_SECONDS", 0.0)
+
+        assert await _fetch_section_from_rag("712.11") is None
+        rag._missing = False
+        data = await _fetch_section_from_rag("712.11")
+
+        assert data is not None and data.content == "Test content"
+        assert rag.calls == 2
+
+    async def test_should_not_cache_failed_lookups(self, monkeypatch):
+        """Test that a failing RAG service yields None and is retried next time."""
+        rag = _SlowRagService(error=RuntimeError("store unavailable"))
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        assert await _fetch_section_from_rag("712.11") is None
+        assert await _fetch_section_from_rag("712.11") is None
+        assert rag.calls == 2
+
+    async def test_should_log_failed_lookups_after_callers_cancel(self, monkeypatch, caplog):
+        """Test that a lookup failing after its only caller was cancelled is logged."""
+        rag = _SlowRagService(error=RuntimeError("store unavailable"))
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        caller = asyncio.create_task(_fetch_section_from_rag("712.11"))
+        await asyncio.sleep(0)
+        lookup = regulations._inflight_sections["712.11"]
+        caller.cancel()
+        await asyncio.wait([lookup])
+        await asyncio.sleep(0)
+
+        assert "Section lookup failed for 712.11: store unavailable" in caplog.text
+        assert regulations._inflight_sections == {}
+
+
+class TestFetchSectionsFromRag:
+    """Tests for fetching several sections at once."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_section_cache(self):
+        invalidate_section_cache()
+        yield
+        invalidate_section_cache()
+
+    async def test_should_load_uncached_sections_in_one_call(self, monkeypatch):
+        """Test that uncached sections share one lookup and cached ones are reused."""
+        rag = _SlowRagService()
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+        await _fetch_section_from_rag("712.22")
+
+        found = await _fetch_sections_from_rag(["712.22", "712.23", "712.99"])
+
+        assert rag.calls == 2
+        assert found["712.22"] is not None and found["712.23"] is not None
+        assert found["712.99"] is None
+
+        await _fetch_sections_from_rag(["712.23", "712.99"])
+        assert rag.calls == 2
+
+    async def test_should_return_none_for_every_section_on_failure(self, monkeypatch):
+        """Test that a failing RAG service leaves sections to the fallback data."""
+        rag = _SlowRagService(error=RuntimeError("store unavailable"))
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        assert await _fetch_sections_from_rag(["712.22", "712.23"]) == {
+            "712.22": None,
+            "712.23": None,
+        }
+
+
+class TestSearchRegulations:
+    """Tests for cached regulation searches."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_search_cache(self):
+        invalidate_search_cache()
+        yield
+        invalidate_search_cache()
+
+    async def test_should_serve_repeat_searches_from_cache(self, monkeypatch):
+        """Test that whitespace variants of a search query the RAG service once."""
+        rag = _SlowRagService()
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        first = await _search_regulations("drug testing", None, 10)
+        second = await _search_regulations("  drug   testing ", None, 10)
+
+        assert rag.calls == 1
+        assert first == second
+        assert first[0]["citation"] == "10 CFR 712.11"
+
+    async def test_should_not_share_cached_results(self, monkeypatch):
+        """Test that editing a returned result leaves the cached entry unchanged."""
+        rag = _SlowRagService()
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        first = await _search_regulations("drug testing", None, 10)
+        first[0]["citation"] = "HACKED"
+        first.clear()
+        second = await _search_regulations("drug testing", None, 10)
+
+        assert rag.calls == 1
+        assert second[0]["citation"] == "10 CFR 712.11"
+
+    async def test_should_key_cache_on_filters(self, monkeypatch):
+        """Test that a different subpart or limit is searched separately."""
+        rag = _SlowRagService()
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        await _search_regulations("appeal", None, 10)
+        await _search_regulations("appeal", HRPSubpart.SUBPART_A, 10)
+        await _search_regulations("appeal", None, 5)
+
+        assert rag.calls == 3
+
+    async def test_should_expire_cached_searches(self, monkeypatch):
+        """Test that searches older than the TTL are repeated."""
+        rag = _SlowRagService()
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+        monkeypatch.setattr(regulations, "_SEARCH_CACHE_TTL_SECONDS", 0.0)
+
+        await _search_regulations("appeal", None, 10)
+        await _search_regulations("appeal", None, 10)
+
+        assert rag.calls == 2
+
+    async def test_should_not_cache_failed_searches(self, monkeypatch):
+        """Test that a search error propagates and is retried next time."""
+        rag = _SlowRagService(error=RuntimeError("store unavailable"))
+        monkeypatch.setattr(regulations, "get_rag_service", lambda: rag)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await _search_regulations("appeal", None, 10)
+
+        assert rag.calls == 2
+
+
+class TestTermSuggestions:
+    """Tests for explain_term suggestions."""
+
+    def test_should_suggest_terms_containing_the_input(self):
+        """Test that suggestions come from definition keys and names."""
+        suggestions = _term_suggestions("official")
+
+        assert 0 < len(suggestions) <= 5
+        assert all("official" in s.lower() for s in suggestions)
+
+    def test_should_return_no_suggestions_for_unrelated_input(self):
+        """Test that an unrelated term yields no suggestions."""
+        assert _term_suggestions("photosynthesis") == ()
+
+
+class TestCitation:
+    """Tests for CFR citation strings."""
+
+    def test_should_reuse_citations_of_known_sections(self):
+        """Test that known sections share one precomputed citation string."""
+        assert _citation("712.11") == "10 CFR 712.11"
+        assert _citation("712.11") is _citation("712.11")
+
+    def test_should_format_unknown_sections(self):
+        """Test that sections outside the reference data still get a citation."""
+        assert _citation("712.99") == "10 CFR 712.99"
+
+
+class TestNormalizeSectionNumber:
+    """Tests for section number normalization."""
+
+    def test_should_add_prefix_to_bare_numbers(self):
+        """Test short, prefixed and padded spellings of one section."""
+        for spelling in ["11", "712.11", " 712.11 ", "\t11\n"]:
+            assert _normalize_section_number(spelling) == "712.11", spelling
+
+    def test_should_keep_other_forms_with_prefix(self):
+        """Test that paragraph references keep their text and gain the prefix."""
+        assert _normalize_section_number("712.3(c)") == "712.3(c)"
+        assert _normalize_section_number(" 3(c) ") == "712.3(c)"
+
+
+class TestParseSubpart:
+    """Tests for subpart alias resolution."""
+
+    def test_should_resolve_common_spellings(self):
+        """Test letters, ids and names in any case, with or without padding."""
+        for spelling in ["A", "a", "subpart_a", "Subpart A", " SUBPART_A ", "sUbPaRt a"]:
+            assert _parse_subpart(spelling) is HRPSubpart.SUBPART_A, spelling
+        assert _parse_subpart("b") is HRPSubpart.SUBPART_B
+
+    def test_should_return_none_for_unknown_subpart(self):
+        """Test that unrecognized input resolves to no subpart."""
+        assert _parse_subpart("C") is None
+        assert _parse_subpart("") is None
+
+
+class TestSubpartResponses:
+    """Tests for the subpart responses built at import."""
+
+    def test_should_list_sections_in_numeric_order(self):
+        """Test that sections sort numerically, so 712.9 precedes 712.10."""
+        for response in _SUBPART_RESPONSES.values():
+            numbers = [float(s["section"].removeprefix("712.")) for s in response["sections"]]
+            assert numbers == sorted(numbers)
+            assert response["section_count"] == len(response["sections"])
+
+    def test_should_compare_section_numbers_as_integers(self):
+        """Test the section sort key on numbers whose string order differs."""
+        assert _section_sort_key("712.2") < _section_sort_key("712.10")
+        assert _section_sort_key("712.38") == (712, 38)
+
+    def test_should_keep_sections_in_their_subpart(self):
+        """Test that Subpart B lists only the medical standards sections."""
+        sections = [s["section"] for s in _SUBPART_RESPONSES[HRPSubpart.SUBPART_B]["sections"]]
+
+        assert sections
+        assert all(section.startswith("712.3") for section in sections)
+
+
 # --- Business Logic Integration Tests ---
 
 